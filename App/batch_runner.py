@@ -0,0 +1,191 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import bisection_generator
+import false_position
+import newton
+import secant
+from excel_export import create_workbook
+from expression import compile_equation
+
+# วิธี -> (โมดูล, ชื่อพารามิเตอร์ของ solve/write_sheet ตามลำดับ)
+METHODS = {
+    "bisection": (bisection_generator, ("equation", "a", "b", "tolerance")),
+    "false_position": (false_position, ("equation", "a", "b", "tolerance", "mode")),
+    "newton": (newton, ("equation", "derivative", "x0", "tolerance")),
+    "secant": (secant, ("equation", "x0", "x1", "tolerance")),
+}
+NUMBER_FIELDS = ("a", "b", "x0", "x1", "tolerance")
+OPTIONAL_FIELDS = ("tolerance", "mode", "derivative")
+BRACKET_METHODS = ("bisection", "false_position")
+SHEET_TITLE_MAX = 31
+
+
+def load_jobs(path):
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        if isinstance(data, dict):
+            data = data.get("jobs", [])
+        if not isinstance(data, list):
+            raise ValueError(f"ไฟล์ {path} ต้องเป็น list ของงาน หรือ {{\"jobs\": [...]}}")
+        return data
+    with open(path, newline='', encoding='utf-8') as fh:
+        # ช่องว่างใน CSV ถือว่าไม่ได้ระบุ (ใช้ค่า default)
+        return [{k: v for k, v in row.items() if v not in (None, '')} for row in csv.DictReader(fh)]
+
+
+def prepare_job(index, raw, output_dir):
+    method = raw.get("method")
+    if method not in METHODS:
+        raise ValueError(f"ไม่รู้จักวิธี '{method}' (เลือกได้: {', '.join(METHODS)})")
+    module, fields = METHODS[method]
+
+    job = {"method": method, "name": str(raw.get("name") or f"{method}_{index + 1}")}
+    for field in fields:
+        value = raw.get(field)
+        if value is None:
+            if field not in OPTIONAL_FIELDS:
+                raise ValueError(f"วิธี {method} ต้องระบุ '{field}'")
+            # derivative ที่ไม่ระบุ จะคำนวณใน worker
+            value = getattr(module, field.upper(), None) if field != "derivative" else None
+        elif field in NUMBER_FIELDS:
+            value = float(value)
+        job[field] = value
+
+    # ตรวจสมการก่อนส่งเข้า worker เพราะ evaluate_func ของแต่ละวิธีคืน 0 เมื่อคำนวณไม่ได้
+    func = compile_equation(str(job["equation"]))
+    if job.get("derivative") is not None:
+        compile_equation(str(job["derivative"]))
+    if method == "false_position" and job["mode"] not in false_position.MODES:
+        raise ValueError(f"ไม่รู้จักรูปแบบ '{job['mode']}' (เลือกได้: {', '.join(false_position.MODES)})")
+    if method in BRACKET_METHODS:
+        try:
+            fa, fb = func(job["a"]), func(job["b"])
+        except (ArithmeticError, ValueError) as e:
+            raise ValueError(f"คำนวณ f(a), f(b) ไม่ได้: {e}") from e
+        if not fa * fb < 0:
+            raise ValueError(f"ต้องมี f(a)*f(b) < 0 (f({job['a']:g}) = {fa:g}, f({job['b']:g}) = {fb:g})")
+
+    job["decimals"] = int(raw["decimals"]) if raw.get("decimals") not in (None, '') else module.DECIMALS
+    job["output"] = os.path.join(output_dir, raw.get("output") or f"{job['name']}.xlsx")
+    return job
+
+
+def solve_job(job):
+    module, fields = METHODS[job["method"]]
+    inputs = {field: job[field] for field in fields}
+    if job["method"] == "newton" and inputs["derivative"] is None:
+        inputs["derivative"] = newton.differentiate(inputs["equation"])
+    return module.solve(**inputs), inputs
+
+
+def run_job(job, shared):
+    # ทำงานใน worker ที่ import โมดูลทั้งหมดไว้แล้ว: แก้สมการ แล้วเขียนไฟล์ (หรือส่ง trace กลับไปเขียนรวม)
+    start = time.perf_counter()
+    trace, inputs = solve_job(job)
+    if shared:
+        return trace, inputs, time.perf_counter() - start
+
+    wb = create_workbook()
+    METHODS[job["method"]][0].write_sheet(wb, trace, decimals=job["decimals"], **inputs)
+    wb.save(job["output"])
+    return len(trace), None, time.perf_counter() - start
+
+
+def sheet_title(name, used):
+    title = re.sub(r'[\[\]:*?/\\]', '_', name)[:SHEET_TITLE_MAX] or "Sheet"
+    base, k = title, 2
+    while title.lower() in used:
+        suffix = f"_{k}"
+        title = base[:SHEET_TITLE_MAX - len(suffix)] + suffix
+        k += 1
+    used.add(title.lower())
+    return title
+
+
+def run_batch(raw_jobs, workers=None, output_dir=".", shared=None):
+    total = len(raw_jobs)
+    results = {}
+    failures = {}
+    jobs = {}
+    for index, raw in enumerate(raw_jobs):
+        try:
+            jobs[index] = prepare_job(index, raw, output_dir)
+        except (ValueError, TypeError) as e:
+            failures[index] = str(e)
+            print(f"[{len(failures)}/{total}] ล้มเหลว งานที่ {index + 1}: {e}")
+
+    if output_dir and not shared:
+        os.makedirs(output_dir, exist_ok=True)
+
+    def report(index, outcome):
+        job = jobs[index]
+        if isinstance(outcome, Exception):
+            failures[index] = str(outcome)
+            print(f"[{len(results) + len(failures)}/{total}] ล้มเหลว {job['name']}: {outcome}")
+            return
+        results[index] = outcome
+        loops = len(outcome[0]) if shared else outcome[0]
+        target = "" if shared else f" -> {job['output']}"
+        print(f"[{len(results) + len(failures)}/{total}] สำเร็จ {job['name']}: "
+              f"{loops} รอบ ({outcome[2] * 1e3:.1f} ms){target}")
+
+    if workers == 1:
+        for index, job in jobs.items():
+            try:
+                outcome = run_job(job, shared is not None)
+            except Exception as e:
+                outcome = e
+            report(index, outcome)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_job, job, shared is not None): index for index, job in jobs.items()}
+            for future in as_completed(futures):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                report(futures[future], outcome)
+
+    if shared is not None and results:
+        # เขียน sheet ตามลำดับงานในไฟล์ ไม่ใช่ตามลำดับที่ worker ทำเสร็จ
+        wb = create_workbook()
+        used = set()
+        for index in sorted(results):
+            job = jobs[index]
+            trace, inputs, _ = results[index]
+            METHODS[job["method"]][0].write_sheet(wb, trace, decimals=job["decimals"],
+                                                  title=sheet_title(job["name"], used), **inputs)
+        wb.save(shared)
+        print(f"บันทึก {len(results)} sheet ในไฟล์: {shared}")
+
+    return results, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="สร้างไฟล์ Excel หลายงานจากไฟล์รายการงาน (CSV หรือ JSON)")
+    parser.add_argument("jobs", help="ไฟล์รายการงาน .csv หรือ .json")
+    parser.add_argument("--workers", type=int, default=None, help="จำนวน process (default: จำนวน CPU, 1 = ไม่ใช้ process pool)")
+    parser.add_argument("--output-dir", default=".", help="โฟลเดอร์สำหรับไฟล์ผลลัพธ์ (default: โฟลเดอร์ปัจจุบัน)")
+    parser.add_argument("--shared", metavar="FILE", default=None, help="รวมทุกงานเป็น sheet ในไฟล์เดียว แทนการสร้างไฟล์ละงาน")
+    args = parser.parse_args(argv)
+
+    raw_jobs = load_jobs(args.jobs)
+    print(f"พบ {len(raw_jobs)} งานในไฟล์ {args.jobs}")
+
+    start = time.perf_counter()
+    results, failures = run_batch(raw_jobs, workers=args.workers, output_dir=args.output_dir, shared=args.shared)
+
+    print(f"เสร็จสิ้น! สำเร็จ {len(results)} งาน, ล้มเหลว {len(failures)} งาน ({time.perf_counter() - start:.2f} s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
-import math
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from excel_export import (BOLD, HEADER, NEXT, Styled, create_workbook, iteration_columns,
+                          param_cell_ref, register_styles, write_iteration_sheet)
+from expression import compile_equation
+from iteration_trace import IterationTrace
 
 EQUATION_STR = "x^3 + 3*x^2 - 1"
 INPUT_A = 0
@@ -10,6 +10,8 @@ TOLERANCE = 0.000001
 DECIMALS = 10
 
 OUTPUT_FILENAME = "Bisection_Result_Python.xlsx"
+CSV_FILENAME = None  # เช่น "Bisection_Trace.csv" เพื่อบันทึกค่าแต่ละรอบเป็น CSV ด้วย
+MAX_ITER = 99
 
 def format_excel_formula(equation, cell_ref):
     formula = equation.lower()
@@ -27,44 +29,37 @@ def format_excel_formula(equation, cell_ref):
     return "=" + formula
 
 def evaluate_func(eq, x):
-    eq_py = eq.replace('^', '**')
-    for func in ['sin', 'cos', 'tan', 'sqrt', 'exp', 'log', 'abs']:
-        eq_py = eq_py.replace(func, f'math.{func}')
     try:
-        return eval(eq_py)
+        return compile_equation(eq)(x)
     except:
         return 0
 
-def generate_excel():
-    print(f"กำลังคำนวณและสร้างไฟล์ {OUTPUT_FILENAME}...")
+def solve(equation, a, b, tolerance, max_iter=MAX_ITER):
+    trace = IterationTrace(("a", "b", "fa", "m", "fm", "error"), capacity=max_iter)
+    fa = evaluate_func(equation, a)
     
-    a = INPUT_A
-    b = INPUT_B
-    iteration_data = []
-    
-    for i in range(1, 100):
+    for i in range(1, max_iter + 1):
         m = (a + b) / 2
-        fa = evaluate_func(EQUATION_STR, a)
-        fm = evaluate_func(EQUATION_STR, m)
+        fm = evaluate_func(equation, m)
         fafa = fm * fa
         error = abs(b - a) / 2
         
-        iteration_data.append(i)
+        trace.append(a, b, fa, m, fm, error)
         
-        if error < TOLERANCE:
+        if error < tolerance:
             break
             
         if fafa < 0:
             b = m
         else:
             a = m
+            fa = fm
 
-    total_loops = len(iteration_data)
-    print(f"คำนวณจบที่ {total_loops} รอบ")
+    return trace
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Bisection Method"
+def write_sheet(wb, trace, equation, a, b, tolerance, decimals=None, title="Bisection Method"):
+    total_loops = len(trace)
+    num = register_styles(wb, DECIMALS if decimals is None else decimals)
 
     ROW_HEADER = 1
     ROW_A = 2
@@ -79,91 +74,62 @@ def generate_excel():
     ROW_RANGE = 11
     ROW_NEXT = 12
 
-    labels = {
-        ROW_A: "a", ROW_B: "b", ROW_FA: "f(a)", ROW_FB: "f(b)",
-        ROW_M: "m", ROW_FM: "f(m)", ROW_FAFA: "f(m)f(a)", 
-        ROW_ERR: "err", ROW_CHECK: "check err", 
-        ROW_RANGE: "อยู่ในช่วง?", ROW_NEXT: "ต่อไปอะไรเปลี่ยน"
-    }
-    
-    ws.cell(row=ROW_HEADER, column=1, value="Variables")
-    for r, text in labels.items():
-        cell = ws.cell(row=r, column=1, value=text)
-        cell.font = Font(bold=True, color="3730A3")
-        cell.fill = PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid")
-
-    ws.column_dimensions['B'].width = 3
-
-    start_col = 3
-    
-    number_format = '0.' + '0' * DECIMALS
-
-    for i in range(total_loops):
-        col_idx = start_col + i
-        col_letter = get_column_letter(col_idx)
-        prev_col_letter = get_column_letter(col_idx - 1)
-        
-        header_cell = ws.cell(row=ROW_HEADER, column=col_idx, value=f"i = {i+1}")
-        header_cell.font = Font(bold=True)
-        header_cell.alignment = Alignment(horizontal='center')
-        header_cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-
-        if i == 0:
-            ws.cell(row=ROW_A, column=col_idx, value=INPUT_A).number_format = number_format
-            ws.cell(row=ROW_B, column=col_idx, value=INPUT_B).number_format = number_format
-        else:
-            ws.cell(row=ROW_A, column=col_idx, value=f'=IF({prev_col_letter}{ROW_FAFA}>0, {prev_col_letter}{ROW_M}, {prev_col_letter}{ROW_A})').number_format = number_format
-            ws.cell(row=ROW_B, column=col_idx, value=f'=IF({prev_col_letter}{ROW_FAFA}<0, {prev_col_letter}{ROW_M}, {prev_col_letter}{ROW_B})').number_format = number_format
-
-        ws.cell(row=ROW_FA, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_A}")).number_format = number_format
-        ws.cell(row=ROW_FB, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_B}")).number_format = number_format
-
-        ws.cell(row=ROW_M, column=col_idx, value=f'=({col_letter}{ROW_A}+{col_letter}{ROW_B})/2').number_format = number_format
-        
-        ws.cell(row=ROW_FM, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_M}")).number_format = number_format
-
-        ws.cell(row=ROW_FAFA, column=col_idx, value=f'={col_letter}{ROW_FM}*{col_letter}{ROW_FA}').number_format = number_format
-
-        ws.cell(row=ROW_ERR, column=col_idx, value=f'=ABS({col_letter}{ROW_B}-{col_letter}{ROW_A})/2').number_format = number_format
-
-        meta_col_letter = get_column_letter(start_col + total_loops + 3)
-        tol_cell_ref = f"${meta_col_letter}$5"
-
-        check_cell = ws.cell(row=ROW_CHECK, column=col_idx, value=f'=IF({col_letter}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")')
-        
-        ws.cell(row=ROW_RANGE, column=col_idx, value=f'=IF({col_letter}{ROW_FAFA}<0, "อยู่ในช่วง", "อยู่นอกช่วง")')
-
-        next_cell = ws.cell(row=ROW_NEXT, column=col_idx, value=f'=IF({col_letter}{ROW_ERR}<{tol_cell_ref}, "จบ", IF({col_letter}{ROW_FAFA}<0, "B", "A"))')
-        next_cell.font = Font(bold=True, color="4F46E5")
-
-    meta_col = start_col + total_loops + 1
-    ws.column_dimensions[get_column_letter(meta_col)].width = 2
+    labels = [
+        "Variables", "a", "b", "f(a)", "f(b)", "m", "f(m)", "f(m)f(a)",
+        "err", "check err", "อยู่ในช่วง?", "ต่อไปอะไรเปลี่ยน"
+    ]
+
+    tol_cell_ref = param_cell_ref(total_loops, 5)
+
+    cols = list(iteration_columns(total_loops))
+
+    def rows():
+        yield HEADER, (f"i = {i+1}" for i, c, p in cols)
+        yield num, (a if i == 0 else f'=IF({p}{ROW_FAFA}>0, {p}{ROW_M}, {p}{ROW_A})' for i, c, p in cols)
+        yield num, (b if i == 0 else f'=IF({p}{ROW_FAFA}<0, {p}{ROW_M}, {p}{ROW_B})' for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_A}") for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_B}") for i, c, p in cols)
+        yield num, (f'=({c}{ROW_A}+{c}{ROW_B})/2' for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_M}") for i, c, p in cols)
+        yield num, (f'={c}{ROW_FM}*{c}{ROW_FA}' for i, c, p in cols)
+        yield num, (f'=ABS({c}{ROW_B}-{c}{ROW_A})/2' for i, c, p in cols)
+        yield None, (f'=IF({c}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")' for i, c, p in cols)
+        yield None, (f'=IF({c}{ROW_FAFA}<0, "อยู่ในช่วง", "อยู่นอกช่วง")' for i, c, p in cols)
+        yield NEXT, (f'=IF({c}{ROW_ERR}<{tol_cell_ref}, "จบ", IF({c}{ROW_FAFA}<0, "B", "A"))' for i, c, p in cols)
+
+    params = [
+        [Styled("Parameters", BOLD), Styled("Values", BOLD)],
+        ["Equation", equation],
+        ["Initial a", a],
+        ["Initial b", b],
+        ["Tolerance", tolerance],
+    ]
+
+    return write_iteration_sheet(wb, title, labels, rows(), params, total_loops,
+                                 label_width=15, column_width=14)
+
+def generate_excel(equation=None, a=None, b=None, tolerance=None, decimals=None, output=None,
+                   csv_filename=None):
+    equation = EQUATION_STR if equation is None else equation
+    a = INPUT_A if a is None else a
+    b = INPUT_B if b is None else b
+    tolerance = TOLERANCE if tolerance is None else tolerance
+    output = OUTPUT_FILENAME if output is None else output
+    csv_filename = CSV_FILENAME if csv_filename is None else csv_filename
+
+    print(f"กำลังคำนวณและสร้างไฟล์ {output}...")
     
-    meta_col_idx = meta_col + 1
-    ws.column_dimensions[get_column_letter(meta_col_idx)].width = 20
-    ws.column_dimensions[get_column_letter(meta_col_idx+1)].width = 20
-
-    ws.cell(row=1, column=meta_col_idx, value="Parameters").font = Font(bold=True)
-    ws.cell(row=1, column=meta_col_idx+1, value="Values").font = Font(bold=True)
-
-    ws.cell(row=2, column=meta_col_idx, value="Equation")
-    ws.cell(row=2, column=meta_col_idx+1, value=EQUATION_STR)
-
-    ws.cell(row=3, column=meta_col_idx, value="Initial a")
-    ws.cell(row=3, column=meta_col_idx+1, value=INPUT_A)
-
-    ws.cell(row=4, column=meta_col_idx, value="Initial b")
-    ws.cell(row=4, column=meta_col_idx+1, value=INPUT_B)
+    trace = solve(equation, a, b, tolerance)
 
-    ws.cell(row=5, column=meta_col_idx, value="Tolerance")
-    ws.cell(row=5, column=meta_col_idx+1, value=TOLERANCE)
+    print(f"คำนวณจบที่ {len(trace)} รอบ")
+    if csv_filename:
+        trace.to_csv(csv_filename)
 
-    ws.column_dimensions['A'].width = 15
-    for i in range(total_loops):
-        ws.column_dimensions[get_column_letter(start_col + i)].width = 14
+    wb = create_workbook()
+    write_sheet(wb, trace, equation, a, b, tolerance, decimals)
 
-    wb.save(OUTPUT_FILENAME)
-    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {OUTPUT_FILENAME}")
+    wb.save(output)
+    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {output}")
     print("เปิดไฟล์ Excel แล้วสูตรจะทำงานทันทีครับ")
 
 if __name__ == "__main__":
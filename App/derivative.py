@@ -0,0 +1,97 @@
+import ast
+import json
+import os
+import re
+
+from expression import compile_equation, parse_equation
+
+# None = ไม่บันทึกลงไฟล์ (จำไว้เฉพาะใน process)
+CACHE_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "derivative_cache.json")
+# 2: x เป็นจำนวนจริง และผลอนุพันธ์ผ่านการตรวจ grammar แล้ว (ผลของรุ่น 1 อาจมี re/im/Derivative)
+CACHE_VERSION = 2
+
+_cache = None
+
+
+def cache_key(equation):
+    # รูปแบบมาตรฐานของสมการ: "x^2+1" กับ "x**2 + 1" ได้ key เดียวกัน
+    return ast.unparse(parse_equation(equation))
+
+
+def read_cache(filename):
+    if not filename:
+        return {}
+    try:
+        with open(filename, encoding='utf-8') as fh:
+            data = json.load(fh)
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return {str(k): str(v) for k, v in data["derivatives"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # ไม่มีไฟล์ หรือไฟล์เสีย: เริ่มใหม่ (diff ใหม่แล้วเขียนทับ)
+        return {}
+
+
+def write_cache(filename, entries):
+    if not filename:
+        return
+    # อ่านไฟล์ล่าสุดก่อนเขียน เผื่อ process อื่น (เช่น batch_runner) เพิ่มสมการไว้แล้ว
+    merged = read_cache(filename)
+    merged.update(entries)
+    tmp = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump({"version": CACHE_VERSION, "derivatives": merged}, fh, ensure_ascii=False, indent=1)
+        os.replace(tmp, filename)
+    except OSError:
+        # cache เป็นเพียงตัวช่วย เขียนไม่ได้ก็ยังคำนวณต่อได้
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_cache():
+    global _cache
+    if _cache is None:
+        _cache = read_cache(CACHE_FILENAME)
+    return _cache
+
+
+def clear_cache():
+    global _cache
+    _cache = {}
+    if CACHE_FILENAME and os.path.exists(CACHE_FILENAME):
+        os.remove(CACHE_FILENAME)
+
+
+def sympy_derivative(equation):
+    # import sympy เฉพาะตอนต้อง diff จริง (ใช้เวลาประมาณ 1 วินาที)
+    import sympy
+
+    # x เป็นจำนวนจริง: d/dx abs(x) ได้ sign(x) แทน re(x), im(x) และ Derivative(...)
+    x_sym = sympy.Symbol('x', real=True)
+    expr = sympy.sympify(equation.replace('^', '**'), locals={'x': x_sym})
+    diff_expr = sympy.diff(expr, x_sym)
+    # sign ไม่อยู่ใน grammar ของสมการ: sign(u) = u/abs(u) (ไม่นิยามที่ u = 0 เช่นเดียวกับอนุพันธ์ของ abs)
+    diff_expr = diff_expr.replace(sympy.sign, lambda u: u / sympy.Abs(u))
+    result = re.sub(r'\bAbs\(', 'abs(', str(diff_expr)).replace('**', '^')
+    try:
+        parse_equation(result)
+    except ValueError as e:
+        raise ValueError(f"อนุพันธ์ของ {equation} อยู่นอกรูปแบบสมการที่รองรับ: {result}") from e
+    return result
+
+
+def differentiate(equation):
+    key = cache_key(equation)
+    cache = load_cache()
+    if key not in cache:
+        cache[key] = sympy_derivative(key)
+        write_cache(CACHE_FILENAME, {key: cache[key]})
+    return cache[key]
+
+
+def compile_pair(equation, derivative=None):
+    # f และ f' เป็นฟังก์ชัน Python ที่ compile แล้ว (ไม่ต้องแปลงข้อความสมการซ้ำทุกรอบ)
+    if derivative is None:
+        derivative = differentiate(equation)
+    return compile_equation(equation), compile_equation(derivative)
@@ -0,0 +1,107 @@
+from collections import namedtuple
+from itertools import zip_longest
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+# ชื่อ named style ที่ใช้ร่วมกันทั้งไฟล์ (สร้างครั้งเดียวต่อ workbook แทนการสร้าง Font/PatternFill ทุกเซลล์)
+LABEL = "Variable Label"
+HEADER = "Iteration Header"
+BOLD = "Bold"
+NEXT = "Next Step"
+
+LABEL_COL = 1
+START_COL = 3          # คอลัมน์ B เว้นว่างไว้คั่น
+PARAM_GAP = 2          # จำนวนคอลัมน์ว่างระหว่างรอบสุดท้ายกับตาราง Parameters
+
+Styled = namedtuple("Styled", "value style")
+
+
+def number_style(decimals):
+    return f"Number {decimals}dp"
+
+
+def _named_styles(decimals):
+    return (
+        NamedStyle(name=LABEL, font=Font(bold=True, color="3730A3"),
+                   fill=PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid")),
+        NamedStyle(name=HEADER, font=Font(bold=True), alignment=Alignment(horizontal='center'),
+                   fill=PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")),
+        NamedStyle(name=BOLD, font=Font(bold=True)),
+        NamedStyle(name=NEXT, font=Font(bold=True, color="4F46E5")),
+        NamedStyle(name=number_style(decimals), font=DEFAULT_FONT, number_format='0.' + '0' * decimals),
+    )
+
+
+def create_workbook():
+    # write-only: แถวที่ append แล้วถูกเขียนลงไฟล์ชั่วคราวทันที หน่วยความจำไม่โตตามจำนวนรอบ
+    return Workbook(write_only=True)
+
+
+def register_styles(wb, decimals):
+    for style in _named_styles(decimals):
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+    return number_style(decimals)
+
+
+def make_cell(ws, value, style=None):
+    if style is None:
+        return value
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def styled_cells(ws, values, style=None):
+    # ใช้ named style ที่ register_styles ลงทะเบียนไว้ผ่าน cell.style (API สาธารณะของ openpyxl)
+    if style is None:
+        yield from values
+        return
+    for value in values:
+        yield make_cell(ws, value, style)
+
+
+def iteration_columns(total_loops):
+    for i in range(total_loops):
+        col_idx = START_COL + i
+        yield i, get_column_letter(col_idx), get_column_letter(col_idx - 1)
+
+
+def param_cell_ref(total_loops, row):
+    # อ้างอิงแบบ absolute ไปที่คอลัมน์ Values ของตาราง Parameters
+    return f"${get_column_letter(START_COL + total_loops + PARAM_GAP + 1)}${row}"
+
+
+def write_iteration_sheet(wb, title, labels, rows, params, total_loops,
+                          label_width=15, column_width=14):
+    # labels: ชื่อแถว (แถวแรกคือหัวตาราง)
+    # rows: iterable ของ (style, values) หนึ่งคู่ต่อแถว values มี total_loops ค่า สร้างทีละแถวได้ (generator)
+    # params: แถวของตาราง Parameters แต่ละแถวเป็น list ของค่า หรือ Styled
+    ws = wb.create_sheet(title)
+
+    # write-only ต้องกำหนดความกว้างคอลัมน์ก่อน append แถวแรก
+    ws.column_dimensions[get_column_letter(LABEL_COL)].width = label_width
+    ws.column_dimensions[get_column_letter(START_COL - 1)].width = 3
+    for i in range(total_loops):
+        ws.column_dimensions[get_column_letter(START_COL + i)].width = column_width
+    meta_col = START_COL + total_loops + PARAM_GAP - 1
+    ws.column_dimensions[get_column_letter(meta_col)].width = 2
+    ws.column_dimensions[get_column_letter(meta_col + 1)].width = 20
+    ws.column_dimensions[get_column_letter(meta_col + 2)].width = 20
+
+    for r, (label, row, param) in enumerate(zip_longest(labels, rows, params)):
+        cells = [make_cell(ws, label, LABEL if r > 0 and label is not None else None), None]
+        if row is None:
+            cells.extend([None] * total_loops)
+        else:
+            style, values = row
+            cells.extend(styled_cells(ws, values, style))
+        if param:
+            cells.extend([None] * PARAM_GAP)
+            cells.extend(make_cell(ws, *p) if isinstance(p, Styled) else p for p in param)
+        ws.append(cells)
+    return ws
@@ -0,0 +1,83 @@
+import ast
+import math
+from functools import lru_cache
+
+FUNCTION_NAMES = ('sin', 'cos', 'tan', 'sqrt', 'exp', 'log', 'abs')
+VARIABLE_NAME = 'x'
+CACHE_SIZE = 128
+
+MATH_NAMESPACE = {name: getattr(math, name) for name in FUNCTION_NAMES if name != 'abs'}
+MATH_NAMESPACE['abs'] = abs
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd,
+)
+
+
+def normalize_equation(eq):
+    return eq.strip().replace('^', '**')
+
+
+def parse_equation(eq):
+    try:
+        tree = ast.parse(normalize_equation(eq), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"สมการไม่ถูกต้อง: {eq}") from e
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"ไม่รองรับ {type(node).__name__} ในสมการ: {eq}")
+        if isinstance(node, ast.Name) and node.id != VARIABLE_NAME and node.id not in FUNCTION_NAMES:
+            raise ValueError(f"ไม่รู้จักชื่อ '{node.id}' ในสมการ: {eq}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTION_NAMES:
+                raise ValueError(f"ไม่รองรับการเรียกฟังก์ชันนี้ในสมการ: {eq}")
+            if len(node.args) != 1 or node.keywords:
+                raise ValueError(f"ฟังก์ชัน {node.func.id} ต้องมีอาร์กิวเมนต์เดียว: {eq}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"ค่าคงที่ต้องเป็นตัวเลข: {eq}")
+    return tree
+
+
+def build_function(tree, namespace):
+    # ห่อ expression เป็น lambda x: <expr> แล้ว compile ครั้งเดียว ได้ฟังก์ชัน Python จริง
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg=VARIABLE_NAME)], kwonlyargs=[],
+                         kw_defaults=[], defaults=[])
+    lambda_tree = ast.Expression(body=ast.Lambda(args=args, body=tree.body))
+    ast.fix_missing_locations(lambda_tree)
+    code = compile(lambda_tree, '<equation>', 'eval')
+    return eval(code, {'__builtins__': {}, **namespace})
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_equation(eq):
+    return build_function(parse_equation(eq), MATH_NAMESPACE)
+
+
+def numpy_namespace():
+    import numpy as np
+    return {name: getattr(np, name) for name in FUNCTION_NAMES}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_vectorized(eq):
+    import numpy as np
+
+    func = build_function(parse_equation(eq), numpy_namespace())
+
+    def vectorized(x):
+        x = np.asarray(x, dtype=float)
+        y = func(x)
+        # สมการค่าคงที่ (ไม่มี x) คืนค่าสเกลาร์ ต้องขยายให้มีขนาดเท่ากับ x
+        if np.shape(y) != x.shape:
+            y = np.full(x.shape, y, dtype=float)
+        return y
+
+    return vectorized
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_dual(eq):
+    # ใช้ฟังก์ชันของ numpy และไม่แปลง x เป็นอาร์เรย์ จึงส่งจำนวนคู่ (Dual) เข้าไปหาอนุพันธ์ได้โดยตรง
+    return build_function(parse_equation(eq), numpy_namespace())
@@ -1,15 +1,19 @@
-import math
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from excel_export import (BOLD, HEADER, NEXT, Styled, create_workbook, iteration_columns,
+                          param_cell_ref, register_styles, write_iteration_sheet)
+from expression import compile_equation
+from iteration_trace import IterationTrace
 
 EQUATION_STR = "x^4 + 2*x^2 - x - 3" 
 INPUT_A = -1.5   
 INPUT_B = 0.5    
 TOLERANCE = 0.000001 
 DECIMALS =6   
+MODE = "plain"  # "plain", "illinois", "pegasus", "anderson_bjorck"
+MODES = ("plain", "illinois", "pegasus", "anderson_bjorck")
 
 OUTPUT_FILENAME = "False_Position_Result.xlsx"
+CSV_FILENAME = None  # เช่น "False_Position_Trace.csv" เพื่อบันทึกค่าแต่ละรอบเป็น CSV ด้วย
+MAX_ITER = 99
 
 def format_excel_formula(equation, cell_ref):
     formula = equation.lower()
@@ -26,30 +30,36 @@ def format_excel_formula(equation, cell_ref):
     return "=" + formula
 
 def evaluate_func(eq, x):
-    eq_py = eq.replace('^', '**')
-    for func in ['sin', 'cos', 'tan', 'sqrt', 'exp', 'log', 'abs']:
-        eq_py = eq_py.replace(func, f'math.{func}')
     try:
-        return eval(eq_py)
+        return compile_equation(eq)(x)
     except:
         return 0
 
-def generate_excel():
-    print(f"กำลังคำนวณและสร้างไฟล์ {OUTPUT_FILENAME}...")
-    
-    a = INPUT_A
-    b = INPUT_B
+def scale_factor(mode, f_old, f_new):
+    if mode == "illinois":
+        return 0.5
+    if mode == "pegasus":
+        return f_old / (f_old + f_new)
+    if mode == "anderson_bjorck":
+        m = 1 - f_new / f_old
+        return m if m > 0 else 0.5
+    raise ValueError(f"ไม่รู้จักรูปแบบ '{mode}' (เลือกได้: {', '.join(MODES)})")
+
+def solve(equation, a, b, tolerance, mode="plain", max_iter=MAX_ITER):
+    # ตรวจก่อนเริ่ม: scale_factor ถูกเรียกเฉพาะเมื่อแทนที่ด้านเดิมซ้ำ ชื่อผิดจึงอาจไม่ถูกตรวจเลย
+    if mode not in MODES:
+        raise ValueError(f"ไม่รู้จักรูปแบบ '{mode}' (เลือกได้: {', '.join(MODES)})")
     m_old = 0
-    total_loops = 0
+    fa = evaluate_func(equation, a)
+    fb = evaluate_func(equation, b)
+    trace = IterationTrace(("a", "b", "fa", "fb", "m", "fm", "error"), capacity=max_iter)
+    side = 0
     
-    for i in range(1, 100):
-        fa = evaluate_func(EQUATION_STR, a)
-        fb = evaluate_func(EQUATION_STR, b)
-        
+    for i in range(1, max_iter + 1):
         if (fb - fa) == 0: break
         m = (a * fb - b * fa) / (fb - fa)
         
-        fm = evaluate_func(EQUATION_STR, m)
+        fm = evaluate_func(equation, m)
         fafa = fm * fa
         
         if i == 1:
@@ -58,21 +68,31 @@ def generate_excel():
             error = abs((m - m_old) / m) if m != 0 else 0
         
         m_old = m
-        total_loops = i
+        trace.append(a, b, fa, fb, m, fm, error)
         
-        if error < TOLERANCE:
+        if error < tolerance:
             break
             
         if fafa < 0:
+            if mode != "plain" and side == -1:
+                fa *= scale_factor(mode, fb, fm)
             b = m
+            fb = fm
+            side = -1
         else:
+            if mode != "plain" and side == 1:
+                fb *= scale_factor(mode, fa, fm)
             a = m
+            fa = fm
+            side = 1
 
-    print(f"คำนวณจบที่ {total_loops} รอบ")
+    return trace
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "False Position"
+def write_sheet(wb, trace, equation, a, b, tolerance, mode="plain", decimals=None, title="False Position"):
+    total_loops = len(trace)
+    num = register_styles(wb, DECIMALS if decimals is None else decimals)
+    fa_values = trace["fa"]
+    fb_values = trace["fb"]
 
     ROW_HEADER = 1
     ROW_A = 2
@@ -87,90 +107,67 @@ def generate_excel():
     ROW_RANGE = 11
     ROW_NEXT = 12
 
-    labels = {
-        ROW_A: "a", ROW_B: "b", ROW_FA: "f(a)", ROW_FB: "f(b)",
-        ROW_M: "m", ROW_FM: "f(m)", ROW_FAFA: "f(a)*f(m)", 
-        ROW_ERR: "error", ROW_CHECK: "check round", 
-        ROW_RANGE: "อยู่ในช่วง?", ROW_NEXT: "ต่อไปอะไรเปลี่ยน"
-    }
-    
-    ws.cell(row=ROW_HEADER, column=1, value="Variables")
-    for r, text in labels.items():
-        cell = ws.cell(row=r, column=1, value=text)
-        cell.font = Font(bold=True, color="3730A3")
-        cell.fill = PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid")
-
-    ws.column_dimensions['B'].width = 3 # Gap Column
-
-    start_col = 3
-    number_format = '0.' + '0' * DECIMALS
-
-    for i in range(total_loops):
-        col_idx = start_col + i
-        col_letter = get_column_letter(col_idx)
-        prev_col_letter = get_column_letter(col_idx - 1)
-        
-        header_cell = ws.cell(row=ROW_HEADER, column=col_idx, value=f"round {i+1}")
-        header_cell.font = Font(bold=True)
-        header_cell.alignment = Alignment(horizontal='center')
-        header_cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-
-        if i == 0:
-            ws.cell(row=ROW_A, column=col_idx, value=INPUT_A).number_format = number_format
-            ws.cell(row=ROW_B, column=col_idx, value=INPUT_B).number_format = number_format
+    labels = [
+        "Variables", "a", "b", "f(a)", "f(b)", "m", "f(m)", "f(a)*f(m)",
+        "error", "check round", "อยู่ในช่วง?", "ต่อไปอะไรเปลี่ยน"
+    ]
+
+    tol_cell_ref = param_cell_ref(total_loops, 5)
+    cols = list(iteration_columns(total_loops))
+
+    def rows():
+        yield HEADER, (f"round {i+1}" for i, c, p in cols)
+        yield num, (a if i == 0 else f'=IF({p}{ROW_FAFA}>0, {p}{ROW_M}, {p}{ROW_A})' for i, c, p in cols)
+        yield num, (b if i == 0 else f'=IF({p}{ROW_FAFA}<0, {p}{ROW_M}, {p}{ROW_B})' for i, c, p in cols)
+        if mode == "plain":
+            yield num, (format_excel_formula(equation, f"{c}{ROW_A}") for i, c, p in cols)
+            yield num, (format_excel_formula(equation, f"{c}{ROW_B}") for i, c, p in cols)
         else:
-            ws.cell(row=ROW_A, column=col_idx, value=f'=IF({prev_col_letter}{ROW_FAFA}>0, {prev_col_letter}{ROW_M}, {prev_col_letter}{ROW_A})').number_format = number_format
-            ws.cell(row=ROW_B, column=col_idx, value=f'=IF({prev_col_letter}{ROW_FAFA}<0, {prev_col_letter}{ROW_M}, {prev_col_letter}{ROW_B})').number_format = number_format
-
-        ws.cell(row=ROW_FA, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_A}")).number_format = number_format
-        ws.cell(row=ROW_FB, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_B}")).number_format = number_format
-
-        m_formula = f'=({col_letter}{ROW_A}*{col_letter}{ROW_FB} - {col_letter}{ROW_B}*{col_letter}{ROW_FA}) / ({col_letter}{ROW_FB} - {col_letter}{ROW_FA})'
-        ws.cell(row=ROW_M, column=col_idx, value=m_formula).number_format = number_format
-        
-        ws.cell(row=ROW_FM, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_M}")).number_format = number_format
-
-        ws.cell(row=ROW_FAFA, column=col_idx, value=f'={col_letter}{ROW_FA}*{col_letter}{ROW_FM}').number_format = number_format
-
-        if i == 0:
-            ws.cell(row=ROW_ERR, column=col_idx, value=1.0).number_format = number_format
-        else:
-            ws.cell(row=ROW_ERR, column=col_idx, value=f'=ABS(({col_letter}{ROW_M}-{prev_col_letter}{ROW_M})/{col_letter}{ROW_M})').number_format = number_format
-
-        meta_col_letter = get_column_letter(start_col + total_loops + 3)
-        tol_cell_ref = f"${meta_col_letter}$5"
+            yield num, fa_values
+            yield num, fb_values
+        yield num, (f'=({c}{ROW_A}*{c}{ROW_FB} - {c}{ROW_B}*{c}{ROW_FA}) / ({c}{ROW_FB} - {c}{ROW_FA})' for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_M}") for i, c, p in cols)
+        yield num, (f'={c}{ROW_FA}*{c}{ROW_FM}' for i, c, p in cols)
+        yield num, (1.0 if i == 0 else f'=ABS(({c}{ROW_M}-{p}{ROW_M})/{c}{ROW_M})' for i, c, p in cols)
+        yield None, (f'=IF({c}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")' for i, c, p in cols)
+        yield None, (f'=IF({c}{ROW_FAFA}<0, "อยู่ในช่วง", "อยู่นอกช่วง")' for i, c, p in cols)
+        yield NEXT, (f'=IF({c}{ROW_ERR}<{tol_cell_ref}, "จบ", IF({c}{ROW_FAFA}<0, "B", "A"))' for i, c, p in cols)
+
+    params = [
+        [Styled("Parameters", BOLD), Styled("Values", BOLD)],
+        ["Equation", equation],
+        ["Initial a", a],
+        ["Initial b", b],
+        ["Tolerance", tolerance],
+        ["Mode", mode],
+    ]
+
+    return write_iteration_sheet(wb, title, labels, rows(), params, total_loops,
+                                 label_width=15, column_width=14)
+
+def generate_excel(equation=None, a=None, b=None, tolerance=None, mode=None, decimals=None,
+                   output=None, csv_filename=None):
+    equation = EQUATION_STR if equation is None else equation
+    a = INPUT_A if a is None else a
+    b = INPUT_B if b is None else b
+    tolerance = TOLERANCE if tolerance is None else tolerance
+    mode = MODE if mode is None else mode
+    output = OUTPUT_FILENAME if output is None else output
+    csv_filename = CSV_FILENAME if csv_filename is None else csv_filename
+
+    print(f"กำลังคำนวณและสร้างไฟล์ {output}...")
+    
+    trace = solve(equation, a, b, tolerance, mode)
 
-        check_cell = ws.cell(row=ROW_CHECK, column=col_idx, value=f'=IF({col_letter}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")')
-        
-        ws.cell(row=ROW_RANGE, column=col_idx, value=f'=IF({col_letter}{ROW_FAFA}<0, "อยู่ในช่วง", "อยู่นอกช่วง")')
+    print(f"คำนวณจบที่ {len(trace)} รอบ")
+    if csv_filename:
+        trace.to_csv(csv_filename)
 
-        next_cell = ws.cell(row=ROW_NEXT, column=col_idx, value=f'=IF({col_letter}{ROW_ERR}<{tol_cell_ref}, "จบ", IF({col_letter}{ROW_FAFA}<0, "B", "A"))')
-        next_cell.font = Font(bold=True, color="4F46E5")
+    wb = create_workbook()
+    write_sheet(wb, trace, equation, a, b, tolerance, mode, decimals)
 
-    meta_col = start_col + total_loops + 1
-    ws.column_dimensions[get_column_letter(meta_col)].width = 2
-    
-    meta_col_idx = meta_col + 1
-    ws.column_dimensions[get_column_letter(meta_col_idx)].width = 20
-    ws.column_dimensions[get_column_letter(meta_col_idx+1)].width = 20
-
-    ws.cell(row=1, column=meta_col_idx, value="Parameters").font = Font(bold=True)
-    ws.cell(row=1, column=meta_col_idx+1, value="Values").font = Font(bold=True)
-    ws.cell(row=2, column=meta_col_idx, value="Equation")
-    ws.cell(row=2, column=meta_col_idx+1, value=EQUATION_STR)
-    ws.cell(row=3, column=meta_col_idx, value="Initial a")
-    ws.cell(row=3, column=meta_col_idx+1, value=INPUT_A)
-    ws.cell(row=4, column=meta_col_idx, value="Initial b")
-    ws.cell(row=4, column=meta_col_idx+1, value=INPUT_B)
-    ws.cell(row=5, column=meta_col_idx, value="Tolerance")
-    ws.cell(row=5, column=meta_col_idx+1, value=TOLERANCE)
-
-    ws.column_dimensions['A'].width = 15
-    for i in range(total_loops):
-        ws.column_dimensions[get_column_letter(start_col + i)].width = 14
-
-    wb.save(OUTPUT_FILENAME)
-    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {OUTPUT_FILENAME}")
+    wb.save(output)
+    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {output}")
     print("เปิดไฟล์ Excel แล้วสูตรจะทำงานทันทีครับ")
 
 if __name__ == "__main__":
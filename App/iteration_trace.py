@@ -0,0 +1,74 @@
+import csv
+from array import array
+
+DEFAULT_CAPACITY = 64
+ITEM_SIZE = array('d').itemsize
+
+
+class IterationTrace:
+    # เก็บค่าของแต่ละรอบเป็นคอลัมน์ array('d') แยกกัน (8 ไบต์ต่อค่า) แทน list ของ dict/float
+    # จองที่ไว้ล่วงหน้า capacity แถว แล้วขยายเป็นสองเท่าเมื่อเต็ม
+
+    def __init__(self, columns, capacity=DEFAULT_CAPACITY):
+        if not columns:
+            raise ValueError("ต้องมีอย่างน้อยหนึ่งคอลัมน์")
+        if len(set(columns)) != len(columns):
+            raise ValueError(f"ชื่อคอลัมน์ซ้ำกัน: {columns}")
+        self.columns = tuple(columns)
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._data = {name: array('d', bytes(ITEM_SIZE * self._capacity)) for name in self.columns}
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    def _grow(self):
+        extra = bytes(ITEM_SIZE * self._capacity)
+        for arr in self._data.values():
+            arr.frombytes(extra)
+        self._capacity *= 2
+
+    def append(self, *values):
+        if len(values) != len(self.columns):
+            raise ValueError(f"ต้องมี {len(self.columns)} ค่า ({', '.join(self.columns)}) ได้ {len(values)} ค่า")
+        if self._size == self._capacity:
+            self._grow()
+        i = self._size
+        for arr, value in zip(self._data.values(), values):
+            arr[i] = value
+        self._size += 1
+
+    def column(self, name):
+        # คืน memoryview (อ่านอย่างเดียว ไม่คัดลอก) ของแถวที่มีข้อมูล
+        # ต้องปล่อย view (รวมถึงอาร์เรย์จาก to_numpy) ก่อน append ต่อ เพราะ array ขยายขนาดไม่ได้ระหว่างที่มี view ค้างอยู่
+        if name not in self._data:
+            raise KeyError(f"ไม่มีคอลัมน์ '{name}' (มี: {', '.join(self.columns)})")
+        return memoryview(self._data[name])[:self._size].toreadonly()
+
+    def row(self, i):
+        if not -self._size <= i < self._size:
+            raise IndexError(f"ไม่มีรอบที่ {i} (มีทั้งหมด {self._size} รอบ)")
+        i %= self._size
+        return {name: arr[i] for name, arr in self._data.items()}
+
+    def last(self):
+        return self.row(-1) if self._size else None
+
+    def to_numpy(self, name):
+        import numpy as np
+        return np.frombuffer(self._data[name], dtype=float, count=self._size)
+
+    def nbytes(self):
+        return ITEM_SIZE * self._capacity * len(self.columns)
+
+    def to_csv(self, filename, index_name="i"):
+        with open(filename, 'w', newline='', encoding='utf-8') as fh:
+            writer = csv.writer(fh)
+            writer.writerow((index_name,) + self.columns)
+            columns = [self.column(name) for name in self.columns]
+            writer.writerows(zip(range(1, self._size + 1), *columns))
+            for view in columns:
+                view.release()
@@ -1,7 +1,7 @@
-import math
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
+from excel_export import (BOLD, HEADER, Styled, create_workbook, iteration_columns,
+                          param_cell_ref, register_styles, write_iteration_sheet)
+from expression import compile_equation
+from iteration_trace import IterationTrace
 import re
 
 EQUATION_STR = "sin(x) - x^2"
@@ -11,6 +11,8 @@ TOLERANCE = 0.001
 DECIMALS = 6
 
 OUTPUT_FILENAME = "Secant_Result.xlsx"
+CSV_FILENAME = None  # เช่น "Secant_Trace.csv" เพื่อบันทึกค่าแต่ละรอบเป็น CSV ด้วย
+MAX_ITER = 99
 
 def format_excel_formula(equation, cell_ref):
     formula = equation.lower()
@@ -26,24 +28,19 @@ def format_excel_formula(equation, cell_ref):
     return "=" + formula
 
 def evaluate_func(eq, x):
-    eq_py = eq.replace('^', '**')
-    for func in ['sin', 'cos', 'tan', 'sqrt', 'exp', 'log', 'abs']:
-        eq_py = eq_py.replace(func, f'math.{func}')
     try:
-        return eval(eq_py)
+        return compile_equation(eq)(x)
     except:
         return 0
 
-def generate_excel():
-    print(f"กำลังคำนวณและสร้างไฟล์ {OUTPUT_FILENAME}...")
+def solve(equation, x0, x1, tolerance, max_iter=MAX_ITER):
+    x_prev = x0
+    x_curr = x1
+    trace = IterationTrace(("x_prev", "x", "fx_prev", "fx", "x_next", "error"), capacity=max_iter)
+    fx_prev = evaluate_func(equation, x_prev)
     
-    x_prev = INPUT_X0
-    x_curr = INPUT_X1
-    total_loops = 0
-    
-    for i in range(1, 100):
-        fx_curr = evaluate_func(EQUATION_STR, x_curr)
-        fx_prev = evaluate_func(EQUATION_STR, x_prev)
+    for i in range(1, max_iter + 1):
+        fx_curr = evaluate_func(equation, x_curr)
         
         if (fx_curr - fx_prev) == 0:
             print("Warning: Division by zero (f(xi) = f(xi-1)). Stopping.")
@@ -53,18 +50,19 @@ def generate_excel():
         
         error = abs(x_next - x_curr)
         
+        trace.append(x_prev, x_curr, fx_prev, fx_curr, x_next, error)
         x_prev = x_curr
+        fx_prev = fx_curr
         x_curr = x_next
-        total_loops = i
         
-        if error < TOLERANCE:
+        if error < tolerance:
             break
 
-    print(f"คำนวณจบที่ {total_loops} รอบ")
+    return trace
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Secant Method"
+def write_sheet(wb, trace, equation, x0, x1, tolerance, decimals=None, title="Secant Method"):
+    total_loops = len(trace)
+    num = register_styles(wb, DECIMALS if decimals is None else decimals)
 
     ROW_HEADER = 1
     ROW_XI = 2
@@ -76,95 +74,60 @@ def generate_excel():
     ROW_ERR = 8
     ROW_CHECK = 9
 
-    labels = {
-        ROW_XI: "x_i",
-        ROW_XI_PREV: "x_(i-1)",
-        ROW_FXI: "f(x_i)",
-        ROW_FXI_PREV: "f(x_(i-1))",
-        ROW_DIFF_X: "(x_i) - x_(i-1)",
-        ROW_XI_NEXT: "x_i+1",
-        ROW_ERR: "error",
-        ROW_CHECK: "check round"
-    }
+    labels = [
+        "Variables", "x_i", "x_(i-1)", "f(x_i)", "f(x_(i-1))", "(x_i) - x_(i-1)",
+        "x_i+1", "error", "check round"
+    ]
+
+    tol_cell_ref = param_cell_ref(total_loops, 5)
+    cols = list(iteration_columns(total_loops))
+
+    def rows():
+        yield HEADER, (f"x{i+2}" for i, c, p in cols)
+        yield num, (x1 if i == 0 else f'={p}{ROW_XI_NEXT}' for i, c, p in cols)
+        yield num, (x0 if i == 0 else f'={p}{ROW_XI}' for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_XI}") for i, c, p in cols)
+        yield num, (format_excel_formula(equation, f"{c}{ROW_XI_PREV}") for i, c, p in cols)
+        yield num, (f'={c}{ROW_XI}-{c}{ROW_XI_PREV}' for i, c, p in cols)
+        yield num, (f'={c}{ROW_XI} - {c}{ROW_FXI} * {c}{ROW_DIFF_X} / ({c}{ROW_FXI} - {c}{ROW_FXI_PREV})' for i, c, p in cols)
+        yield num, (f'=ABS({c}{ROW_XI_NEXT}-{c}{ROW_XI})' for i, c, p in cols)
+        yield None, (f'=IF({c}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")' for i, c, p in cols)
+
+    params = [
+        [Styled("Parameters", BOLD), Styled("Values", BOLD)],
+        [Styled("f(x)", BOLD), equation],
+        [Styled("x0", BOLD), x0],
+        [Styled("x1", BOLD), x1],
+        [Styled("Tolerance", BOLD), tolerance],
+        [Styled(None, BOLD)],
+    ]
+
+    return write_iteration_sheet(wb, title, labels, rows(), params, total_loops,
+                                 label_width=18, column_width=16)
+
+def generate_excel(equation=None, x0=None, x1=None, tolerance=None, decimals=None,
+                   output=None, csv_filename=None):
+    equation = EQUATION_STR if equation is None else equation
+    x0 = INPUT_X0 if x0 is None else x0
+    x1 = INPUT_X1 if x1 is None else x1
+    tolerance = TOLERANCE if tolerance is None else tolerance
+    output = OUTPUT_FILENAME if output is None else output
+    csv_filename = CSV_FILENAME if csv_filename is None else csv_filename
+
+    print(f"กำลังคำนวณและสร้างไฟล์ {output}...")
     
-    ws.cell(row=ROW_HEADER, column=1, value="Variables")
-    for r, text in labels.items():
-        cell = ws.cell(row=r, column=1, value=text)
-        cell.font = Font(bold=True, color="3730A3")
-        cell.fill = PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid")
-
-    ws.column_dimensions['B'].width = 3
-
-    start_col = 3
-    number_format = '0.' + '0' * DECIMALS
-
-    for i in range(total_loops):
-        col_idx = start_col + i
-        col_letter = get_column_letter(col_idx)
-        prev_col_letter = get_column_letter(col_idx - 1)
-        
-        header_cell = ws.cell(row=ROW_HEADER, column=col_idx, value=f"x{i+2}")
-        header_cell.font = Font(bold=True)
-        header_cell.alignment = Alignment(horizontal='center')
-        header_cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-
-        if i == 0:
-            ws.cell(row=ROW_XI, column=col_idx, value=INPUT_X1).number_format = number_format
-        else:
-            ws.cell(row=ROW_XI, column=col_idx, value=f'={prev_col_letter}{ROW_XI_NEXT}').number_format = number_format
-
-        if i == 0:
-            ws.cell(row=ROW_XI_PREV, column=col_idx, value=INPUT_X0).number_format = number_format
-        else:
-            ws.cell(row=ROW_XI_PREV, column=col_idx, value=f'={prev_col_letter}{ROW_XI}').number_format = number_format
-
-        ws.cell(row=ROW_FXI, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_XI}")).number_format = number_format
-
-        ws.cell(row=ROW_FXI_PREV, column=col_idx, value=format_excel_formula(EQUATION_STR, f"{col_letter}{ROW_XI_PREV}")).number_format = number_format
-
-        ws.cell(row=ROW_DIFF_X, column=col_idx, value=f'={col_letter}{ROW_XI}-{col_letter}{ROW_XI_PREV}').number_format = number_format
-
-        secant_formula = f'={col_letter}{ROW_XI} - {col_letter}{ROW_FXI} * {col_letter}{ROW_DIFF_X} / ({col_letter}{ROW_FXI} - {col_letter}{ROW_FXI_PREV})'
-        ws.cell(row=ROW_XI_NEXT, column=col_idx, value=secant_formula).number_format = number_format
+    trace = solve(equation, x0, x1, tolerance)
 
-        ws.cell(row=ROW_ERR, column=col_idx, value=f'=ABS({col_letter}{ROW_XI_NEXT}-{col_letter}{ROW_XI})').number_format = number_format
-
-        meta_col_letter = get_column_letter(start_col + total_loops + 3)
-        tol_cell_ref = f"${meta_col_letter}$5"
-
-        ws.cell(row=ROW_CHECK, column=col_idx, value=f'=IF({col_letter}{ROW_ERR}<{tol_cell_ref}, "TRUE", "FALSE")')
-
-    meta_col = start_col + total_loops + 1
-    ws.column_dimensions[get_column_letter(meta_col)].width = 2
-    
-    meta_col_idx = meta_col + 1
-    ws.column_dimensions[get_column_letter(meta_col_idx)].width = 20
-    ws.column_dimensions[get_column_letter(meta_col_idx+1)].width = 20
-
-    for r in range(1, 7):
-        ws.cell(row=r, column=meta_col_idx).font = Font(bold=True)
-
-    ws.cell(row=1, column=meta_col_idx, value="Parameters")
-    ws.cell(row=1, column=meta_col_idx+1, value="Values").font = Font(bold=True)
-    
-    ws.cell(row=2, column=meta_col_idx, value="f(x)")
-    ws.cell(row=2, column=meta_col_idx+1, value=EQUATION_STR)
-    
-    ws.cell(row=3, column=meta_col_idx, value="x0")
-    ws.cell(row=3, column=meta_col_idx+1, value=INPUT_X0)
-    
-    ws.cell(row=4, column=meta_col_idx, value="x1")
-    ws.cell(row=4, column=meta_col_idx+1, value=INPUT_X1)
-    
-    ws.cell(row=5, column=meta_col_idx, value="Tolerance")
-    ws.cell(row=5, column=meta_col_idx+1, value=TOLERANCE)
+    print(f"คำนวณจบที่ {len(trace)} รอบ")
+    if csv_filename:
+        trace.to_csv(csv_filename)
 
-    ws.column_dimensions['A'].width = 18
-    for i in range(total_loops):
-        ws.column_dimensions[get_column_letter(start_col + i)].width = 16
+    wb = create_workbook()
+    write_sheet(wb, trace, equation, x0, x1, tolerance, decimals)
 
-    wb.save(OUTPUT_FILENAME)
-    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {OUTPUT_FILENAME}")
+    wb.save(output)
+    print(f"เสร็จสิ้น! บันทึกไฟล์ที่: {output}")
+    print("เปิดไฟล์ Excel แล้วสูตรจะทำงานทันทีครับ")
 
 if __name__ == "__main__":
     generate_excel()
\ No newline at end of file
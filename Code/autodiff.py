@@ -0,0 +1,316 @@
+"""
+การหาอนุพันธ์อัตโนมัติแบบเดินหน้า (Forward-Mode Automatic Differentiation)
+ด้วยจำนวนคู่ (dual number) a + a'ε โดยที่ ε² = 0
+"""
+
+import numpy as np
+
+
+class Dual:
+    """
+    จำนวนคู่ val + der·ε เก็บค่าของฟังก์ชันและอนุพันธ์ไปพร้อมกัน
+
+    พารามิเตอร์:
+    val: ค่า (ค่าเดียว, อาร์เรย์ numpy หรือ Dual)
+    der: อนุพันธ์เทียบกับตัวแปรต้น (default: 0.0)
+
+    หมายเหตุ:
+    - รองรับ + - * / ** @ x[i] และฟังก์ชันของ numpy: sin cos tan sqrt exp log abs sum (เช่น np.sin(x))
+      ฟังก์ชันของ math (เช่น math.sin) แปลงเป็น float จึงใช้กับ Dual ไม่ได้
+    - val และ der เป็นอาร์เรย์ได้ (คำนวณอนุพันธ์ของหลายจุดพร้อมกัน)
+    - der มีแกนนำหน้าเพิ่มได้ (der[k] คืออนุพันธ์ตามทิศทาง k) เช่น Dual(x, I) ได้เมทริกซ์จาโคเบียนในครั้งเดียว
+      @ รองรับเฉพาะกรณีที่อีกฝั่งเป็นค่าคงที่
+    - val และ der เป็น Dual ซ้อนได้ (Dual ของ Dual) สำหรับอนุพันธ์อันดับสูง
+    - การเปรียบเทียบ (<, >, ...) ใช้ค่า val เท่านั้น ฟังก์ชันที่มี if จึงยังหาอนุพันธ์ได้
+    """
+
+    __slots__ = ("val", "der")
+
+    def __init__(self, val, der=0.0):
+        self.val = val
+        self.der = der
+
+    def __repr__(self):
+        return f"Dual({self.val!r}, {self.der!r})"
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            val = self.val + other.val
+            shape = np.shape(primal(val))
+            return Dual(val, self._lift(shape) + other._lift(shape))
+        val = self.val + other
+        return Dual(val, self._lift(np.shape(primal(val))))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            val = self.val - other.val
+            shape = np.shape(primal(val))
+            return Dual(val, self._lift(shape) - other._lift(shape))
+        val = self.val - other
+        return Dual(val, self._lift(np.shape(primal(val))))
+
+    def __rsub__(self, other):
+        val = other - self.val
+        return Dual(val, -self._lift(np.shape(primal(val))))
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            val = self.val * other.val
+            shape = np.shape(primal(val))
+            return Dual(val, self.val * other._lift(shape) + self._lift(shape) * other.val)
+        val = self.val * other
+        return Dual(val, self._lift(np.shape(primal(val))) * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            q = self.val / other.val
+            shape = np.shape(primal(q))
+            return Dual(q, (self._lift(shape) - q * other._lift(shape)) / other.val)
+        q = self.val / other
+        return Dual(q, self._lift(np.shape(primal(q))) / other)
+
+    def __rtruediv__(self, other):
+        q = other / self.val
+        return Dual(q, -q * self._lift(np.shape(primal(q))) / self.val)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # a^b = exp(b·log a)
+            p = self.val ** other.val
+            shape = np.shape(primal(p))
+            return Dual(p, p * (other._lift(shape) * np.log(self.val) + other.val * self._lift(shape) / self.val))
+        p = self.val ** other
+        der = self._lift(np.shape(primal(p)))
+        if isinstance(other, (int, float)) and other == 0:
+            return Dual(p, der * 0)
+        return Dual(p, other * self.val ** (other - 1) * der)
+
+    def __rpow__(self, other):
+        p = other ** self.val
+        return Dual(p, p * np.log(other) * self._lift(np.shape(primal(p))))
+
+    def __neg__(self):
+        return Dual(-self.val, -self.der)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.val), np.sign(self.val) * self.der)
+
+    def _direction_axes(self):
+        # der อาจมีแกนนำหน้าเพิ่ม (หลายทิศทางพร้อมกัน เช่นตอนหาเมทริกซ์จาโคเบียน)
+        return np.ndim(primal(self.der)) - np.ndim(primal(self.val))
+
+    def _lift(self, shape):
+        # der ที่มีแกนทิศทางนำหน้า ขยายแกนค่าให้เป็น shape ของผลลัพธ์ (แกนทิศทางต้องอยู่หน้าเสมอ)
+        # เช่น x[0] + x: der ของ x[0] ขนาด (n,) ต้องเป็น (n, 1) ไม่ใช่ชนกับแกนค่าของ x
+        extra = self._direction_axes()
+        if extra == 0:
+            return self.der
+        der_shape = np.shape(self.der)
+        missing = len(shape) - (len(der_shape) - extra)
+        if missing <= 0:
+            return self.der
+        der = np.reshape(self.der, der_shape[:extra] + (1,) * missing + der_shape[extra:])
+        return np.broadcast_to(der, der_shape[:extra] + tuple(shape))
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        return Dual(self.val[index], self.der[(slice(None),) * self._direction_axes() + index])
+
+    def __len__(self):
+        return len(self.val)
+
+    def sum(self, axis=None, dtype=None, out=None, **kwargs):
+        # np.sum(x) เรียกเมธอดนี้ ผลรวมเป็นฟังก์ชันเชิงเส้น อนุพันธ์จึงเป็นผลรวมของอนุพันธ์
+        extra = self._direction_axes()
+        if extra == 0:
+            der_axis = axis
+        elif axis is None:
+            der_axis = tuple(range(extra, np.ndim(primal(self.der))))
+        else:
+            axes = axis if isinstance(axis, tuple) else (axis,)
+            der_axis = tuple(a + extra if a >= 0 else a for a in axes)
+        return Dual(np.sum(self.val, axis=axis), np.sum(self.der, axis=der_axis))
+
+    def __matmul__(self, other):
+        if isinstance(other, Dual):
+            return NotImplemented
+        return Dual(self.val @ other, self.der @ other)
+
+    def __rmatmul__(self, other):
+        # (A @ x)' = A @ x' สำหรับทุกทิศทาง
+        if np.ndim(other) == 1:
+            return Dual(other @ self.val, self.der @ other)
+        return Dual(other @ self.val, np.matmul(other, self.der[..., None])[..., 0])
+
+    def __lt__(self, other):
+        return primal(self) < primal(other)
+
+    def __le__(self, other):
+        return primal(self) <= primal(other)
+
+    def __gt__(self, other):
+        return primal(self) > primal(other)
+
+    def __ge__(self, other):
+        return primal(self) >= primal(other)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # ทำให้ np.sin(x), np.exp(x), อาร์เรย์ + Dual ฯลฯ คืนค่าเป็น Dual
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in UNARY:
+            (x,) = inputs
+            value, slope = UNARY[ufunc](x.val)
+            return Dual(value, slope * x.der)
+        if ufunc in BINARY:
+            a, b = inputs
+            name, reflected = BINARY[ufunc]
+            if isinstance(a, Dual):
+                return getattr(a, name)(b)
+            return getattr(b, reflected)(a)
+        return NotImplemented
+
+
+# ฟังก์ชัน -> (ค่า, อนุพันธ์ของฟังก์ชัน) ที่จุด v (v อาจเป็น Dual ถ้าซ้อนกัน)
+UNARY = {
+    np.sin: lambda v: (np.sin(v), np.cos(v)),
+    np.cos: lambda v: (np.cos(v), -np.sin(v)),
+    np.tan: lambda v: (np.tan(v), 1 + np.tan(v) ** 2),
+    np.sqrt: lambda v: (np.sqrt(v), 0.5 / np.sqrt(v)),
+    np.exp: lambda v: (np.exp(v), np.exp(v)),
+    np.log: lambda v: (np.log(v), 1 / v),
+    np.absolute: lambda v: (np.abs(v), np.sign(v)),
+    np.sign: lambda v: (np.sign(v), 0.0),
+    np.square: lambda v: (v * v, 2 * v),
+    np.negative: lambda v: (-v, -1.0),
+    np.positive: lambda v: (v, 1.0),
+}
+
+BINARY = {
+    np.add: ("__add__", "__radd__"),
+    np.subtract: ("__sub__", "__rsub__"),
+    np.multiply: ("__mul__", "__rmul__"),
+    np.true_divide: ("__truediv__", "__rtruediv__"),
+    np.power: ("__pow__", "__rpow__"),
+    np.matmul: ("__matmul__", "__rmatmul__"),
+}
+
+
+def primal(x):
+    """
+    ค่าจริงของ x (ตัด ε ทุกชั้นออก)
+    """
+    while isinstance(x, Dual):
+        x = x.val
+    return x
+
+
+def seed(x, order=1):
+    """
+    ตัวแปรต้น x ในรูปจำนวนคู่ (อนุพันธ์ dx/dx = 1) ซ้อนกัน order ชั้น
+    (x + ε₁ + ε₂ + ... โดยแต่ละ εₖ² = 0 ใช้หาอนุพันธ์ได้ถึงอันดับ order)
+    """
+    one = 1.0
+    if np.ndim(x):
+        x = np.asarray(x, dtype=float)
+        one = np.ones_like(x)
+    for _ in range(order):
+        x = Dual(x, one)
+    return x
+
+
+def value_and_derivative(func, x):
+    """
+    คำนวณ f(x) และ f'(x) ด้วยการเรียก func เพียงครั้งเดียว
+
+    พารามิเตอร์:
+    func: ฟังก์ชัน f(x) ที่เขียนด้วย + - * / ** และฟังก์ชันของ numpy
+    x: ค่าเดียว หรืออาร์เรย์ (ได้อนุพันธ์ของแต่ละจุด func ต้องคำนวณทีละสมาชิก)
+
+    คืนค่า: (fx, dfx)
+
+    หมายเหตุ:
+    - อนุพันธ์ถูกต้องถึงระดับการปัดเศษ ต่างจากผลต่างสืบเนื่อง (f(x+h) - f(x))/h ที่เสียทศนิยมไปประมาณครึ่งหนึ่ง
+    """
+    y = func(seed(x))
+    if isinstance(y, Dual):
+        return y.val, y.der
+    # f ไม่ขึ้นกับ x (ค่าคงที่)
+    return y, np.zeros(np.shape(x)) if np.ndim(x) else 0.0
+
+
+def derivatives(func, x, order):
+    """
+    คำนวณ [f(x), f'(x), f''(x), ..., f⁽ᵒʳᵈᵉʳ⁾(x)] ด้วยการเรียก func เพียงครั้งเดียว
+
+    หมายเหตุ:
+    - ใช้จำนวนคู่ซ้อนกัน order ชั้น การเรียก func หนึ่งครั้งจึงมีค่าใช้จ่ายประมาณ 2^order เท่าของการคำนวณ f(x) ปกติ
+      เหมาะกับอันดับต่ำ (order <= 4)
+    """
+    y = func(seed(x, order))
+    result = []
+    for _ in range(order + 1):
+        result.append(primal(y))
+        # ส่วนที่ไม่ใช่ Dual ไม่ขึ้นกับ x แล้ว: อนุพันธ์อันดับถัดไปเป็น 0
+        y = y.der if isinstance(y, Dual) else (np.zeros(np.shape(x)) if np.ndim(x) else 0.0)
+    return result
+
+
+def derivative(func):
+    """
+    คืนค่าฟังก์ชัน f'(x) ของ func (คำนวณด้วยจำนวนคู่ ไม่ต้องเขียน df เอง)
+    """
+    return lambda x: value_and_derivative(func, x)[1]
+
+
+def f(x):
+    """
+    ฟังก์ชันตัวอย่าง: f(x) = x·sin(x) - eˣ/(1 + x²) + √x
+    """
+    return x * np.sin(x) - np.exp(x) / (1 + x**2) + np.sqrt(x)
+
+
+def df(x):
+    """
+    อนุพันธ์ของ f(x) ที่เขียนด้วยมือ (สำหรับตรวจสอบ)
+    """
+    return (np.sin(x) + x * np.cos(x) - np.exp(x) * (1 - x)**2 / (1 + x**2)**2
+            + 0.5 / np.sqrt(x))
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบการหาอนุพันธ์อัตโนมัติ
+    """
+    try:
+        x = 1.3
+        h = 1e-5
+        fx, dfx = value_and_derivative(f, x)
+        fd = (f(x + h) - f(x)) / h
+
+        print("f(x) = x·sin(x) - eˣ/(1 + x²) + √x")
+        print(f"x = {x}")
+        print(f"f(x)                  = {fx:.15f}")
+        print(f"f'(x) จากจำนวนคู่     = {dfx:.15f} (ผิดจากสูตร {abs(dfx - df(x)):.2e})")
+        print(f"f'(x) จากผลต่าง h={h} = {fd:.15f} (ผิดจากสูตร {abs(fd - df(x)):.2e})")
+
+        xs = np.linspace(0.5, 3.0, 1_000_000)
+        _, dfxs = value_and_derivative(f, xs)
+        print(f"\nอาร์เรย์ {xs.size:,} จุด: ความคลาดเคลื่อนสูงสุดเทียบกับสูตร = {np.max(np.abs(dfxs - df(xs))):.2e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
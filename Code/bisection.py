@@ -4,6 +4,12 @@
 """
 
 import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from evaluation import CountedFunction, check_bracket, counting, last_step, print_trace, solve_report
 
 
 def f(x):
@@ -14,7 +20,52 @@ def f(x):
     return x**3 - 4*x - 9
 
 
-def bisection(a, b, tol=1e-6, max_iter=100):
+BisectionStep = namedtuple("BisectionStep", "i a b c fc")
+
+
+def iter_bisection(a, b, tol=1e-6, max_iter=100, func=None):
+    """
+    วิธีการแบ่งครึ่งแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+    
+    พารามิเตอร์: เหมือน bisection
+    
+    คืนค่า: BisectionStep(i, a, b, c, fc) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    ข้อมูลนำเข้าที่ผิด (เช่นช่วงที่ไม่คร่อมราก) โยน error ทันทีที่เรียก ไม่ใช่ตอนเริ่มวนรอบ
+    """
+    if func is None:
+        func = f
+
+    # ตรวจสอบเงื่อนไขการมีรากในช่วง
+    fa = func(a)
+    fb = func(b)
+    
+    check_bracket(fa, fb)
+    
+    def steps(a, b, fa, fb):
+        # วนรอบเพื่อหาราก
+        for i in range(1, max_iter + 1):
+            # หาจุดกึ่งกลาง
+            c = (a + b) / 2
+            fc = func(c)
+            
+            yield BisectionStep(i, a, b, c, fc)
+            
+            # ตรวจสอบว่าเจอรากแล้วหรือไม่
+            if abs(fc) < tol or abs(b - a) < tol:
+                return
+            
+            # ปรับช่วงตามค่าของ f(c)
+            if fa * fc < 0:
+                b = c
+                fb = fc
+            else:
+                a = c
+                fa = fc
+
+    return steps(a, b, fa, fb)
+
+
+def bisection(a, b, tol=1e-6, max_iter=100, func=None, verbose=False, report=False):
     """
     วิธีการแบ่งครึ่งสำหรับหารากของสมการ
     
@@ -22,44 +73,91 @@ def bisection(a, b, tol=1e-6, max_iter=100):
     a, b: ช่วงเริ่มต้น [a, b] ที่มีรากอยู่ระหว่าง (f(a)*f(b) < 0)
     tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
     max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+    report: คืนค่าเป็น SolveReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
     
     คืนค่า: ค่ารากโดยประมาณ
+    ถ้า report=True คืน SolveReport(root, iterations, evaluations, per_iteration, elapsed)
+    (evaluations คือจำนวนครั้งที่เรียก f(x) ในการหารากครั้งนี้, per_iteration คือจำนวนต่อรอบ)
     """
-    # ตรวจสอบเงื่อนไขการมีรากในช่วง
-    fa = f(a)
-    fb = f(b)
-    
-    if fa * fb > 0:
-        raise ValueError("ต้องมี f(a)*f(b) < 0 เพื่อให้แน่ใจว่ามีรากในช่วง [a,b]")
-    
-    print("วิธีการแบ่งครึ่ง")
-    print("รอบ\t      a\t\t      b\t\t      c\t\t    f(c)")
-    print("-" * 70)
-    
-    # วนรอบเพื่อหาราก
+    if func is None:
+        func = f
+    counted, calls_before = counting(func, report)
+    start = time.perf_counter()
+    steps = iter_bisection(a, b, tol, max_iter, counted)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีการแบ่งครึ่ง", "รอบ\t      a\t\t      b\t\t      c\t\t    f(c)",
+            lambda s: f"{s.i:3d}\t{s.a:.10f}\t{s.b:.10f}\t{s.c:.10f}\t{s.fc:.6e}", 70, counted)
+    else:
+        step = last_step(steps)
+    root = step.c if step is not None else None
+    if report:
+        return solve_report(root, step.i if step is not None else 0, counted, calls_before, start)
+    return root
+
+
+def bisection_batch(a, b, tol=1e-6, max_iter=100, func=None):
+    """
+    วิธีการแบ่งครึ่งแบบหลายช่วงพร้อมกัน (vectorized)
+
+    พารามิเตอร์:
+    a, b: อาร์เรย์ของช่วงเริ่มต้น (ขนาดเท่ากัน) แต่ละคู่ [a_k, b_k] คือหนึ่งช่วง
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) (default: f)
+
+    คืนค่า: (roots, iterations, converged) โดยที่
+    - roots: อาร์เรย์ค่ารากโดยประมาณของแต่ละช่วง
+    - iterations: อาร์เรย์จำนวนรอบที่ใช้ของแต่ละช่วง
+    - converged: อาร์เรย์ bool บอกว่าช่วงนั้นลู่เข้าภายใน max_iter หรือไม่
+
+    หมายเหตุ:
+    - func ต้องรับอาร์เรย์ได้ (ใช้ตัวดำเนินการของ numpy)
+    - ช่วงที่ f(a)*f(b) > 0 จะไม่ทำให้ทั้งชุดล้มเหลว แต่ได้ root = nan และ converged = False
+    - แต่ละช่วงหยุดเองเมื่อลู่เข้า รอบถัดไปคำนวณเฉพาะช่วงที่ยังไม่ลู่เข้า
+    """
+    if func is None:
+        func = f
+
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+    fa = np.asarray(func(a), dtype=float)
+    fb = np.asarray(func(b), dtype=float)
+
+    roots = np.full(a.size, np.nan)
+    iterations = np.zeros(a.size, dtype=int)
+    converged = np.zeros(a.size, dtype=bool)
+
+    # เก็บเฉพาะดัชนีของช่วงที่ยังต้องคำนวณต่อ
+    active = np.flatnonzero(fa * fb <= 0)
+    a, b, fa = a[active], b[active], fa[active]
+
     for i in range(1, max_iter + 1):
-        # หาจุดกึ่งกลาง
+        if active.size == 0:
+            break
+
         c = (a + b) / 2
-        fc = f(c)
-        
-        # แสดงผลลัพธ์แต่ละรอบ
-        print(f"{i:3d}\t{a:.10f}\t{b:.10f}\t{c:.10f}\t{fc:.6e}")
-        
-        # ตรวจสอบว่าเจอรากแล้วหรือไม่
-        if abs(fc) < tol or abs(b - a) < tol:
-            print("-" * 70)
-            return c
-        
-        # ปรับช่วงตามค่าของ f(c)
-        if fa * fc < 0:
-            b = c
-            fb = fc
-        else:
-            a = c
-            fa = fc
-    
-    print("-" * 70)
-    return c
+        fc = np.asarray(func(c), dtype=float)
+        roots[active] = c
+        iterations[active] = i
+
+        # ช่วงที่เจอรากแล้วถูกตัดออกจากการคำนวณรอบถัดไป
+        done = (np.abs(fc) < tol) | (np.abs(b - a) < tol)
+        converged[active[done]] = True
+
+        keep = ~done
+        active, a, b, c, fa, fc = active[keep], a[keep], b[keep], c[keep], fa[keep], fc[keep]
+
+        # ปรับช่วงตามเครื่องหมายของ f(a)*f(c)
+        left = fa * fc < 0
+        b = np.where(left, c, b)
+        a = np.where(left, a, c)
+        fa = np.where(left, fa, fc)
+
+    return roots, iterations, converged
 
 
 def main():
@@ -76,8 +174,8 @@ def main():
         print(f"ค่าความคลาดเคลื่อนที่ยอมรับ: {tolerance}")
         print()
         
-        # เรียกใช้วิธีการแบ่งครึ่ง
-        root = bisection(a, b, tol=tolerance)
+        # เรียกใช้วิธีการแบ่งครึ่ง (ห่อ f เพื่อนับจำนวนครั้งที่เรียก)
+        root = bisection(a, b, tol=tolerance, func=CountedFunction(f), verbose=True)
         
         print(f"\nรากของสมการคือ x ≈ {root:.10f}")
         print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
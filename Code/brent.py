@@ -0,0 +1,180 @@
+"""
+วิธีของเบรนต์ (Brent's Method)
+สำหรับหาค่ารากของสมการ f(x) = 0
+"""
+
+import math
+import time
+from collections import namedtuple
+
+from evaluation import CountedFunction, check_bracket, counting, last_step, print_trace, solve_report
+
+# ความละเอียดของเลขทศนิยม (machine epsilon)
+EPS = 2.220446049250313e-16
+
+
+def f(x):
+    """
+    ฟังก์ชันที่ต้องการหาราก
+    ตัวอย่าง: f(x) = x³ - 4x - 9
+    """
+    return x**3 - 4*x - 9
+
+
+BrentStep = namedtuple("BrentStep", "i s fs b c method")
+
+
+def iter_brent(a, b, tol=1e-6, max_iter=100, func=None):
+    """
+    วิธีของเบรนต์แบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน brent
+
+    คืนค่า: BrentStep(i, s, fs, b, c, method) ของแต่ละรอบ โดยที่
+    - s, fs: จุดที่คำนวณในรอบนี้และค่า f(s)
+    - b: ค่าประมาณที่ดีที่สุดหลังจบรอบ (รอบสุดท้ายคือคำตอบ)
+    - c: จุดอีกด้านของราก
+    - method: "bisection", "secant" หรือ "IQI"
+    ถ้าจุดปลายเป็นรากอยู่แล้วจะได้รอบที่ 0 (method = "initial") เพียงรอบเดียว
+    ข้อมูลนำเข้าที่ผิด (เช่นช่วงที่ไม่คร่อมราก) โยน error ทันทีที่เรียก ไม่ใช่ตอนเริ่มวนรอบ
+    """
+    if func is None:
+        func = f
+
+    # ตรวจสอบเงื่อนไขการมีรากในช่วง
+    fa = func(a)
+    fb = func(b)
+
+    check_bracket(fa, fb)
+
+    def steps(a, b, fa, fb):
+        # b คือค่าประมาณที่ดีที่สุด c คือจุดอีกด้านของราก (f(b)*f(c) <= 0)
+        # d คือขนาดก้าวล่าสุด e คือขนาดก้าวก่อนหน้านั้น
+        c, fc = a, fa
+        d = e = b - a
+        s, fs, method = b, fb, "initial"
+
+        # วนรอบเพื่อหาราก
+        for i in range(0, max_iter + 1):
+            if fb * fc > 0:
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol1 = 2 * EPS * abs(b) + 0.5 * tol
+            xm = 0.5 * (c - b)
+
+            # ตรวจสอบว่าเจอรากแล้วหรือไม่
+            converged = abs(xm) <= tol1 or abs(fb) < tol
+            if i > 0 or converged:
+                yield BrentStep(i, s, fs, b, c, method)
+            if converged or i == max_iter:
+                return
+
+            method = "bisection"
+            if abs(e) >= tol1 and abs(fa) > abs(fb):
+                r = fb / fa
+                if a == c:
+                    # วิธีคอร์ดจากสองจุด a, b
+                    p = 2 * xm * r
+                    q = 1 - r
+                    kind = "secant"
+                else:
+                    # ประมาณค่าแบบกำลังสองผกผันจากสามจุด a, b, c
+                    q = fa / fc
+                    t = fb / fc
+                    p = r * (2 * xm * q * (q - t) - (b - a) * (t - 1))
+                    q = (q - 1) * (t - 1) * (r - 1)
+                    kind = "IQI"
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+
+                # ยอมรับก้าวจากการประมาณค่า เฉพาะเมื่อยังอยู่ในช่วงและหดเร็วพอ
+                if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                    e = d
+                    d = p / q
+                    method = kind
+                else:
+                    d = e = xm
+            else:
+                d = e = xm
+
+            a, fa = b, fb
+            s = b + (d if abs(d) > tol1 else math.copysign(tol1, xm))
+            fs = func(s)
+            b, fb = s, fs
+
+    return steps(a, b, fa, fb)
+
+
+def brent(a, b, tol=1e-6, max_iter=100, func=None, verbose=False, report=False):
+    """
+    วิธีของเบรนต์สำหรับหารากของสมการ
+
+    พารามิเตอร์:
+    a, b: ช่วงเริ่มต้น [a, b] ที่มีรากอยู่ระหว่าง (f(a)*f(b) < 0)
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+    report: คืนค่าเป็น SolveReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
+
+    คืนค่า: ค่ารากโดยประมาณ
+    ถ้า report=True คืน SolveReport(root, iterations, evaluations, per_iteration, elapsed)
+    (evaluations คือจำนวนครั้งที่เรียก f(x) ในการหารากครั้งนี้, per_iteration คือจำนวนต่อรอบ)
+
+    หมายเหตุ:
+    - ผสมวิธีแบ่งครึ่ง วิธีคอร์ด และการประมาณค่าในช่วงแบบกำลังสองผกผัน (inverse quadratic interpolation)
+    - ช่วง [a, b] คร่อมรากตลอด จึงปลอดภัยเท่าวิธีแบ่งครึ่ง แต่ใช้จำนวนรอบน้อยกว่ามาก
+    - ทุกรอบเรียก f(x) เพียงครั้งเดียว
+    """
+    if func is None:
+        func = f
+    counted, calls_before = counting(func, report)
+    start = time.perf_counter()
+    steps = iter_brent(a, b, tol, max_iter, counted)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีของเบรนต์ (Brent's Method)",
+            "รอบ\t      s\t\t    f(s)\t\t      b\t\t      c\t\tวิธี",
+            lambda s: f"{s.i:3d}\t{s.s:.10f}\t{s.fs:.6e}\t{s.b:.10f}\t{s.c:.10f}\t{s.method}", 90, counted)
+    else:
+        step = last_step(steps)
+    root = step.b if step is not None else None
+    if report:
+        return solve_report(root, step.i if step is not None else 0, counted, calls_before, start)
+    return root
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบวิธีของเบรนต์
+    """
+    try:
+        # กำหนดช่วงเริ่มต้นที่มีรากอยู่ระหว่าง
+        a = 2.0
+        b = 3.0
+        tolerance = 1e-6
+
+        print(f"หารากของสมการ f(x) = x³ - 4x - 9 ในช่วง [{a}, {b}]")
+        print(f"ค่าความคลาดเคลื่อนที่ยอมรับ: {tolerance}")
+        print()
+
+        # เรียกใช้วิธีของเบรนต์ (ห่อ f เพื่อนับจำนวนครั้งที่เรียก)
+        root = brent(a, b, tol=tolerance, func=CountedFunction(f), verbose=True)
+
+        print(f"\nรากของสมการคือ x ≈ {root:.10f}")
+        print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
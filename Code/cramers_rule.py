@@ -3,52 +3,601 @@
 สำหรับแก้ระบบสมการเชิงเส้น Ax = b
 """
 
+import hashlib
+import time
+from collections import OrderedDict
+from fractions import Fraction
+from math import lcm
+
 import numpy as np
 
+try:
+    from scipy.linalg import lapack
+except ImportError:
+    # ไม่มี SciPy: lu_factor และ lu_solve ใช้ numpy แทน LAPACK
+    lapack = None
+
+
+def lu_factor(A):
+    """
+    แยกตัวประกอบ PA = LU ด้วยการสลับแถว (partial pivoting)
+    
+    พารามิเตอร์:
+    A: เมทริกซ์จัตุรัส (n x n)
+    
+    คืนค่า: (LU, piv, sign) โดยที่
+    - LU: เมทริกซ์เดียวที่เก็บ L (ใต้เส้นทแยง, เส้นทแยงเป็น 1) และ U (เส้นทแยงขึ้นไป)
+    - piv: แถวที่ถูกสลับขึ้นมาเป็น pivot ในแต่ละขั้น (ขั้นที่ k สลับแถว k กับแถว piv[k] แบบเดียวกับ LAPACK)
+    - sign: +1 หรือ -1 ตามจำนวนครั้งที่สลับแถว
+    
+    หมายเหตุ:
+    - ใช้ O(n³) ครั้ง และไม่โยน error เมื่อ A เป็นเมทริกซ์เอกฐาน (pivot เป็น 0 จะทำให้ det = 0)
+    - ถ้ามี SciPy จะใช้ dgetrf ของ LAPACK ถ้าไม่มีจะกำจัดทีละคอลัมน์ด้วย numpy (ช้ากว่ามากเมื่อ n ใหญ่)
+    """
+    LU = np.array(A, dtype=float)
+    n, m = LU.shape
+    if n != m:
+        raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
+    
+    if lapack is not None:
+        LU, piv, _ = lapack.dgetrf(LU, overwrite_a=True)
+    else:
+        piv = np.arange(n)
+        for k in range(n - 1):
+            # เลือกแถวที่ |pivot| มากที่สุด เพื่อลดความคลาดเคลื่อน
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if p != k:
+                LU[[k, p]] = LU[[p, k]]
+                piv[k] = p
+            if LU[k, k] == 0:
+                continue
+            
+            # กำจัดค่าใต้ pivot: เก็บตัวคูณไว้ในส่วน L แล้วปรับส่วนที่เหลือทั้งบล็อกในครั้งเดียว
+            LU[k+1:, k] /= LU[k, k]
+            LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+    
+    sign = -1.0 if np.count_nonzero(piv != np.arange(n)) % 2 else 1.0
+    return LU, piv, sign
+
+
+def lu_det(LU, sign):
+    """
+    ดีเทอร์มินันต์จากผลของ lu_factor: det(A) = sign * ผลคูณเส้นทแยงของ U
+    """
+    return sign * float(np.prod(np.diag(LU)))
+
+
+def lu_solve(LU, piv, b):
+    """
+    แก้ระบบ Ax = b จากผลของ lu_factor (b เป็นเวกเตอร์ หรือเมทริกซ์ที่แต่ละคอลัมน์คือ b หนึ่งชุด)
+    ใช้ O(n²) ครั้งต่อ b หนึ่งชุด (ถ้ามี SciPy ใช้ dgetrs ของ LAPACK)
+    """
+    if lapack is not None:
+        x, _ = lapack.dgetrs(LU, piv, np.asarray(b, dtype=float))
+        return x
+    
+    y = np.array(b, dtype=float)
+    n = LU.shape[0]
+    for k in range(n):
+        if piv[k] != k:
+            y[[k, piv[k]]] = y[[piv[k], k]]
+    
+    # แทนค่าไปข้างหน้า Ly = Pb: ลบคอลัมน์ที่ k ของ L ออกจากทุกแถวที่เหลือในครั้งเดียว
+    for k in range(n - 1):
+        y[k+1:] -= np.multiply.outer(LU[k+1:, k], y[k])
+    
+    # แทนค่าย้อนกลับ Ux = y
+    for k in range(n - 1, -1, -1):
+        y[k] /= LU[k, k]
+        y[:k] -= np.multiply.outer(LU[:k, k], y[k])
+    
+    return y
+
 
-def cramers_rule(A, b):
+def cramers_rule(A, b, cache=None):
     """
     วิธีการของเครเมอร์สำหรับแก้ระบบสมการเชิงเส้น Ax = b
     
     พารามิเตอร์:
     A: เมทริกซ์สัมประสิทธิ์ (n x n)
-    b: เวกเตอร์ค่าคงที่ (n x 1)
+    b: เวกเตอร์ค่าคงที่ (n, n x 1 หรือ 1 x n) หรือเมทริกซ์ (n x k) ที่แต่ละคอลัมน์คือ b หนึ่งชุด
+    cache: FactorizationCache สำหรับใช้ผลแยกตัวประกอบของ A ซ้ำ (default: None = แยกตัวประกอบใหม่ทุกครั้ง)
     
     คืนค่า: (x, detA) โดยที่
-    - x: เวกเตอร์คำตอบ
+    - x: เวกเตอร์คำตอบ (หรือเมทริกซ์ n x k ถ้า b มี k คอลัมน์)
     - detA: ดีเทอร์มินันต์ของเมทริกซ์ A
     
     หมายเหตุ:
-    - เหมาะสำหรับระบบขนาดเล็ก (2x2, 3x3, 4x4)
+    - แยกตัวประกอบ LU ของ A เพียงครั้งเดียว ได้ทั้ง det(A) และ x รวม O(n³)
+      (แทนการหา det ของ A_i ทีละตัว ซึ่งเป็น n+1 ครั้ง รวม O(n⁴))
+    - ถ้าใช้ cache และเคยเห็น A นี้แล้ว จะเหลือเพียง O(n²) ต่อ b หนึ่งชุด
+    - det(A_i) = det(A) * x_i ดู cramer_determinants
     - ถ้า det(A) = 0 ระบบจะไม่มีคำตอบเฉพาะ
     """
     # แปลงเป็น numpy array
     A = np.array(A, dtype=float)
-    b = np.array(b, dtype=float).reshape(-1)
+    b = np.array(b, dtype=float)
+    # แถวเดียว (1 x n) ถือเป็นเวกเตอร์ b ชุดเดียวเช่นเดียวกับ (n x 1)
+    if b.ndim != 2 or b.shape[1] == 1 or (b.shape[0] == 1 and A.ndim == 2 and b.shape[1] == A.shape[0]):
+        b = b.reshape(-1)
     
     # ตรวจสอบขนาดของเมทริกซ์
     n, m = A.shape
     if n != m:
         raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
-    if b.size != n:
+    if b.shape[0] != n:
         raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
     
-    # คำนวณดีเทอร์มินันต์ของเมทริกซ์ A
-    detA = np.linalg.det(A)
+    # แยกตัวประกอบ A ครั้งเดียว แล้วหาดีเทอร์มินันต์จากเส้นทแยงของ U
+    if cache is not None:
+        LU, piv, detA = cache.factor(A)
+    else:
+        LU, piv, sign = lu_factor(A)
+        detA = lu_det(LU, sign)
     if abs(detA) < 1e-10:
         raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ (ไม่สามารถใช้วิธีเครเมอร์ได้)")
     
-    # สร้างเวกเตอร์คำตอบ
-    x = np.zeros(n, dtype=float)
+    # x_i = det(A_i) / det(A) คือคำตอบของ Ax = b จึงได้จากการแทนค่าด้วย LU เดิม
+    x = lu_solve(LU, piv, b)
+    
+    return x, detA
+
+
+class FactorizationCache:
+    """
+    ที่เก็บผลแยกตัวประกอบ LU และ det(A) ของเมทริกซ์ที่เคยแก้แล้ว สำหรับ A เดิมที่มาพร้อม b หลายชุด
+
+    พารามิเตอร์:
+    max_entries: จำนวนเมทริกซ์สูงสุดที่จำไว้ (default: 32)
+    max_bytes: หน่วยความจำสูงสุดของผลแยกตัวประกอบที่จำไว้ (default: 256 MB)
+
+    แอตทริบิวต์:
+    hits: จำนวนครั้งที่ใช้ผลแยกตัวประกอบที่จำไว้
+    misses: จำนวนครั้งที่ต้องแยกตัวประกอบใหม่
+    nbytes: หน่วยความจำที่ใช้อยู่ (ไบต์)
+
+    หมายเหตุ:
+    - ระบุ A ด้วย hash (BLAKE2b) ของขนาดและไบต์ของ A จึงไม่ต้องเก็บสำเนาของ A
+    - เมื่อเกิน max_entries หรือ max_bytes จะลบเมทริกซ์ที่ไม่ได้ใช้นานที่สุดออกก่อน (LRU)
+    - เมทริกซ์ที่ผลแยกตัวประกอบใหญ่กว่า max_bytes จะคำนวณได้ตามปกติแต่ไม่ถูกจำไว้
+    - การ hash A ใช้ O(n²) แต่ช้าพอ ๆ กับ dgetrf ของ LAPACK เมื่อ n ประมาณ 50-500
+      เมื่อมี SciPy จึงเร็วขึ้นชัดเจนตั้งแต่ n ≈ 1000 (ประมาณ 1.5 เท่าที่ n = 1000, 2.5 เท่าที่ n = 2000)
+      ถ้าไม่มี SciPy การแยกตัวประกอบด้วย numpy ช้ากว่า hash มาก จึงคุ้มตั้งแต่ n เล็ก
+    """
+
+    def __init__(self, max_entries=32, max_bytes=256 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def key(A):
+        """
+        คืนค่า key ของเมทริกซ์ A (ขนาด และ hash ของไบต์)
+        """
+        A = np.ascontiguousarray(A, dtype=float)
+        return A.shape, hashlib.blake2b(A, digest_size=16).digest()
+
+    def factor(self, A):
+        """
+        คืนค่า (LU, piv, detA) ของ A จากที่จำไว้ หรือแยกตัวประกอบใหม่ถ้ายังไม่เคยเห็น A นี้
+        """
+        key = self.key(A)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        LU, piv, sign = lu_factor(A)
+        entry = (LU, piv, lu_det(LU, sign))
+        size = LU.nbytes + piv.nbytes
+        if size <= self.max_bytes:
+            self._entries[key] = entry
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (old_LU, old_piv, _) = self._entries.popitem(last=False)
+                self.nbytes -= old_LU.nbytes + old_piv.nbytes
+        return entry
+
+    def solve(self, A, b):
+        """
+        แก้ระบบ Ax = b ด้วยผลแยกตัวประกอบที่จำไว้ (เหมือน cramers_rule(A, b, cache=self))
+        """
+        return cramers_rule(A, b, cache=self)
+
+    def __contains__(self, A):
+        return self.key(A) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        ล้างผลแยกตัวประกอบที่จำไว้และตัวนับ
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+
+def cramer_determinants(A, b):
+    """
+    คืนค่า (detA, detAi) โดยที่ detAi[i] = det(A_i) ของเมทริกซ์ที่แทนคอลัมน์ที่ i ด้วย b
     
-    # คำนวณค่า x_i สำหรับแต่ละตัวแปร
-    for i in range(n):
-        # สร้างเมทริกซ์ A_i โดยแทนที่คอลัมน์ที่ i ด้วยเวกเตอร์ b
+    หมายเหตุ:
+    - จากกฎของเครเมอร์ x_i = det(A_i) / det(A) จึงได้ det(A_i) = det(A) * x_i
+      โดยใช้การแยกตัวประกอบ LU เพียงครั้งเดียว
+    """
+    x, detA = cramers_rule(A, b)
+    return detA, detA * x
+
+
+class UpdatableSystem:
+    """
+    ระบบ Ax = b ที่แก้ไข A ทีละน้อย (rank-1 update) ได้โดยไม่ต้องแยกตัวประกอบใหม่ทุกครั้ง
+
+    พารามิเตอร์:
+    A: เมทริกซ์สัมประสิทธิ์เริ่มต้น (n x n)
+    b: เวกเตอร์ค่าคงที่ (n ค่า)
+    max_updates: จำนวนการแก้ไขสูงสุดก่อนแยกตัวประกอบใหม่ (default: 50)
+    tol: แยกตัวประกอบใหม่เมื่อ ||b - Ax|| > tol·||b|| (default: 1e-8)
+
+    แอตทริบิวต์:
+    A, b: ระบบปัจจุบัน (ห้ามแก้ไขโดยตรง ให้ใช้ update_* หรือ set_b)
+    x: คำตอบปัจจุบัน
+    detA: ดีเทอร์มินันต์ของ A ปัจจุบัน
+    updates: จำนวนการแก้ไขตั้งแต่แยกตัวประกอบครั้งล่าสุด
+    refactors: จำนวนครั้งที่แยกตัวประกอบใหม่ (ไม่นับครั้งแรก)
+
+    หมายเหตุ:
+    - A ← A + uvᵀ ใช้ O(n²): det จาก matrix determinant lemma det(A + uvᵀ) = det(A)·(1 + vᵀA⁻¹u)
+      และ x จาก Sherman-Morrison x ← x - w·(vᵀx)/(1 + vᵀw) โดย w = A⁻¹u
+    - A⁻¹u ได้จาก LU ครั้งล่าสุด แล้วปรับด้วยการแก้ไขที่สะสมไว้ k ครั้ง ใช้ O(n² + kn)
+    - ถ้าการแก้ไขทำให้ A เป็นเมทริกซ์เอกฐาน จะโยน ValueError และระบบคงเดิม
+    """
+
+    def __init__(self, A, b, max_updates=50, tol=1e-8):
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).reshape(-1)
+        n, m = A.shape
+        if n != m:
+            raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
+        if b.size != n:
+            raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
+        self.max_updates = max_updates
+        self.tol = tol
+        self.b = b
+        self.refactors = -1
+        self._refactor(A)
+
+    def _refactor(self, A):
+        LU, piv, sign = lu_factor(A)
+        detA = lu_det(LU, sign)
+        if abs(detA) < 1e-10:
+            raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ (ไม่สามารถใช้วิธีเครเมอร์ได้)")
+        self.A = A
+        self.detA = detA
+        self._LU, self._piv = LU, piv
+        # การแก้ไขที่สะสมไว้: (w, v, 1 + vᵀw) ของแต่ละครั้ง
+        self._corrections = []
+        self.x = lu_solve(LU, piv, self.b)
+        self.updates = 0
+        self.refactors += 1
+
+    def refactor(self):
+        """
+        แยกตัวประกอบ A ปัจจุบันใหม่ แล้วล้างการแก้ไขที่สะสมไว้
+        """
+        self._refactor(self.A)
+        return self.x, self.detA
+
+    def _apply_inverse(self, r):
+        # A⁻¹r = A₀⁻¹r ตามด้วย Sherman-Morrison ของแต่ละการแก้ไขตามลำดับ
+        y = lu_solve(self._LU, self._piv, r)
+        for w, v, denom in self._corrections:
+            y -= w * ((v @ y) / denom)
+        return y
+
+    def solve(self, b):
+        """
+        แก้ระบบ Ax = b สำหรับ b ชุดใหม่ ด้วย A ปัจจุบัน โดยไม่เปลี่ยน self.b ใช้ O(n² + kn)
+        """
+        b = np.array(b, dtype=float).reshape(-1)
+        if b.size != self.b.size:
+            raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
+        return self._apply_inverse(b)
+
+    def set_b(self, b):
+        """
+        เปลี่ยนเวกเตอร์ b ของระบบ แล้วคืนค่า (x, detA)
+        """
+        self.x = self.solve(b)
+        self.b = np.array(b, dtype=float).reshape(-1)
+        return self.x, self.detA
+
+    def rank_one_update(self, u, v):
+        """
+        แก้ไข A ← A + uvᵀ แล้วคืนค่า (x, detA) ของระบบใหม่
+
+        หมายเหตุ:
+        - แยกตัวประกอบใหม่เมื่อแก้ไขครบ max_updates ครั้ง, 1 + vᵀw ใกล้ 0 (ผลหารไม่เสถียร)
+          หรือ ||b - Ax|| เกิน tol·||b||
+        """
+        u = np.array(u, dtype=float).reshape(-1)
+        v = np.array(v, dtype=float).reshape(-1)
+        A_new = self.A + np.outer(u, v)
+
+        w = self._apply_inverse(u)
+        denom = 1.0 + v @ w
+        if self.updates + 1 > self.max_updates or abs(denom) < 1e-8:
+            self._refactor(A_new)
+            return self.x, self.detA
+
+        detA = self.detA * denom
+        if abs(detA) < 1e-10:
+            raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ (ไม่สามารถใช้วิธีเครเมอร์ได้)")
+
+        self.A = A_new
+        self.detA = detA
+        self.x = self.x - w * ((v @ self.x) / denom)
+        self._corrections.append((w, v, denom))
+        self.updates += 1
+
+        # ความคลาดเคลื่อนสะสมจากการแก้ไขหลายครั้ง ตรวจด้วย residual (O(n²) เท่ากับการแก้ไขหนึ่งครั้ง)
+        norm_b = np.linalg.norm(self.b)
+        if np.linalg.norm(self.b - self.A @ self.x) > self.tol * (norm_b if norm_b > 0 else 1.0):
+            self._refactor(self.A)
+        return self.x, self.detA
+
+    def update_entry(self, i, j, value):
+        """
+        เปลี่ยน A[i, j] เป็น value
+        """
+        u = np.zeros(self.b.size)
+        u[i] = value - self.A[i, j]
+        v = np.zeros(self.b.size)
+        v[j] = 1.0
+        return self.rank_one_update(u, v)
+
+    def update_row(self, i, row):
+        """
+        เปลี่ยนแถวที่ i ของ A เป็น row
+        """
+        u = np.zeros(self.b.size)
+        u[i] = 1.0
+        return self.rank_one_update(u, np.asarray(row, dtype=float) - self.A[i])
+
+    def update_column(self, j, column):
+        """
+        เปลี่ยนคอลัมน์ที่ j ของ A เป็น column
+        """
+        v = np.zeros(self.b.size)
+        v[j] = 1.0
+        return self.rank_one_update(np.asarray(column, dtype=float) - self.A[:, j], v)
+
+
+def det_small(A):
+    """
+    ดีเทอร์มินันต์ของเมทริกซ์หลายตัวพร้อมกัน ด้วยสูตรปิด (closed form) สำหรับ n <= 4
+    
+    พารามิเตอร์:
+    A: อาร์เรย์ขนาด (N, n, n) โดย n = 1, 2, 3 หรือ 4
+    
+    คืนค่า: อาร์เรย์ขนาด (N,) ของ det(A[k])
+    
+    หมายเหตุ:
+    - n = 3 ใช้กฎของซาร์รัส (Sarrus)
+    - n = 4 กระจายโคแฟกเตอร์แบบ Laplace ด้วยไมเนอร์ 2x2 ของสองแถวบนและสองแถวล่าง
+    """
+    n = A.shape[-1]
+    if n == 1:
+        return A[:, 0, 0].copy()
+    if n == 2:
+        return A[:, 0, 0] * A[:, 1, 1] - A[:, 0, 1] * A[:, 1, 0]
+    if n == 3:
+        a, b, c = A[:, 0, 0], A[:, 0, 1], A[:, 0, 2]
+        d, e, f = A[:, 1, 0], A[:, 1, 1], A[:, 1, 2]
+        g, h, i = A[:, 2, 0], A[:, 2, 1], A[:, 2, 2]
+        return a*e*i + b*f*g + c*d*h - c*e*g - b*d*i - a*f*h
+    if n == 4:
+        # ไมเนอร์ 2x2 ของแถว 0,1 (s) และแถว 2,3 (c) สำหรับแต่ละคู่คอลัมน์
+        m = lambda r, i, j: A[:, r, i] * A[:, r+1, j] - A[:, r, j] * A[:, r+1, i]
+        return (m(0, 0, 1) * m(2, 2, 3) - m(0, 0, 2) * m(2, 1, 3) + m(0, 0, 3) * m(2, 1, 2)
+                + m(0, 1, 2) * m(2, 0, 3) - m(0, 1, 3) * m(2, 0, 2) + m(0, 2, 3) * m(2, 0, 1))
+    raise ValueError("det_small รองรับเฉพาะ n <= 4 (ใช้ lu_factor_batch สำหรับ n ที่ใหญ่กว่า)")
+
+
+def lu_factor_batch(A):
+    """
+    แยกตัวประกอบ PA = LU ของเมทริกซ์หลายตัวพร้อมกัน (เหมือน lu_factor แต่ vectorized ตามแกน N)
+    
+    คืนค่า: (LU, piv, sign) ขนาด (N, n, n), (N, n) และ (N,)
+    
+    หมายเหตุ:
+    - วนรอบตามคอลัมน์ n รอบ แต่ละรอบคำนวณทุกระบบพร้อมกัน
+    - pivot ที่เป็น 0 (เมทริกซ์เอกฐาน) ไม่ทำให้ทั้งชุดล้มเหลว แต่ทำให้ det ของระบบนั้นเป็น 0
+    """
+    LU = np.array(A, dtype=float)
+    N, n, _ = LU.shape
+    rows = np.arange(N)
+    piv = np.tile(np.arange(n), (N, 1))
+    sign = np.ones(N)
+    
+    for k in range(n - 1):
+        # สลับแถว k กับแถวที่ |pivot| มากที่สุดของแต่ละระบบ
+        p = k + np.argmax(np.abs(LU[:, k:, k]), axis=1)
+        swap = p != k
+        if swap.any():
+            r = rows[swap]
+            LU[r, k], LU[r, p[swap]] = LU[r, p[swap]], LU[r, k].copy()
+            piv[r, k], piv[r, p[swap]] = piv[r, p[swap]], piv[r, k].copy()
+            sign[swap] = -sign[swap]
+        
+        pivot = LU[:, k, k]
+        safe = np.where(pivot == 0, 1.0, pivot)
+        factors = np.where(pivot[:, None] == 0, 0.0, LU[:, k+1:, k] / safe[:, None])
+        LU[:, k+1:, k] = factors
+        LU[:, k+1:, k+1:] -= factors[:, :, None] * LU[:, k, None, k+1:]
+    
+    return LU, piv, sign
+
+
+def lu_solve_batch(LU, piv, b):
+    """
+    แก้ระบบ A[k] x[k] = b[k] ทุก k จากผลของ lu_factor_batch (b ขนาด (N, n))
+    ระบบที่ pivot เป็น 0 จะได้ค่า inf/nan โดยไม่มีคำเตือน
+    """
+    N, n, _ = LU.shape
+    y = np.take_along_axis(np.asarray(b, dtype=float), piv, axis=1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(1, n):
+            y[:, i] -= np.einsum('kj,kj->k', LU[:, i, :i], y[:, :i])
+        for i in range(n - 1, -1, -1):
+            y[:, i] = (y[:, i] - np.einsum('kj,kj->k', LU[:, i, i+1:], y[:, i+1:])) / LU[:, i, i]
+    
+    return y
+
+
+def cramers_rule_batch(A, b, tol=1e-10):
+    """
+    วิธีการของเครเมอร์สำหรับระบบสมการเชิงเส้นหลายระบบพร้อมกัน (vectorized)
+    
+    พารามิเตอร์:
+    A: อาร์เรย์เมทริกซ์สัมประสิทธิ์ ขนาด (N, n, n)
+    b: อาร์เรย์เวกเตอร์ค่าคงที่ ขนาด (N, n) หรือ (n,) ถ้าใช้ b เดียวกันทุกระบบ
+    tol: ระบบที่ |det(A)| < tol ถือว่าเป็นเอกฐาน (default: 1e-10 เท่ากับ cramers_rule)
+    
+    คืนค่า: (x, detA, singular) โดยที่
+    - x: อาร์เรย์คำตอบ ขนาด (N, n) ระบบที่เป็นเอกฐานได้ nan
+    - detA: อาร์เรย์ดีเทอร์มินันต์ ขนาด (N,)
+    - singular: อาร์เรย์ bool บอกว่าระบบนั้นไม่มีคำตอบเฉพาะ
+    
+    หมายเหตุ:
+    - n <= 4 ใช้สูตรปิดของ det (det_small) กับ A และ A_i ทุกตัว ตามสูตร x_i = det(A_i) / det(A)
+    - n > 4 ใช้ LU แบบ batch ครั้งเดียว แล้ว det(A_i) = det(A) * x_i
+    - ระบบที่เป็นเอกฐานไม่ทำให้ทั้งชุดล้มเหลว (ต่างจาก cramers_rule ที่โยน ValueError)
+    """
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("A ต้องเป็นอาร์เรย์ขนาด (N, n, n)")
+    N, n, _ = A.shape
+    b = np.broadcast_to(np.asarray(b, dtype=float), (N, n))
+    
+    if n <= 4:
+        detA = det_small(A)
+        singular = ~np.isfinite(detA) | (np.abs(detA) < tol)
+        safe = np.where(singular, 1.0, detA)
+        
+        # ใช้บัฟเฟอร์เดียว: แทนคอลัมน์ที่ i ด้วย b แล้วคืนค่าเดิมก่อนทำคอลัมน์ถัดไป
         Ai = A.copy()
-        Ai[:, i] = b
+        x = np.empty((N, n))
+        for i in range(n):
+            Ai[:, :, i] = b
+            x[:, i] = det_small(Ai) / safe
+            Ai[:, :, i] = A[:, :, i]
+    else:
+        LU, piv, sign = lu_factor_batch(A)
+        detA = sign * np.prod(np.diagonal(LU, axis1=1, axis2=2), axis=1)
+        singular = ~np.isfinite(detA) | (np.abs(detA) < tol)
+        x = lu_solve_batch(LU, piv, b)
+    
+    x[singular] = np.nan
+    return x, detA, singular
+
+
+def to_rational(value):
+    """
+    แปลงค่าเป็น int หรือ Fraction แบบไม่สูญเสียความแม่นยำ
+    float ใช้ทศนิยมตามที่พิมพ์ (เช่น 0.3 -> 3/10) แทนค่าฐานสองที่เก็บในเครื่อง
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        return int(value) if value.is_integer() else Fraction(repr(value))
+    return Fraction(value)
+
+
+def cramers_rule_exact(A, b):
+    """
+    วิธีการของเครเมอร์แบบค่าแม่นยำ (exact) ด้วยการกำจัดแบบไม่มีเศษส่วน (Bareiss / Montante)
+    
+    พารามิเตอร์:
+    A: เมทริกซ์สัมประสิทธิ์ (n x n) เป็นจำนวนเต็ม (หรือ Fraction / ทศนิยม)
+    b: เวกเตอร์ค่าคงที่ (n x 1)
+    
+    คืนค่า: (x, detA) โดยที่
+    - x: list ของคำตอบแบบ Fraction (ค่าแม่นยำ)
+    - detA: ดีเทอร์มินันต์ของ A (int ถ้า A เป็นจำนวนเต็มทั้งหมด)
+    
+    หมายเหตุ:
+    - ทำ Gauss-Jordan บนเมทริกซ์แต่งเติม [A | b] ด้วยจำนวนเต็มล้วน
+      ทุกครั้งหารด้วย pivot ก่อนหน้าแบบลงตัวพอดี (//) จึงไม่มีเศษส่วนและตัวเลขไม่โตเกินขนาดของ det
+    - เมื่อจบ เส้นทแยงทุกตัวเท่ากับ ±det(A) และคอลัมน์ b กลายเป็น ±det(A_i) ของทุก i พร้อมกัน
+      รวม O(n³) การดำเนินการกับจำนวนเต็ม
+    - ตรวจ det(A) = 0 แบบแม่นยำ ไม่ขึ้นกับขนาดของตัวเลข (ต่างจาก |det(A)| < 1e-10)
+    - ถ้ามี Fraction/ทศนิยม จะคูณแต่ละแถว (ทั้ง A และ b) ด้วย ค.ร.น. ของตัวส่วนก่อน
+      ซึ่งไม่เปลี่ยนคำตอบ แล้วหาร det ด้วยตัวคูณเหล่านั้นตอนท้าย
+    """
+    rows = [[to_rational(v) for v in row] for row in A]
+    b = [to_rational(v) for v in np.asarray(b, dtype=object).reshape(-1)]
+    
+    # ตรวจสอบขนาดของเมทริกซ์
+    n = len(rows)
+    if any(len(row) != n for row in rows):
+        raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
+    if len(b) != n:
+        raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
+    
+    # สร้าง [A | b] เป็นจำนวนเต็ม โดยคูณแต่ละแถวด้วย ค.ร.น. ของตัวส่วน
+    M = []
+    scale = Fraction(1)
+    for row, bi in zip(rows, b):
+        row = row + [bi]
+        m = lcm(*(v.denominator for v in row if isinstance(v, Fraction)), 1)
+        M.append([int(v * m) for v in row])
+        scale *= m
+    
+    sign = 1
+    prev = 1
+    for k in range(n):
+        # ถ้า pivot เป็น 0 ให้สลับกับแถวด้านล่างที่ไม่เป็น 0
+        if M[k][k] == 0:
+            for r in range(k + 1, n):
+                if M[r][k] != 0:
+                    M[k], M[r] = M[r], M[k]
+                    sign = -sign
+                    break
+            else:
+                raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ (ไม่สามารถใช้วิธีเครเมอร์ได้)")
         
-        # คำนวณ x_i = det(A_i) / det(A)
-        x[i] = np.linalg.det(Ai) / detA
+        pivot_row = M[k]
+        pivot = pivot_row[k]
+        for i in range(n):
+            if i == k:
+                continue
+            row = M[i]
+            factor = row[k]
+            # ทุกแถว (ทั้งบนและล่าง) ได้ row = (pivot*row - factor*pivot_row) / prev ซึ่งหารลงตัวเสมอ
+            for j in range(n + 1):
+                if j != k:
+                    row[j] = (pivot * row[j] - factor * pivot_row[j]) // prev
+            row[k] = 0
+        prev = pivot
+    
+    # เส้นทแยงทุกตัวเท่ากับ prev = sign * det([A|b] ที่คูณแล้ว) และคอลัมน์สุดท้ายคือ sign * det(A_i)
+    detA_scaled = sign * prev
+    detA = detA_scaled / scale if scale != 1 else detA_scaled
+    x = [Fraction(M[i][n], prev) for i in range(n)]
     
     return x, detA
 
@@ -80,14 +629,64 @@ def main():
         x, detA = cramers_rule(A, b)
         
         print(f"det(A) = {detA:.6f}")
+        _, detAi = cramer_determinants(A, b)
+        print("det(A_i) = (" + ", ".join(f"{d:.6f}" for d in detAi) + ")")
         print(f"คำตอบ (x, y, z) = ({x[0]:.6f}, {x[1]:.6f}, {x[2]:.6f})")
         
+        # คำตอบแบบค่าแม่นยำ (จำนวนเต็ม/เศษส่วน ไม่มีปัดเศษ)
+        x_exact, detA_exact = cramers_rule_exact(A, b)
+        print(f"ค่าแม่นยำ: det(A) = {detA_exact}, (x, y, z) = ({', '.join(str(v) for v in x_exact)})")
+        
         # ตรวจสอบคำตอบ
         print("\nตรวจสอบคำตอบ:")
         for i in range(len(A)):
             lhs = sum(A[i][j] * x[j] for j in range(len(x)))
             print(f"สมการที่ {i+1}: {lhs:.6f} = {b[i]:.6f} (ความคลาดเคลื่อน = {abs(lhs - b[i]):.2e})")
         
+        # A เดิมกับ b หลายชุด: แยกตัวประกอบครั้งแรกครั้งเดียว รอบต่อไปเหลือ O(n²)
+        n, repeats = 1000, 20
+        rng = np.random.default_rng(0)
+        A_big = np.eye(n) + rng.uniform(-1, 1, size=(n, n)) / (2 * n)
+        rhs = rng.uniform(-1, 1, size=(repeats, n))
+        
+        start = time.perf_counter()
+        for b_k in rhs:
+            cramers_rule(A_big, b_k)
+        plain = time.perf_counter() - start
+        
+        cache = FactorizationCache()
+        start = time.perf_counter()
+        for b_k in rhs:
+            cache.solve(A_big, b_k)
+        cached = time.perf_counter() - start
+        
+        print(f"\nA ขนาด {n}x{n} กับ b {repeats} ชุด:")
+        print(f"แยกตัวประกอบใหม่ทุกครั้ง: {plain:.3f} s")
+        print(f"ใช้ FactorizationCache: {cached:.3f} s (ใช้ค่าที่จำไว้ {cache.hits} ครั้ง, "
+              f"{cache.nbytes / 2**20:.2f} MB)")
+        
+        # แก้ไข A ทีละสมาชิก: ใช้ Sherman-Morrison O(n²) แทนการแก้ระบบใหม่ O(n³)
+        edits = [(int(i), int(j), float(v)) for i, j, v in
+                 zip(rng.integers(n, size=50), rng.integers(n, size=50), rng.uniform(-1, 1, size=50))]
+        A_edit = A_big.copy()
+        start = time.perf_counter()
+        for i, j, value in edits:
+            A_edit[i, j] = value
+            x_plain, det_plain = cramers_rule(A_edit, rhs[0])
+        plain = time.perf_counter() - start
+        
+        system = UpdatableSystem(A_big, rhs[0])
+        start = time.perf_counter()
+        for i, j, value in edits:
+            x_upd, det_upd = system.update_entry(i, j, value)
+        updated = time.perf_counter() - start
+        
+        print(f"\nแก้ไขสมาชิกของ A ทีละตัว {len(edits)} ครั้ง:")
+        print(f"cramers_rule ทุกครั้ง: {plain:.3f} s")
+        print(f"UpdatableSystem: {updated:.3f} s (แยกตัวประกอบใหม่ {system.refactors} ครั้ง, "
+              f"ผลต่างของ x = {np.max(np.abs(x_upd - x_plain)):.2e}, "
+              f"ผลต่างสัมพัทธ์ของ det = {abs(det_upd - det_plain) / abs(det_plain):.2e})")
+        
     except ValueError as e:
         print(f"เกิดข้อผิดพลาด: {e}")
     except Exception as e:
@@ -0,0 +1,168 @@
+"""
+ตัวช่วยที่ใช้ร่วมกันทุกวิธีหาราก:
+ตัวนับการเรียกฟังก์ชัน (Function-Evaluation Accounting), การตรวจสอบข้อมูลนำเข้า
+และการแสดงตารางผลลัพธ์แต่ละรอบ
+"""
+
+import math
+import time
+from collections import OrderedDict, deque, namedtuple
+
+
+class CountedFunction:
+    """
+    ตัวห่อฟังก์ชัน f(x) ที่นับจำนวนครั้งที่เรียก จับเวลา และจำค่าที่เพิ่งคำนวณ
+
+    พารามิเตอร์:
+    func: ฟังก์ชันที่ต้องการห่อ
+    cache_size: จำนวนคู่ (x, f(x)) ล่าสุดที่จำไว้ (default: 8, ใส่ 0 เพื่อปิด)
+
+    แอตทริบิวต์:
+    calls: จำนวนครั้งที่เรียก func จริง
+    hits: จำนวนครั้งที่ได้ค่าจากที่จำไว้โดยไม่ต้องเรียก func
+    elapsed: เวลารวม (วินาที) ที่ใช้ใน func
+
+    หมายเหตุ:
+    - จำค่าเฉพาะ x ที่ hash ได้ (เช่น float) อาร์เรย์ numpy จะเรียก func ทุกครั้ง
+    """
+
+    def __init__(self, func, cache_size=8):
+        self.func = func
+        self.cache_size = cache_size
+        self.calls = 0
+        self.hits = 0
+        self.elapsed = 0.0
+        self._cache = OrderedDict()
+
+    def __call__(self, x):
+        try:
+            if x in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(x)
+                return self._cache[x]
+            cacheable = self.cache_size > 0
+        except TypeError:
+            cacheable = False
+
+        start = time.perf_counter()
+        fx = self.func(x)
+        self.elapsed += time.perf_counter() - start
+        self.calls += 1
+
+        if cacheable:
+            self._cache[x] = fx
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return fx
+
+    def reset(self):
+        """
+        ล้างตัวนับและค่าที่จำไว้
+        """
+        self.calls = 0
+        self.hits = 0
+        self.elapsed = 0.0
+        self._cache.clear()
+
+    def summary(self, iterations):
+        """
+        คืนค่าข้อความสรุปจำนวนการเรียก f(x) ต่อรอบ
+        """
+        per_iter = self.calls / iterations if iterations else float(self.calls)
+        return (f"เรียก f(x) {self.calls} ครั้ง ({per_iter:.2f} ครั้ง/รอบ), "
+                f"ใช้ค่าที่จำไว้ {self.hits} ครั้ง, เวลา {self.elapsed * 1e3:.3f} ms")
+
+
+SolveReport = namedtuple("SolveReport", "root iterations evaluations per_iteration elapsed")
+
+
+def counting(func, report):
+    """
+    คืนค่า (func, จำนวนครั้งที่เรียกไปแล้ว) สำหรับวิธีหารากที่ระบุ report=True
+    ห่อ func ด้วย CountedFunction ถ้ายังไม่ได้ห่อ (ถ้า report=False คืน func เดิม)
+    """
+    if not report:
+        return func, 0
+    if not isinstance(func, CountedFunction):
+        func = CountedFunction(func)
+    return func, func.calls
+
+
+def solve_report(root, iterations, func, calls_before, start):
+    """
+    สร้าง SolveReport(root, iterations, evaluations, per_iteration, elapsed) ของการหารากหนึ่งครั้ง
+
+    พารามิเตอร์:
+    root, iterations: คำตอบและจำนวนรอบ
+    func, calls_before: ผลของ counting (นับเฉพาะการเรียกในการหารากครั้งนี้)
+    start: เวลาเริ่ม (time.perf_counter())
+    """
+    evaluations = func.calls - calls_before
+    per_iteration = evaluations / iterations if iterations else float(evaluations)
+    return SolveReport(root, iterations, evaluations, per_iteration, time.perf_counter() - start)
+
+
+def print_evaluation_report(func, iterations):
+    """
+    แสดงสรุปการเรียก f(x) ถ้า func เป็น CountedFunction
+    """
+    if isinstance(func, CountedFunction):
+        print(func.summary(iterations))
+
+
+def check_bracket(fa, fb):
+    """
+    ตรวจสอบว่าช่วง [a, b] คร่อมราก (f(a)*f(b) <= 0) ถ้าไม่คร่อมจะโยน ValueError
+    """
+    if fa * fb > 0:
+        raise ValueError("ต้องมี f(a)*f(b) < 0 เพื่อให้แน่ใจว่ามีรากในช่วง [a,b]")
+
+
+def last_step(steps):
+    """
+    วนรอบ iterator จนจบโดยไม่เก็บรอบก่อนหน้า แล้วคืนค่ารอบสุดท้าย (None ถ้าไม่มีรอบเลย)
+    """
+    tail = deque(steps, maxlen=1)
+    return tail[0] if tail else None
+
+
+def print_trace(steps, title, header, row, width, func=None):
+    """
+    แสดงตารางผลลัพธ์จาก iterator ของแต่ละรอบ แล้วคืนค่ารอบสุดท้าย
+
+    พารามิเตอร์:
+    steps: iterator ของข้อมูลแต่ละรอบ (เช่นจาก iter_bisection)
+    title, header: ชื่อวิธีและหัวตาราง
+    row: ฟังก์ชันที่แปลงข้อมูลหนึ่งรอบเป็นข้อความหนึ่งบรรทัด
+    width: ความยาวเส้นคั่น
+    func: ถ้าเป็น CountedFunction จะแสดงสรุปการเรียก f(x) ท้ายตาราง
+    """
+    print(title)
+    print(header)
+    print("-" * width)
+    step = None
+    for step in steps:
+        print(row(step))
+    print("-" * width)
+    if step is not None:
+        print_evaluation_report(func, step.i)
+    return step
+
+
+def estimated_order(errors, floor=1e-13):
+    """
+    ประมาณลำดับการลู่เข้า p จากความคลาดเคลื่อน |x_{k+1} - x_k| ของแต่ละรอบ
+
+    พารามิเตอร์:
+    errors: ความคลาดเคลื่อนของแต่ละรอบตามลำดับ
+    floor: ไม่ใช้ความคลาดเคลื่อนที่น้อยกว่านี้ (ถึงระดับการปัดเศษแล้ว) (default: 1e-13)
+
+    คืนค่า: p ≈ log(e₃/e₂) / log(e₂/e₁) จากสามรอบสุดท้ายที่ใช้ได้ (nan ถ้ามีไม่ถึงสามรอบ)
+    """
+    e = [abs(err) for err in errors if abs(err) >= floor]
+    while len(e) >= 3:
+        e1, e2, e3 = e[-3:]
+        if e1 != e2:
+            return math.log(e3 / e2) / math.log(e2 / e1)
+        e.pop()
+    return float("nan")
@@ -4,6 +4,13 @@
 """
 
 import math
+import time
+from collections import namedtuple
+
+from evaluation import CountedFunction, check_bracket, counting, last_step, print_trace, solve_report
+
+# รูปแบบของวิธีจุดเท็จที่เลือกได้
+MODES = ("plain", "illinois", "pegasus", "anderson_bjorck")
 
 
 def f(x):
@@ -14,7 +21,84 @@ def f(x):
     return math.exp(-x) - x
 
 
-def false_position(a, b, tol=1e-6, max_iter=100):
+def scale_factor(mode, f_old, f_new):
+    """
+    ตัวคูณที่ใช้ลดค่า f ของจุดปลายที่ค้างอยู่ในวิธีจุดเท็จแบบปรับปรุง
+
+    พารามิเตอร์:
+    mode: "illinois", "pegasus" หรือ "anderson_bjorck"
+    f_old: ค่า f ของจุดปลายที่กำลังถูกแทนที่ (จุดประมาณรอบก่อน)
+    f_new: ค่า f ของจุดประมาณรอบนี้
+
+    คืนค่า: ตัวคูณ m (0 < m < 1)
+    """
+    if mode == "illinois":
+        return 0.5
+    if mode == "pegasus":
+        return f_old / (f_old + f_new)
+    if mode == "anderson_bjorck":
+        m = 1 - f_new / f_old
+        return m if m > 0 else 0.5
+    raise ValueError(f"ไม่รู้จักรูปแบบ '{mode}' (เลือกได้: {', '.join(MODES)})")
+
+
+FalsePositionStep = namedtuple("FalsePositionStep", "i a b xr fxr")
+
+
+def iter_false_position(a, b, tol=1e-6, max_iter=100, func=None, mode="plain"):
+    """
+    วิธีการจุดเท็จแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+    
+    พารามิเตอร์: เหมือน false_position
+    
+    คืนค่า: FalsePositionStep(i, a, b, xr, fxr) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    ข้อมูลนำเข้าที่ผิด (เช่นช่วงที่ไม่คร่อมราก) โยน error ทันทีที่เรียก ไม่ใช่ตอนเริ่มวนรอบ
+    """
+    if func is None:
+        func = f
+    if mode not in MODES:
+        raise ValueError(f"ไม่รู้จักรูปแบบ '{mode}' (เลือกได้: {', '.join(MODES)})")
+
+    # ตรวจสอบเงื่อนไขการมีรากในช่วง
+    fa = func(a)
+    fb = func(b)
+    
+    check_bracket(fa, fb)
+    
+    def steps(a, b, fa, fb):
+        # ด้านที่ถูกแทนที่ในรอบก่อน (-1 = b, 1 = a, 0 = ยังไม่มี)
+        side = 0
+        # วนรอบเพื่อหาราก
+        for i in range(1, max_iter + 1):
+            # หาจุดประมาณรากโดยใช้การสร้างเส้นตรง
+            xr = (a * fb - b * fa) / (fb - fa)
+            fxr = func(xr)
+            
+            yield FalsePositionStep(i, a, b, xr, fxr)
+            
+            # ตรวจสอบว่าเจอรากแล้วหรือไม่
+            if abs(fxr) < tol:
+                return
+            
+            # ปรับช่วงตามค่าของ f(xr)
+            # ถ้าแทนที่ด้านเดิมซ้ำ แบบปรับปรุงจะลดค่า f ของจุดปลายที่ค้างอยู่
+            if fa * fxr < 0:
+                if mode != "plain" and side == -1:
+                    fa *= scale_factor(mode, fb, fxr)
+                b = xr
+                fb = fxr
+                side = -1
+            else:
+                if mode != "plain" and side == 1:
+                    fb *= scale_factor(mode, fa, fxr)
+                a = xr
+                fa = fxr
+                side = 1
+
+    return steps(a, b, fa, fb)
+
+
+def false_position(a, b, tol=1e-6, max_iter=100, func=None, mode="plain", verbose=False, report=False):
     """
     วิธีการจุดเท็จสำหรับหารากของสมการ
     
@@ -22,49 +106,37 @@ def false_position(a, b, tol=1e-6, max_iter=100):
     a, b: ช่วงเริ่มต้น [a, b] ที่มีรากอยู่ระหว่าง (f(a)*f(b) < 0)
     tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
     max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    mode: รูปแบบของวิธี "plain", "illinois", "pegasus" หรือ "anderson_bjorck" (default: "plain")
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+    report: คืนค่าเป็น SolveReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
     
     คืนค่า: ค่ารากโดยประมาณ
+    ถ้า report=True คืน SolveReport(root, iterations, evaluations, per_iteration, elapsed)
+    (evaluations คือจำนวนครั้งที่เรียก f(x) ในการหารากครั้งนี้, per_iteration คือจำนวนต่อรอบ)
     
     หมายเหตุ:
     - ใช้การสร้างเส้นตรงระหว่างจุด (a,f(a)) และ (b,f(b)) เพื่อประมาณราก
     - มักจะเร็วกว่าวิธีการแบ่งครึ่ง
+    - แบบ plain อาจมีจุดปลายด้านหนึ่งค้างอยู่นาน (เช่นฟังก์ชันนูน) ทำให้ลู่เข้าช้า
+      แบบปรับปรุงจะลดค่า f ของจุดปลายที่ค้างซ้ำ ทำให้ลู่เข้าแบบ superlinear
     """
-    # ตรวจสอบเงื่อนไขการมีรากในช่วง
-    fa = f(a)
-    fb = f(b)
-    
-    if fa * fb > 0:
-        raise ValueError("ต้องมี f(a)*f(b) < 0 เพื่อให้แน่ใจว่ามีรากในช่วง [a,b]")
-    
-    print("วิธีการจุดเท็จ (False Position)")
-    print("รอบ\t      a\t\t      b\t\t      xr\t\t   f(xr)")
-    print("-" * 75)
-    
-    xr = None
-    # วนรอบเพื่อหาราก
-    for i in range(1, max_iter + 1):
-        # หาจุดประมาณรากโดยใช้การสร้างเส้นตรง
-        xr = (a * fb - b * fa) / (fb - fa)
-        fxr = f(xr)
-        
-        # แสดงผลลัพธ์แต่ละรอบ
-        print(f"{i:3d}\t{a:.10f}\t{b:.10f}\t{xr:.10f}\t{fxr:.6e}")
-        
-        # ตรวจสอบว่าเจอรากแล้วหรือไม่
-        if abs(fxr) < tol:
-            print("-" * 75)
-            return xr
-        
-        # ปรับช่วงตามค่าของ f(xr)
-        if fa * fxr < 0:
-            b = xr
-            fb = fxr
-        else:
-            a = xr
-            fa = fxr
-    
-    print("-" * 75)
-    return xr
+    if func is None:
+        func = f
+    counted, calls_before = counting(func, report)
+    start = time.perf_counter()
+    steps = iter_false_position(a, b, tol, max_iter, counted, mode)
+    if verbose:
+        step = print_trace(
+            steps, f"วิธีการจุดเท็จ (False Position, {mode})",
+            "รอบ\t      a\t\t      b\t\t      xr\t\t   f(xr)",
+            lambda s: f"{s.i:3d}\t{s.a:.10f}\t{s.b:.10f}\t{s.xr:.10f}\t{s.fxr:.6e}", 75, counted)
+    else:
+        step = last_step(steps)
+    root = step.xr if step is not None else None
+    if report:
+        return solve_report(root, step.i if step is not None else 0, counted, calls_before, start)
+    return root
 
 
 def main():
@@ -82,7 +154,7 @@ def main():
         print()
         
         # เรียกใช้วิธีการจุดเท็จ
-        root = false_position(a, b, tol=tolerance)
+        root = false_position(a, b, tol=tolerance, func=CountedFunction(f), verbose=True)
         
         print(f"\nรากของสมการคือ x ≈ {root:.10f}")
         print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
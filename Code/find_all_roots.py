@@ -0,0 +1,193 @@
+"""
+การหารากทั้งหมดในช่วง (Find All Roots)
+สแกนหาช่วงที่เครื่องหมายของ f(x) เปลี่ยน แล้วหารากในแต่ละช่วงด้วยวิธีแบบ Bracketing
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bisection import bisection, bisection_batch
+from brent import brent
+from false_position import false_position
+
+# วิธีที่ใช้หารากในแต่ละช่วงย่อย
+SOLVERS = {
+    "bisection": bisection,
+    "false_position": false_position,
+    "brent": brent,
+}
+
+# อัตราส่วนทองคำ สำหรับค้นหาจุดต่ำสุดของ |f(x)|
+GOLDEN = (np.sqrt(5) - 1) / 2
+
+
+def f(x):
+    """
+    ฟังก์ชันที่ต้องการหาราก
+    ตัวอย่าง: f(x) = sin(3x) + (x - 1)² - 0.5 (มีหลายรากในช่วง [-2, 3])
+    """
+    return np.sin(3 * x) + (x - 1)**2 - 0.5
+
+
+def scan_brackets(func, lo, hi, n=1000, tol=1e-6, max_refine=4):
+    """
+    สุ่มค่า f(x) บนกริดแล้วหาช่วงย่อยที่มีราก
+
+    พารามิเตอร์:
+    func: ฟังก์ชันที่รับอาร์เรย์ได้
+    lo, hi: ช่วงที่ต้องการค้นหา
+    n: จำนวนช่วงย่อยของกริดเริ่มต้น (default: 1000)
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_refine: จำนวนครั้งสูงสุดที่ขยายกริดให้ละเอียดขึ้นรอบจุดที่น่าสงสัย (default: 4)
+
+    คืนค่า: (brackets, exact) โดยที่
+    - brackets: รายการช่วง (a, b) ที่ f(a)*f(b) < 0
+    - exact: รายการ x ที่ f(x) = 0 พอดี หรือเป็นรากสัมผัส (|f(x)| < tol แต่เครื่องหมายไม่เปลี่ยน)
+
+    หมายเหตุ:
+    - จุดต่ำสุดเฉพาะที่ของ |f(x)| ที่ไม่มีการเปลี่ยนเครื่องหมาย อาจซ่อนรากคู่ที่อยู่ใกล้กัน
+      หรือเป็นรากสัมผัส จึงสุ่มกริดที่ละเอียดขึ้นในบริเวณนั้นอีกครั้ง
+    """
+    brackets = []
+    exact = []
+    regions = [(lo, hi, n)]
+
+    for level in range(max_refine + 1):
+        suspects = []
+        for r_lo, r_hi, r_n in regions:
+            x = np.linspace(r_lo, r_hi, r_n + 1)
+            y = np.asarray(func(x), dtype=float)
+
+            exact.extend(x[y == 0])
+
+            # ช่วงที่เครื่องหมายเปลี่ยน
+            change = np.flatnonzero(y[:-1] * y[1:] < 0)
+            brackets.extend(zip(x[change], x[change + 1]))
+
+            # จุดต่ำสุดเฉพาะที่ของ |f| ที่เครื่องหมายไม่เปลี่ยนทั้งสองข้าง
+            ay = np.abs(y)
+            inner = np.arange(1, r_n)
+            is_min = ((ay[inner] <= ay[inner - 1]) & (ay[inner] <= ay[inner + 1])
+                      & (y[inner - 1] * y[inner] > 0) & (y[inner] * y[inner + 1] > 0))
+            for k in inner[is_min]:
+                suspects.append((x[k - 1], x[k + 1]))
+
+        if level == max_refine:
+            break
+        regions = [(a, b, 16) for a, b in suspects]
+        if not regions:
+            break
+
+    # จุดที่ยังน่าสงสัยหลังขยายกริดแล้ว ตรวจว่าเป็นรากสัมผัสหรือไม่
+    for a, b in suspects:
+        x_min = golden_section_min(func, a, b, tol)
+        if abs(float(func(np.array([x_min]))[0])) < tol:
+            exact.append(x_min)
+
+    return brackets, exact
+
+
+def golden_section_min(func, a, b, tol=1e-6, max_iter=100):
+    """
+    หาจุดต่ำสุดของ |f(x)| ในช่วง [a, b] ด้วยวิธีอัตราส่วนทองคำ
+    """
+    g = lambda x: abs(float(func(np.array([x]))[0]))
+    c = b - GOLDEN * (b - a)
+    d = a + GOLDEN * (b - a)
+    gc, gd = g(c), g(d)
+    for _ in range(max_iter):
+        if abs(b - a) < tol:
+            break
+        if gc < gd:
+            b, d, gd = d, c, gc
+            c = b - GOLDEN * (b - a)
+            gc = g(c)
+        else:
+            a, c, gc = c, d, gd
+            d = a + GOLDEN * (b - a)
+            gd = g(d)
+    return (a + b) / 2
+
+
+def refine_bracket(args):
+    """
+    หารากในช่วงย่อยหนึ่งช่วง (ใช้เป็นงานของ worker)
+    """
+    method, func, a, b, tol, max_iter = args
+    return SOLVERS[method](a, b, tol=tol, max_iter=max_iter, func=func)
+
+
+def find_all_roots(func, lo, hi, n=1000, tol=1e-6, max_iter=100, method="bisection", workers=None):
+    """
+    หารากทั้งหมดของ f(x) = 0 ในช่วง [lo, hi]
+
+    พารามิเตอร์:
+    func: ฟังก์ชันที่ต้องการหาราก (ต้องรับอาร์เรย์ numpy ได้)
+    lo, hi: ช่วงที่ต้องการค้นหา
+    n: จำนวนช่วงย่อยของกริดเริ่มต้น (default: 1000)
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุดในแต่ละช่วงย่อย (default: 100)
+    method: "bisection", "false_position", "brent" หรือ "batch" (default: "bisection")
+    workers: จำนวน process ที่ใช้หารากพร้อมกัน (default: None = ทำทีละช่วงใน process เดียว)
+
+    คืนค่า: อาร์เรย์ของรากที่เรียงจากน้อยไปมาก
+
+    หมายเหตุ:
+    - "batch" ใช้ bisection_batch หารากทุกช่วงพร้อมกันแบบ vectorized (ไม่ใช้ workers)
+    - ถ้าใช้ workers ฟังก์ชัน func ต้องประกาศไว้ระดับโมดูล (pickle ได้) ไม่ใช่ lambda
+    - รากที่ห่างกันน้อยกว่า tol จะถูกนับเป็นรากเดียว
+    """
+    if method != "batch" and method not in SOLVERS:
+        raise ValueError(f"ไม่รู้จักวิธี '{method}' (เลือกได้: batch, {', '.join(SOLVERS)})")
+
+    brackets, exact = scan_brackets(func, lo, hi, n=n, tol=tol)
+    roots = list(exact)
+
+    if brackets:
+        if method == "batch":
+            a, b = np.array(brackets).T
+            found, _, converged = bisection_batch(a, b, tol=tol, max_iter=max_iter, func=func)
+            roots.extend(found[converged])
+        else:
+            jobs = [(method, func, a, b, tol, max_iter) for a, b in brackets]
+            if workers is None or workers <= 1:
+                roots.extend(map(refine_bracket, jobs))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunksize = max(1, len(jobs) // (4 * workers))
+                    roots.extend(executor.map(refine_bracket, jobs, chunksize=chunksize))
+
+    roots = np.sort(np.array(roots, dtype=float))
+    if roots.size > 1:
+        roots = roots[np.concatenate(([True], np.diff(roots) >= tol))]
+    return roots
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบการหารากทั้งหมดในช่วง
+    """
+    try:
+        lo = -2.0
+        hi = 3.0
+        tolerance = 1e-6
+
+        print(f"หารากทั้งหมดของสมการ f(x) = sin(3x) + (x - 1)² - 0.5 ในช่วง [{lo}, {hi}]")
+        print(f"ค่าความคลาดเคลื่อนที่ยอมรับ: {tolerance}")
+        print()
+
+        roots = find_all_roots(f, lo, hi, tol=tolerance, workers=2)
+
+        print(f"พบราก {roots.size} ค่า")
+        for root in roots:
+            print(f"x ≈ {root:.10f}\tf(x) = {f(root):.6e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+วิธีของแฮลลีย์และเฮาส์โฮลเดอร์ (Halley's and Householder's Methods)
+สำหรับหาค่ารากของสมการ f(x) = 0 ด้วยอนุพันธ์อันดับสูงจากการหาอนุพันธ์อัตโนมัติ
+"""
+
+import time
+from collections import namedtuple
+from math import comb
+
+import numpy as np
+
+from autodiff import derivatives
+from evaluation import CountedFunction, estimated_order, last_step, print_trace
+
+
+def f(x):
+    """
+    ฟังก์ชันที่ต้องการหาราก
+    ตัวอย่าง: f(x) = x³ - 2x - 5
+    """
+    return x**3 - 2*x - 5
+
+
+HouseholderStep = namedtuple("HouseholderStep", "i x x_new fx dfx err")
+
+OrderReport = namedtuple("OrderReport", "order root iterations evaluations estimated_order elapsed")
+
+
+def householder_correction(fs, order):
+    """
+    คำนวณ Δx ของวิธีเฮาส์โฮลเดอร์อันดับ order จาก fs = [f, f', ..., f⁽ᵒʳᵈᵉʳ⁾]
+
+    หมายเหตุ:
+    - Δx = d·(1/f)⁽ᵈ⁻¹⁾ / (1/f)⁽ᵈ⁾ เขียนใหม่เป็น Δx = d·f·r_{d-1} / r_d โดย r_k = f^{k+1}·(1/f)⁽ᵏ⁾
+      ได้จาก r_0 = 1, r_k = -Σ_{j=1..k} C(k, j)·f⁽ʲ⁾·f^{j-1}·r_{k-j} ซึ่งไม่ต้องหารด้วย f (ไม่ล้นเมื่อ f ใกล้ 0)
+    - d = 1 คือนิวตัน -f/f', d = 2 คือแฮลลีย์ -2ff'/(2f'² - ff'')
+    """
+    fx = fs[0]
+    r = [1.0]
+    for k in range(1, order + 1):
+        r.append(-sum(comb(k, j) * fs[j] * fx ** (j - 1) * r[k - j] for j in range(1, k + 1)))
+    if r[order] == 0:
+        raise ZeroDivisionError(f"วิธีเฮาส์โฮลเดอร์อันดับ {order} ล้มเหลว: ตัวหารเป็น 0 (เช่น f'(x) = 0)")
+    return order * fx * r[order - 1] / r[order]
+
+
+def iter_householder(x0, tol=1e-6, max_iter=100, func=None, order=2):
+    """
+    วิธีของเฮาส์โฮลเดอร์แบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน householder
+
+    คืนค่า: HouseholderStep(i, x, x_new, fx, dfx, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    if func is None:
+        func = f
+    if order < 1:
+        raise ValueError("อันดับของวิธีเฮาส์โฮลเดอร์ต้องมีค่าอย่างน้อย 1")
+
+    x = x0
+
+    for i in range(1, max_iter + 1):
+        # f, f', ..., f⁽ᵈ⁾ จากการเรียก func ครั้งเดียว
+        fs = derivatives(func, x, order)
+        fx = fs[0]
+
+        # เจอรากพอดี
+        if fx == 0:
+            yield HouseholderStep(i, x, x, fx, fs[1], 0.0)
+            return
+
+        # จุดคงที่ (f' = 0) ที่ไม่ใช่ราก: ก้าวของวิธีอันดับคู่เป็น 0 พอดี ถ้าไม่ตรวจจะถือว่าลู่เข้าที่ x ผิด
+        if fs[1] == 0:
+            raise ZeroDivisionError(f"วิธีเฮาส์โฮลเดอร์อันดับ {order} ล้มเหลว: f'(x) = 0")
+        correction = householder_correction(fs, order)
+        if correction == 0:
+            raise ZeroDivisionError(f"วิธีเฮาส์โฮลเดอร์อันดับ {order} ล้มเหลว: ก้าวเป็น 0 แต่ f(x) ≠ 0")
+
+        x_new = x + correction
+        err = abs(x_new - x)
+
+        yield HouseholderStep(i, x, x_new, fx, fs[1], err)
+
+        if err < tol:
+            return
+
+        x = x_new
+
+
+def householder(x0, tol=1e-6, max_iter=100, func=None, order=2, verbose=False, report=False):
+    """
+    วิธีของเฮาส์โฮลเดอร์สำหรับหารากของสมการ
+
+    พารามิเตอร์:
+    x0: ค่าเริ่มต้นเดาของราก
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    order: อันดับ d ของวิธี (1 = นิวตัน, 2 = แฮลลีย์, ...) ลู่เข้าด้วยอันดับ d + 1 (default: 2)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบ และลำดับการลู่เข้าโดยประมาณหรือไม่ (default: False)
+    report: คืนค่าเป็น OrderReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
+
+    คืนค่า: ค่ารากโดยประมาณ หรือ OrderReport(order, root, iterations, evaluations, estimated_order, elapsed)
+    ถ้า report=True (evaluations คือจำนวนครั้งที่เรียก func ในการหารากครั้งนี้)
+
+    หมายเหตุ:
+    - ไม่ต้องเขียนอนุพันธ์เอง: f', f'', ... ได้จากจำนวนคู่ซ้อนกัน (autodiff.derivatives)
+      func ต้องใช้ฟังก์ชันของ numpy (เช่น np.sin ไม่ใช่ math.sin)
+    - เรียก func ครั้งเดียวต่อรอบ แต่ครั้งนั้นมีค่าใช้จ่ายประมาณ 2^d เท่าของ f(x) ปกติ
+      อันดับสูงจะคุ้มเมื่อลดจำนวนรอบได้มากกว่าค่าใช้จ่ายที่เพิ่มขึ้น (ดู compare_orders)
+    - โยน ZeroDivisionError เมื่อ f'(x) = 0 ที่จุดที่ไม่ใช่ราก (เหมือน newton_raphson)
+    """
+    errors = []
+    counted = func
+    if report and not isinstance(func, CountedFunction):
+        counted = CountedFunction(func if func is not None else f, cache_size=0)
+    calls_before = counted.calls if report else 0
+    start = time.perf_counter()
+
+    def record(steps):
+        for step in steps:
+            errors.append(step.err)
+            yield step
+
+    steps = record(iter_householder(x0, tol, max_iter, counted, order))
+    if verbose:
+        title = "วิธีของแฮลลีย์" if order == 2 else f"วิธีของเฮาส์โฮลเดอร์อันดับ {order}"
+        step = print_trace(
+            steps, title,
+            "รอบ\t      x\t\t    x_new\t\t    f(x)\t\t    ความคลาดเคลื่อน",
+            lambda s: f"{s.i:3d}\t{s.x:.10f}\t{s.x_new:.10f}\t{s.fx:.6e}\t{s.err:.6e}", 85, func)
+        print(f"ลำดับการลู่เข้าโดยประมาณ p ≈ {estimated_order(errors):.2f} (ทฤษฎี: {order + 1})")
+    else:
+        step = last_step(steps)
+    root = step.x_new if step is not None else x0
+    if report:
+        return OrderReport(order, root, len(errors), counted.calls - calls_before, estimated_order(errors),
+                           time.perf_counter() - start)
+    return root
+
+
+def halley(x0, tol=1e-6, max_iter=100, func=None, verbose=False, report=False):
+    """
+    วิธีของแฮลลีย์ (เฮาส์โฮลเดอร์อันดับ 2) ลู่เข้าแบบกำลังสาม
+
+    x_{k+1} = x_k - 2f·f' / (2f'² - f·f'')
+
+    พารามิเตอร์และคืนค่า: เหมือน householder
+    """
+    return householder(x0, tol, max_iter, func, order=2, verbose=verbose, report=report)
+
+
+def compare_orders(x0, func=None, orders=(1, 2, 3), tol=1e-12, max_iter=100):
+    """
+    เปรียบเทียบวิธีเฮาส์โฮลเดอร์หลายอันดับกับฟังก์ชันเดียวกัน
+
+    พารามิเตอร์:
+    x0: ค่าเริ่มต้นเดาของราก
+    func: ฟังก์ชันที่ต้องการหาราก (default: f)
+    orders: อันดับที่ต้องการเปรียบเทียบ (default: (1, 2, 3) คือ นิวตัน, แฮลลีย์, อันดับ 3)
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-12)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+
+    คืนค่า: list ของ OrderReport(order, root, iterations, evaluations, estimated_order, elapsed)
+    - evaluations: จำนวนครั้งที่เรียก func
+    - elapsed: เวลาทั้งหมด (วินาที) ซึ่งรวมค่าใช้จ่ายของอนุพันธ์อันดับสูงแล้ว
+    """
+    if func is None:
+        func = f
+
+    return [householder(x0, tol, max_iter, func, order, report=True) for order in orders]
+
+
+def print_order_reports(reports):
+    """
+    แสดงตารางผลของ compare_orders
+    """
+    print("อันดับ\tรอบ\tเรียก f\tp โดยประมาณ\tเวลา (ms)\tราก")
+    print("-" * 70)
+    for r in reports:
+        print(f"{r.order:4d}\t{r.iterations:3d}\t{r.evaluations:5d}\t{r.estimated_order:8.2f}\t"
+              f"{r.elapsed * 1e3:9.3f}\t{r.root:.15f}")
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบวิธีของแฮลลีย์และเฮาส์โฮลเดอร์
+    """
+    try:
+        # กำหนดค่าเริ่มต้น
+        x0 = 2.0
+        tolerance = 1e-6
+
+        print(f"หารากของสมการ f(x) = x³ - 2x - 5")
+        print(f"ค่าเริ่มต้น x0 = {x0}")
+        print(f"ค่าความคลาดเคลื่อนที่ยอมรับ: {tolerance}")
+        print()
+
+        result = halley(x0, tol=tolerance, func=CountedFunction(f), verbose=True, report=True)
+        root = result.root
+
+        print(f"\nรากของสมการคือ x ≈ {root:.10f}")
+        print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
+        print(f"{result.iterations} รอบ, เรียก f {result.evaluations} ครั้ง, p ≈ {result.estimated_order:.2f}")
+
+        print("\nเปรียบเทียบอันดับ (tol = 1e-12):")
+        print_order_reports(compare_orders(x0, f, orders=(1, 2, 3, 4)))
+
+        # ฟังก์ชันที่คำนวณแพง: ผลรวม 200,000 พจน์ ค่าใช้จ่ายหลักอยู่ที่การคำนวณ f ไม่ใช่การจัดการ Dual
+        c = np.linspace(0.1, 5.0, 200_000)
+
+        def expensive(x):
+            return np.sum(np.exp(-c * x)) / c.size - 0.25
+
+        print("\nf(x) = mean(exp(-c·x)) - 0.25 โดย c มี 200,000 ค่า:")
+        print_order_reports(compare_orders(0.1, expensive, orders=(1, 2, 3, 4)))
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except ZeroDivisionError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
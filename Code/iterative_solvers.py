@@ -0,0 +1,580 @@
+"""
+วิธีทำซ้ำสำหรับแก้ระบบสมการเชิงเส้น Ax = b (Iterative Methods)
+จาโคบี (Jacobi), เกาส์-ไซเดล (Gauss-Seidel), SOR, เกรเดียนต์สังยุค (Conjugate Gradient) และ GMRES
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from cramers_rule import cramers_rule
+from evaluation import last_step, print_trace
+
+IterativeStep = namedtuple("IterativeStep", "i x residual err")
+
+
+def as_operator(A):
+    """
+    คืนค่าฟังก์ชัน matvec(v) = Av
+
+    พารามิเตอร์:
+    A: เมทริกซ์ (n x n) หรือฟังก์ชัน matvec(v) ที่คืนค่า Av (แบบไม่ใช้เมทริกซ์ matrix-free)
+    """
+    if callable(A):
+        return A
+    A = as_matrix(A)
+    return lambda v: A @ v
+
+
+def as_matrix(A):
+    """
+    แปลง A เป็น numpy array และตรวจสอบว่าเป็นเมทริกซ์จัตุรัส
+    """
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
+    return A
+
+
+def initial_guess(b, x0):
+    """
+    คืนค่า (b, x) เป็น numpy array โดย x เริ่มจาก x0 (default: เวกเตอร์ศูนย์)
+    """
+    b = np.asarray(b, dtype=float).reshape(-1)
+    if x0 is None:
+        return b, np.zeros(b.size)
+    x = np.array(x0, dtype=float).reshape(-1)
+    if x.size != b.size:
+        raise ValueError("ค่าเริ่มต้น x0 ต้องมีขนาดเท่ากับเวกเตอร์ b")
+    return b, x
+
+
+def stopping_residual(b, tol):
+    """
+    ค่าเศษเหลือที่ถือว่าลู่เข้า: ||b - Ax|| <= tol·||b|| (หรือ tol ถ้า b = 0)
+    """
+    norm_b = np.linalg.norm(b)
+    return tol * norm_b if norm_b > 0 else tol
+
+
+def check_residual(residual, name):
+    if not np.isfinite(residual):
+        raise ValueError(f"{name}ลู่ออก: ค่าเศษเหลือเป็น inf/nan (ลองตรวจว่า A เด่นตามแนวทแยงหรือไม่)")
+
+
+def iter_jacobi(A, b, x0=None, tol=1e-8, max_iter=1000, diag=None):
+    """
+    วิธีของจาโคบีแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน jacobi
+
+    คืนค่า: IterativeStep(i, x, residual, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    matvec = as_operator(A)
+    if diag is None:
+        if callable(A):
+            raise ValueError("วิธีของจาโคบีแบบไม่ใช้เมทริกซ์ต้องระบุ diag (เส้นทแยงของ A)")
+        diag = np.diagonal(as_matrix(A))
+    diag = np.asarray(diag, dtype=float)
+    if np.any(diag == 0):
+        raise ZeroDivisionError("วิธีของจาโคบีล้มเหลว: มีสมาชิกบนเส้นทแยงของ A เป็น 0")
+
+    b, x = initial_guess(b, x0)
+    stop = stopping_residual(b, tol)
+    r = b - matvec(x)
+    if np.linalg.norm(r) <= stop:
+        return
+
+    for i in range(1, max_iter + 1):
+        # x_new = D⁻¹(b - (A - D)x) = x + D⁻¹(b - Ax) ใช้การคูณเมทริกซ์กับเวกเตอร์ครั้งเดียวต่อรอบ
+        dx = r / diag
+        x = x + dx
+        r = b - matvec(x)
+        residual = np.linalg.norm(r)
+        check_residual(residual, "วิธีของจาโคบี")
+
+        yield IterativeStep(i, x, residual, np.max(np.abs(dx)))
+
+        if residual <= stop:
+            return
+
+
+def iter_sor(A, b, omega=1.25, x0=None, tol=1e-8, max_iter=1000, name="วิธี SOR"):
+    """
+    วิธี SOR (Successive Over-Relaxation) แบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน sor
+
+    คืนค่า: IterativeStep(i, x, residual, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    if callable(A):
+        raise ValueError(f"{name}ต้องใช้เมทริกซ์ A (ไม่รองรับตัวดำเนินการแบบไม่ใช้เมทริกซ์)")
+    if not 0 < omega < 2:
+        raise ValueError("ต้องมี 0 < omega < 2 เพื่อให้วิธี SOR ลู่เข้าได้")
+    A = as_matrix(A)
+    b, x = initial_guess(b, x0)
+    n = b.size
+    if A.shape[0] != n:
+        raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
+
+    diag = np.diagonal(A)
+    if np.any(diag == 0):
+        raise ZeroDivisionError(f"{name}ล้มเหลว: มีสมาชิกบนเส้นทแยงของ A เป็น 0")
+
+    stop = stopping_residual(b, tol)
+    if np.linalg.norm(b - A @ x) <= stop:
+        return
+
+    # แต่ละแถวต้องใช้ x ที่เพิ่งปรับในแถวก่อนหน้า จึงวนทีละแถว แต่ผลคูณภายในของแถวยังเป็น numpy
+    rows = list(A)
+    scale = (omega / diag).tolist()
+    b_list = b.tolist()
+
+    for i in range(1, max_iter + 1):
+        x_new = x.copy()
+        for k in range(n):
+            x_new[k] += scale[k] * (b_list[k] - rows[k] @ x_new)
+        residual = np.linalg.norm(b - A @ x_new)
+        check_residual(residual, name)
+
+        yield IterativeStep(i, x_new, residual, np.max(np.abs(x_new - x)))
+
+        if residual <= stop:
+            return
+        x = x_new
+
+
+def iter_gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=1000):
+    """
+    วิธีของเกาส์-ไซเดลแบบ generator (คือ SOR ที่ omega = 1)
+
+    คืนค่า: IterativeStep(i, x, residual, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    return iter_sor(A, b, 1.0, x0, tol, max_iter, name="วิธีของเกาส์-ไซเดล")
+
+
+def iter_conjugate_gradient(A, b, x0=None, tol=1e-8, max_iter=1000):
+    """
+    วิธีเกรเดียนต์สังยุคแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน conjugate_gradient
+
+    คืนค่า: IterativeStep(i, x, residual, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    matvec = as_operator(A)
+    b, x = initial_guess(b, x0)
+    stop = stopping_residual(b, tol)
+
+    r = b - matvec(x)
+    rr = r @ r
+    if np.sqrt(rr) <= stop:
+        return
+    p = r.copy()
+
+    for i in range(1, max_iter + 1):
+        Ap = matvec(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("วิธีเกรเดียนต์สังยุคล้มเหลว: A ต้องเป็นเมทริกซ์สมมาตรบวกแน่นอน (พบ pᵀAp <= 0)")
+
+        alpha = rr / pAp
+        dx = alpha * p
+        x = x + dx
+        r -= alpha * Ap
+        rr_new = r @ r
+        residual = np.sqrt(rr_new)
+        check_residual(residual, "วิธีเกรเดียนต์สังยุค")
+
+        yield IterativeStep(i, x, residual, np.max(np.abs(dx)))
+
+        if residual <= stop:
+            return
+
+        p = r + (rr_new / rr) * p
+        rr = rr_new
+
+
+def iter_gmres(A, b, x0=None, tol=1e-8, max_iter=1000, restart=30):
+    """
+    วิธี GMRES แบบเริ่มใหม่ทุก restart รอบ แบบ generator: คืนข้อมูลทุกครั้งที่จบหนึ่งช่วง (restart) หรือลู่เข้า
+
+    พารามิเตอร์: เหมือน gmres
+
+    คืนค่า: IterativeStep(i, x, residual, err) โดย i คือจำนวนผลคูณ Av สะสม รอบสุดท้ายคือคำตอบ
+    (รวมผลคูณที่ใช้ตรวจเศษเหลือจริงท้ายแต่ละช่วง และ Ax0 ถ้า x0 ไม่ใช่ศูนย์ ไม่เกิน max_iter)
+    """
+    if restart < 1:
+        raise ValueError("restart ต้องมีค่าอย่างน้อย 1")
+    matvec = as_operator(A)
+    b, x = initial_guess(b, x0)
+    n = b.size
+    stop = stopping_residual(b, tol)
+
+    # x0 = 0 (ค่าเริ่มต้น) ไม่ต้องคูณ A
+    i = 0
+    if np.any(x):
+        r = b - matvec(x)
+        i += 1
+    else:
+        r = b.copy()
+    beta = np.linalg.norm(r)
+    if beta <= stop:
+        return
+
+    # เหลือผลคูณไว้หนึ่งครั้งสำหรับเศษเหลือจริงท้ายช่วง
+    while max_iter - i >= 2:
+        m = min(restart, max_iter - i - 1)
+        # ฐานของปริภูมิครีลอฟ (m + 1 เวกเตอร์ยาว n) คือหน่วยความจำหลักของวิธีนี้
+        V = np.empty((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        k = 0
+        for j in range(m):
+            w = matvec(V[j])
+            i += 1
+            # อาร์โนลดีแบบแกรม-ชมิดต์สองรอบ (คำนวณเป็นเมทริกซ์ทั้งก้อน และตั้งฉากดีเท่า modified Gram-Schmidt)
+            h = V[:j + 1] @ w
+            w = w - h @ V[:j + 1]
+            h2 = V[:j + 1] @ w
+            w -= h2 @ V[:j + 1]
+            H[:j + 1, j] = h + h2
+            H[j + 1, j] = norm_w = np.linalg.norm(w)
+
+            # ใช้การหมุนของกิฟเวนส์เดิมกับคอลัมน์ใหม่ แล้วสร้างการหมุนใหม่เพื่อกำจัด H[j+1, j]
+            for l in range(j):
+                H[l, j], H[l + 1, j] = cs[l] * H[l, j] + sn[l] * H[l + 1, j], -sn[l] * H[l, j] + cs[l] * H[l + 1, j]
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            if denom == 0:
+                break
+            cs[j], sn[j] = H[j, j] / denom, H[j + 1, j] / denom
+            H[j, j] = denom
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+            k = j + 1
+
+            # |g[j+1]| คือ ||b - Ax|| ของคำตอบในช่วงนี้ โดยไม่ต้องสร้าง x (norm_w = 0 คือได้คำตอบตรง)
+            if abs(g[j + 1]) <= stop or norm_w == 0:
+                break
+            V[j + 1] = w / norm_w
+
+        if k == 0:
+            raise ValueError("วิธี GMRES ล้มเหลว: ไม่สามารถขยายปริภูมิครีลอฟได้ (Av = 0)")
+
+        # แก้ระบบสามเหลี่ยมบน H[:k, :k]·y = g[:k] แล้ว x ← x + Vᵀy
+        y = g[:k].copy()
+        for l in range(k - 1, -1, -1):
+            y[l] = (y[l] - H[l, l + 1:k] @ y[l + 1:]) / H[l, l]
+        dx = y @ V[:k]
+        x = x + dx
+
+        # เศษเหลือจริง (ป้องกันความคลาดเคลื่อนสะสมจากการประมาณด้วย g)
+        r = b - matvec(x)
+        i += 1
+        residual = np.linalg.norm(r)
+        check_residual(residual, "วิธี GMRES")
+
+        yield IterativeStep(i, x, residual, np.max(np.abs(dx)))
+
+        if residual <= stop:
+            return
+        beta = residual
+
+
+def run_steps(steps, title, verbose):
+    """
+    วนรอบ iterator จนจบ (แสดงตารางถ้า verbose) แล้วคืนค่ารอบสุดท้าย
+    """
+    if not verbose:
+        return last_step(steps)
+    return print_trace(
+        steps, title,
+        "รอบ\t  ||b - Ax||\t  ||Δx||∞",
+        lambda s: f"{s.i:4d}\t{s.residual:.6e}\t{s.err:.6e}", 40)
+
+
+def result(step, A, b, x0):
+    """
+    คืนค่า (x, iterations, residual) จากรอบสุดท้าย หรือจาก x0 ถ้า x0 เป็นคำตอบอยู่แล้ว
+    """
+    if step is not None:
+        return step.x, step.i, step.residual
+    b, x = initial_guess(b, x0)
+    return x, 0, np.linalg.norm(b - as_operator(A)(x))
+
+
+def jacobi(A, b, x0=None, tol=1e-8, max_iter=1000, diag=None, verbose=False):
+    """
+    วิธีของจาโคบีสำหรับแก้ระบบสมการเชิงเส้น Ax = b
+
+    พารามิเตอร์:
+    A: เมทริกซ์สัมประสิทธิ์ (n x n) หรือฟังก์ชัน matvec(v) ที่คืนค่า Av
+    b: เวกเตอร์ค่าคงที่ (n ค่า)
+    x0: ค่าเริ่มต้น (default: เวกเตอร์ศูนย์)
+    tol: หยุดเมื่อ ||b - Ax|| <= tol·||b|| (default: 1e-8)
+    max_iter: จำนวนรอบสูงสุด (default: 1000)
+    diag: เส้นทแยงของ A (ต้องระบุเมื่อ A เป็นฟังก์ชัน)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+
+    คืนค่า: (x, iterations, residual) โดยที่ residual คือ ||b - Ax|| ของคำตอบสุดท้าย
+
+    หมายเหตุ:
+    - ลู่เข้าแน่นอนถ้า A เด่นตามแนวทแยงอย่างแท้จริง (strictly diagonally dominant)
+    - ทุกแถวใช้ x ของรอบก่อนหน้า จึงคำนวณทั้งเวกเตอร์พร้อมกันได้ (vectorized)
+    - ถ้าครบ max_iter แล้วยังไม่ลู่เข้า จะคืนค่ารอบสุดท้าย ตรวจได้จาก residual
+    """
+    step = run_steps(iter_jacobi(A, b, x0, tol, max_iter, diag), "วิธีของจาโคบี", verbose)
+    return result(step, A, b, x0)
+
+
+def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """
+    วิธีของเกาส์-ไซเดลสำหรับแก้ระบบสมการเชิงเส้น Ax = b
+
+    พารามิเตอร์: เหมือน jacobi (แต่ A ต้องเป็นเมทริกซ์)
+
+    คืนค่า: (x, iterations, residual)
+
+    หมายเหตุ:
+    - ใช้ค่า x ที่เพิ่งคำนวณในแถวก่อนหน้าทันที มักใช้จำนวนรอบประมาณครึ่งหนึ่งของจาโคบี
+    - ลู่เข้าแน่นอนถ้า A เด่นตามแนวทแยง หรือสมมาตรบวกแน่นอน
+    """
+    step = run_steps(iter_gauss_seidel(A, b, x0, tol, max_iter), "วิธีของเกาส์-ไซเดล", verbose)
+    return result(step, A, b, x0)
+
+
+def sor(A, b, omega=1.25, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """
+    วิธี SOR (Successive Over-Relaxation) สำหรับแก้ระบบสมการเชิงเส้น Ax = b
+
+    พารามิเตอร์:
+    omega: ตัวประกอบผ่อนปรน 0 < omega < 2 (default: 1.25, omega = 1 คือเกาส์-ไซเดล)
+    ที่เหลือเหมือน gauss_seidel
+
+    คืนค่า: (x, iterations, residual)
+
+    หมายเหตุ:
+    - x_new = (1 - ω)·x + ω·(ค่าจากเกาส์-ไซเดล) เลือก ω ที่เหมาะสมจะลดจำนวนรอบได้มาก
+    """
+    step = run_steps(iter_sor(A, b, omega, x0, tol, max_iter), f"วิธี SOR (ω = {omega})", verbose)
+    return result(step, A, b, x0)
+
+
+def conjugate_gradient(A, b, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """
+    วิธีเกรเดียนต์สังยุคสำหรับแก้ระบบสมการเชิงเส้น Ax = b
+
+    พารามิเตอร์:
+    A: เมทริกซ์สมมาตรบวกแน่นอน (n x n) หรือฟังก์ชัน matvec(v) ที่คืนค่า Av
+    ที่เหลือเหมือน jacobi
+
+    คืนค่า: (x, iterations, residual)
+
+    หมายเหตุ:
+    - ใช้ได้กับ A ที่สมมาตรบวกแน่นอน (symmetric positive definite) เท่านั้น
+    - ในทางทฤษฎีลู่เข้าภายใน n รอบ และเร็วขึ้นเมื่อ A มี condition number ต่ำ
+    - ต้องการเพียงผลคูณ Av รอบละครั้ง จึงใช้กับระบบใหญ่ที่ไม่ได้เก็บ A เป็นเมทริกซ์ได้
+    """
+    step = run_steps(iter_conjugate_gradient(A, b, x0, tol, max_iter), "วิธีเกรเดียนต์สังยุค", verbose)
+    return result(step, A, b, x0)
+
+
+def gmres(A, b, x0=None, tol=1e-8, max_iter=1000, restart=30, verbose=False):
+    """
+    วิธี GMRES (Generalized Minimal Residual) แบบเริ่มใหม่สำหรับแก้ระบบสมการเชิงเส้น Ax = b
+
+    พารามิเตอร์:
+    A: เมทริกซ์ (n x n) หรือฟังก์ชัน matvec(v) ที่คืนค่า Av (ไม่ต้องสมมาตร)
+    restart: จำนวนรอบก่อนเริ่มปริภูมิครีลอฟใหม่ (default: 30)
+    ที่เหลือเหมือน jacobi (max_iter นับจำนวนผลคูณ Av ทั้งหมด รวมการตรวจเศษเหลือจริงท้ายแต่ละช่วง)
+
+    คืนค่า: (x, iterations, residual)
+
+    หมายเหตุ:
+    - แต่ละรอบเลือก x ในปริภูมิครีลอฟ span{r, Ar, A²r, ...} ที่ทำให้ ||b - Ax|| น้อยที่สุด
+      จึงใช้ได้กับ A ทั่วไปที่ไม่สมมาตร (ต่างจาก conjugate_gradient)
+    - ใช้หน่วยความจำ O(n·restart) สำหรับฐานของปริภูมิ restart น้อยประหยัดหน่วยความจำแต่อาจลู่เข้าช้าลง
+    - ตาราง verbose แสดงหนึ่งแถวต่อหนึ่งช่วง restart (คอลัมน์รอบคือจำนวนผลคูณ Av สะสม)
+    """
+    step = run_steps(iter_gmres(A, b, x0, tol, max_iter, restart), f"วิธี GMRES({restart})", verbose)
+    return result(step, A, b, x0)
+
+
+SOLVERS = {
+    "jacobi": jacobi,
+    "gauss_seidel": gauss_seidel,
+    "sor": sor,
+    "conjugate_gradient": conjugate_gradient,
+    "gmres": gmres,
+}
+
+
+def test_matrix(n, rng, kind="dominant"):
+    """
+    สร้างเมทริกซ์ทดสอบขนาด n x n
+
+    พารามิเตอร์:
+    kind: "dominant" = สมมาตร เด่นตามแนวทแยงมาก (จึงบวกแน่นอน) ทุกวิธีลู่เข้าในไม่กี่รอบ
+          "poisson" = สมการปัวซอง 1 มิติ (2 บนเส้นทแยง, -1 ข้างเคียง) ไม่เด่นตามแนวทแยงโดยแท้
+          condition number โตประมาณ n² วิธีจาโคบี/เกาส์-ไซเดลจึงต้องใช้รอบเพิ่มตาม n² (default: "dominant")
+    """
+    if kind == "poisson":
+        return 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    if kind != "dominant":
+        raise ValueError(f"ไม่รู้จักเมทริกซ์ทดสอบ '{kind}' (เลือกได้: dominant, poisson)")
+    B = rng.uniform(-1, 1, size=(n, n))
+    A = (B + B.T) / 2
+    np.fill_diagonal(A, np.abs(A).sum(axis=1) + 1.0)
+    return A
+
+
+def benchmark(sizes=(3, 5, 10, 25, 50, 100, 200, 400), tol=1e-8, seed=0, kind="dominant"):
+    """
+    เปรียบเทียบเวลาของวิธีทำซ้ำกับ cramers_rule เมื่อ n เพิ่มขึ้น
+
+    พารามิเตอร์:
+    sizes: ขนาดของระบบที่ต้องการทดสอบ
+    tol: ค่าความคลาดเคลื่อนของวิธีทำซ้ำ (default: 1e-8)
+    seed: seed ของตัวสุ่มเมทริกซ์ทดสอบ (default: 0)
+    kind: ชนิดของเมทริกซ์ทดสอบ ดู test_matrix (default: "dominant")
+
+    คืนค่า: list ของ (n, times, iterations, converged) โดย times, iterations และ converged เป็น dict ตามชื่อวิธี
+    (cramers_rule มี iterations = 0 และ converged = True เสมอ
+    วิธีที่ครบ max_iter ก่อน ||b - Ax|| <= tol·||b|| มี converged = False)
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n in sizes:
+        A = test_matrix(n, rng, kind)
+        b = rng.uniform(-1, 1, size=n)
+        times = {}
+        iterations = {}
+        converged = {}
+
+        start = time.perf_counter()
+        # det(A) ของเมทริกซ์ใหญ่ที่สมาชิกบนเส้นทแยงมีค่ามากอาจล้นเป็น inf แต่ x ยังถูกต้อง
+        with np.errstate(over="ignore"):
+            cramers_rule(A, b)
+        times["cramers_rule"] = time.perf_counter() - start
+        iterations["cramers_rule"] = 0
+        converged["cramers_rule"] = True
+
+        for name, solver in SOLVERS.items():
+            start = time.perf_counter()
+            _, iterations[name], residual = solver(A, b, tol=tol)
+            times[name] = time.perf_counter() - start
+            converged[name] = residual <= stopping_residual(b, tol)
+
+        rows.append((n, times, iterations, converged))
+    return rows
+
+
+def print_benchmark(rows):
+    """
+    แสดงตารางผลของ benchmark และขนาด n แรกที่แต่ละวิธีเร็วกว่า cramers_rule
+    (นับเฉพาะขนาดที่วิธีนั้นลู่เข้า และเร็วกว่าต่อเนื่องจนถึงขนาดใหญ่สุดที่ทดสอบ)
+    """
+    names = ["cramers_rule", *SOLVERS]
+    print("n\t" + "\t".join(f"{name:>18s}" for name in names))
+    print("-" * (8 + 19 * len(names)))
+    for n, times, iterations, converged in rows:
+        cells = [(f"{times[name] * 1e3:9.2f} ms" + (f" ({iterations[name]:3d})" if name in SOLVERS else "      ")
+                  if converged[name] else "ไม่ลู่เข้า")
+                 for name in names]
+        print(f"{n}\t" + "\t".join(f"{cell:>18s}" for cell in cells))
+    print("(ตัวเลขในวงเล็บคือจำนวนรอบ, ไม่ลู่เข้า = ครบ max_iter ก่อนถึง tol)")
+
+    for name in SOLVERS:
+        when = "ไม่มีในช่วงที่ทดสอบ"
+        for n, times, _, converged in reversed(rows):
+            if not converged[name] or times[name] >= times["cramers_rule"]:
+                break
+            when = f"n >= {n}"
+        print(f"{name:20s} เร็วกว่า cramers_rule เมื่อ {when}")
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบวิธีทำซ้ำ
+    """
+    try:
+        # ระบบตัวอย่างที่เด่นตามแนวทแยง
+        A = [[10, -1, 2, 0],
+             [-1, 11, -1, 3],
+             [2, -1, 10, -1],
+             [0, 3, -1, 8]]
+        b = [6, 25, -11, 15]
+        tolerance = 1e-8
+
+        print("ระบบสมการ Ax = b")
+        print(f"A = {np.array(A)}")
+        print(f"b = {b}")
+        print()
+
+        x, iterations, residual = gauss_seidel(A, b, tol=tolerance, verbose=True)
+        print(f"\nคำตอบ x ≈ {x} ({iterations} รอบ, ||b - Ax|| = {residual:.2e})")
+
+        for name, solver in SOLVERS.items():
+            x, iterations, residual = solver(A, b, tol=tolerance)
+            print(f"{name:20s} {iterations:4d} รอบ, ||b - Ax|| = {residual:.2e}")
+
+        # ระบบใหญ่แบบไม่ใช้เมทริกซ์: สมการปัวซอง 2 มิติบนกริด m x m (n = m²)
+        # Av คำนวณจาก stencil 5 จุดโดยตรง ไม่ต้องเก็บเมทริกซ์ n x n
+        m = 200
+
+        def poisson(v):
+            u = v.reshape(m, m)
+            Au = 4 * u
+            Au[1:, :] -= u[:-1, :]
+            Au[:-1, :] -= u[1:, :]
+            Au[:, 1:] -= u[:, :-1]
+            Au[:, :-1] -= u[:, 1:]
+            return Au.ravel()
+
+        # สร้าง b จากคำตอบที่รู้ค่า เพื่อวัดความคลาดเคลื่อนของวิธีทำซ้ำโดยตรง
+        t = np.linspace(0, 1, m + 2)[1:-1]
+        exact = (np.outer(t * (1 - t), np.exp(t))).ravel()
+        rhs = poisson(exact)
+
+        print(f"\nสมการปัวซอง 2 มิติ n = {m * m:,} (ไม่ใช้เมทริกซ์)")
+        start = time.perf_counter()
+        x, iterations, residual = conjugate_gradient(poisson, rhs, tol=tolerance)
+        print(f"เกรเดียนต์สังยุค: {iterations} รอบ, {time.perf_counter() - start:.3f} s, "
+              f"ความคลาดเคลื่อนสูงสุด = {np.max(np.abs(x - exact)):.2e}")
+        start = time.perf_counter()
+        x, iterations, residual = jacobi(poisson, rhs, tol=tolerance, max_iter=200, diag=np.full(m * m, 4.0))
+        print(f"จาโคบี: {iterations} รอบ, {time.perf_counter() - start:.3f} s, ||b - Ax|| = {residual:.2e} "
+              f"(ยังไม่ลู่เข้า: จาโคบีต้องใช้ O(n) รอบกับปัญหานี้)")
+
+        # ระบบไม่สมมาตร: เกรเดียนต์สังยุคใช้ไม่ได้ แต่ GMRES ใช้ได้
+        n = 2000
+        rng = np.random.default_rng(1)
+        A_ns = 3 * np.eye(n) + rng.normal(size=(n, n)) / np.sqrt(n)
+        x_true = rng.uniform(-1, 1, size=n)
+        print(f"\nระบบไม่สมมาตร n = {n:,}")
+        start = time.perf_counter()
+        x, iterations, residual = gmres(A_ns, A_ns @ x_true, tol=tolerance)
+        print(f"GMRES(30): {iterations} รอบ, {time.perf_counter() - start:.3f} s, "
+              f"ความคลาดเคลื่อนสูงสุด = {np.max(np.abs(x - x_true)):.2e}")
+
+        print("\nเปรียบเทียบเวลากับ cramers_rule (เมทริกซ์เด่นตามแนวทแยง)")
+        print_benchmark(benchmark(tol=tolerance))
+        print("\nเปรียบเทียบเวลากับ cramers_rule (สมการปัวซอง 1 มิติ)")
+        print_benchmark(benchmark(tol=tolerance, kind="poisson"))
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except ZeroDivisionError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+การแก้ระบบสมการเชิงเส้น Ax = b ตามโครงสร้างของเมทริกซ์
+เมทริกซ์สามแนวทแยง (tridiagonal) และเมทริกซ์แถบ (banded) ใช้เวลาและหน่วยความจำ O(n·bandwidth)
+"""
+
+import time
+
+import numpy as np
+
+from cramers_rule import lu_factor, lu_solve
+
+
+def bandwidth(A):
+    """
+    หาความกว้างแถบของเมทริกซ์ (l, u)
+    l: จำนวนแนวทแยงใต้เส้นทแยงหลักที่มีค่าไม่เป็น 0, u: จำนวนแนวทแยงเหนือเส้นทแยงหลัก
+    """
+    rows, cols = np.nonzero(np.asarray(A))
+    if rows.size == 0:
+        return 0, 0
+    offset = cols - rows
+    return int(max(0, -offset.min())), int(max(0, offset.max()))
+
+
+def to_banded(A, l, u):
+    """
+    แปลงเมทริกซ์เต็มเป็นรูปแบบแถบ ab ขนาด (l+u+1, n) โดย ab[u + i - j, j] = A[i, j]
+    (รูปแบบเดียวกับ LAPACK และ scipy.linalg.solve_banded)
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    ab = np.zeros((l + u + 1, n))
+    for d in range(-l, u + 1):
+        # แนวทแยงที่ d (d > 0 อยู่เหนือเส้นทแยงหลัก)
+        diag = np.diagonal(A, d)
+        if d >= 0:
+            ab[u - d, d:] = diag
+        else:
+            ab[u - d, :n + d] = diag
+    return ab
+
+
+def banded_matvec(ab, l, u, x):
+    """
+    คำนวณ Ax จากเมทริกซ์แถบ ab (รูปแบบของ to_banded) ใช้ O(n·(l+u)) โดยไม่สร้างเมทริกซ์เต็ม
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    y = np.zeros(n)
+    for d in range(-l, u + 1):
+        if d >= 0:
+            y[:n - d] += ab[u - d, d:] * x[d:]
+        else:
+            y[-d:] += ab[u - d, :n + d] * x[:n + d]
+    return y
+
+
+def thomas(lower, diag, upper, d):
+    """
+    ขั้นตอนวิธีของโทมัส (Thomas Algorithm) สำหรับระบบสามแนวทแยง
+
+    พารามิเตอร์:
+    lower: แนวทแยงใต้เส้นทแยงหลัก (n-1 ค่า) คือ A[i+1, i]
+    diag: เส้นทแยงหลัก (n ค่า)
+    upper: แนวทแยงเหนือเส้นทแยงหลัก (n-1 ค่า) คือ A[i, i+1]
+    d: เวกเตอร์ค่าคงที่ (n ค่า)
+
+    คืนค่า: เวกเตอร์คำตอบ x
+
+    หมายเหตุ:
+    - ใช้ O(n) ทั้งเวลาและหน่วยความจำ
+    - ไม่สลับแถว จึงเหมาะกับเมทริกซ์ที่เด่นตามแนวทแยง (diagonally dominant) หรือสมมาตรบวกแน่นอน
+      เช่นจากการประมาณสมการเชิงอนุพันธ์ ถ้าเจอ pivot เป็น 0 จะโยน ZeroDivisionError
+    """
+    # ใช้ list ของ float เพราะวนทีละตัวเร็วกว่าการเข้าถึงสมาชิกของ numpy array ทีละตัว
+    a = [0.0] + np.asarray(lower, dtype=float).tolist()
+    b = np.asarray(diag, dtype=float).tolist()
+    c = np.asarray(upper, dtype=float).tolist() + [0.0]
+    r = np.asarray(d, dtype=float).tolist()
+    n = len(b)
+    if len(a) != n or len(c) != n or len(r) != n:
+        raise ValueError("lower และ upper ต้องมี n-1 ค่า ส่วน diag และ d ต้องมี n ค่า")
+
+    # กำจัดไปข้างหน้า: c'[i] = c[i] / (b[i] - a[i] c'[i-1])
+    cp = [0.0] * n
+    dp = [0.0] * n
+    c_prev = 0.0
+    d_prev = 0.0
+    for i in range(n):
+        denom = b[i] - a[i] * c_prev
+        if denom == 0:
+            raise ZeroDivisionError(f"pivot เป็น 0 ที่แถว {i} (ลองใช้ banded_solve ที่สลับแถว)")
+        c_prev = c[i] / denom
+        d_prev = (r[i] - a[i] * d_prev) / denom
+        cp[i] = c_prev
+        dp[i] = d_prev
+
+    # แทนค่าย้อนกลับ
+    x = dp
+    for i in range(n - 2, -1, -1):
+        x[i] = dp[i] - cp[i] * x[i + 1]
+
+    return np.array(x)
+
+
+def banded_lu(ab, l, u):
+    """
+    แยกตัวประกอบ LU ของเมทริกซ์แถบ (รูปแบบ ab จาก to_banded) ด้วยการสลับแถว (partial pivoting)
+
+    คืนค่า: (L, U, piv) โดยที่
+    - L: ตัวคูณของแต่ละขั้น ขนาด (n, l)
+    - U: แถวของ U ขนาด (n, l+u+1) โดย U[k, c] คือค่าที่คอลัมน์ k + c (การสลับแถวทำให้ U กว้างขึ้นได้ถึง l+u)
+    - piv: แถวที่ถูกสลับขึ้นมาเป็น pivot ในแต่ละขั้น
+
+    หมายเหตุ:
+    - ทำงานบนหน้าต่างเล็ก ๆ ขนาด (l+1) x (l+u+1) ที่เลื่อนไปตามเส้นทแยง ใช้ O(n·l·(l+u)) ครั้ง
+      และหน่วยความจำ O(n·(l+u))
+    """
+    ab = np.asarray(ab, dtype=float)
+    n = ab.shape[1]
+    w = l + u + 1
+
+    # R[i, c] = A[i, i - l + c] คือแถวที่ i ของ A ในช่วงคอลัมน์ i-l ... i+u
+    R = np.zeros((n + l + 1, w))
+    for c in range(w):
+        j0 = c - l
+        # A[i, i + j0] = ab[u - j0, i + j0]
+        lo, hi = max(0, -j0), min(n, n - j0)
+        R[lo:hi, c] = ab[u - j0, lo + j0:hi + j0]
+
+    # หน้าต่าง W: แถว k ... k+l และคอลัมน์ k ... k+l+u ของเมทริกซ์ที่กำลังกำจัด
+    W = np.zeros((l + 1, w))
+    for i in range(min(l + 1, n)):
+        W[i, :w - (l - i)] = R[i, l - i:]
+
+    L = np.zeros((n, l))
+    U = np.zeros((n, w))
+    piv = np.zeros(n, dtype=int)
+
+    for k in range(n):
+        m = min(l + 1, n - k)
+        p = int(np.argmax(np.abs(W[:m, 0])))
+        if W[p, 0] == 0:
+            raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ")
+        if p != 0:
+            W[[0, p]] = W[[p, 0]]
+        piv[k] = k + p
+
+        if m > 1:
+            factors = W[1:m, 0] / W[0, 0]
+            L[k, :m - 1] = factors
+            W[1:m, 1:] -= np.outer(factors, W[0, 1:])
+        U[k] = W[0]
+
+        # เลื่อนหน้าต่างลงหนึ่งแถวและไปทางขวาหนึ่งคอลัมน์ แล้วเติมแถว k+l+1 ของ A
+        W[:-1, :-1] = W[1:, 1:]
+        W[:-1, -1] = 0.0
+        W[-1, :] = R[k + l + 1] if k + l + 1 < n else 0.0
+
+    return L, U, piv
+
+
+def banded_lu_solve(L, U, piv, b):
+    """
+    แก้ระบบ Ax = b จากผลของ banded_lu ใช้ O(n·(l+u)) ครั้ง
+    """
+    n, w = U.shape
+    l = L.shape[1]
+    y = np.array(b, dtype=float)
+
+    # แทนค่าไปข้างหน้า (สลับแถวของ b ตามลำดับเดียวกับตอนแยกตัวประกอบ)
+    for k in range(n):
+        p = piv[k]
+        if p != k:
+            y[k], y[p] = y[p], y[k]
+        m = min(l, n - 1 - k)
+        if m:
+            y[k + 1:k + 1 + m] -= L[k, :m] * y[k]
+
+    # แทนค่าย้อนกลับ (เติม 0 ท้าย x เพื่อไม่ต้องตัดแถวสุดท้าย)
+    x = np.zeros(n + w)
+    for k in range(n - 1, -1, -1):
+        x[k] = (y[k] - U[k, 1:] @ x[k + 1:k + w]) / U[k, 0]
+
+    return x[:n]
+
+
+def banded_solve(ab, l, u, b):
+    """
+    แก้ระบบเมทริกซ์แถบ Ax = b (ab ในรูปแบบของ to_banded)
+    """
+    L, U, piv = banded_lu(ab, l, u)
+    return banded_lu_solve(L, U, piv, b)
+
+
+def solve_linear_system(A, b, l_and_u=None):
+    """
+    แก้ระบบสมการเชิงเส้น Ax = b โดยเลือกวิธีตามโครงสร้างของ A
+
+    พารามิเตอร์:
+    A: เมทริกซ์เต็ม (n x n) หรือเมทริกซ์แถบในรูปแบบ ab ขนาด (l+u+1, n) ถ้าระบุ l_and_u
+    b: เวกเตอร์ค่าคงที่ (n ค่า)
+    l_and_u: (l, u) ถ้า A อยู่ในรูปแบบแถบ (default: None = A เป็นเมทริกซ์เต็ม และหาความกว้างแถบเอง)
+
+    คืนค่า: เวกเตอร์คำตอบ x
+
+    หมายเหตุ:
+    - สามแนวทแยง (l = u = 1): ขั้นตอนวิธีของโทมัส O(n) ถ้าเจอ pivot เป็น 0 จะใช้ LU แบบแถบที่สลับแถวแทน
+    - แถบแคบ: LU แบบแถบ O(n·l·(l+u))
+    - แถบกว้าง (เกือบเต็ม): LU แบบเต็มจาก cramers_rule O(n³)
+    - ระบบขนาดใหญ่ (เช่น n = 10^6) ควรส่ง A ในรูปแบบแถบโดยตรง เพราะเมทริกซ์เต็มขนาด n x n จองหน่วยความจำไม่ได้
+    """
+    b = np.asarray(b, dtype=float).reshape(-1)
+
+    if l_and_u is None:
+        A = np.asarray(A, dtype=float)
+        n, m = A.shape
+        if n != m:
+            raise ValueError("เมทริกซ์ A ต้องเป็นเมทริกซ์จัตุรัส (n x n)")
+        l, u = bandwidth(A)
+        if l + u + 1 >= n // 2:
+            LU, piv, _ = lu_factor(A)
+            if np.any(np.diag(LU) == 0):
+                raise ValueError("det(A) = 0 -> ระบบไม่มีคำตอบเฉพาะ")
+            return lu_solve(LU, piv, b)
+        ab = to_banded(A, l, u)
+    else:
+        l, u = l_and_u
+        ab = np.asarray(A, dtype=float)
+        if ab.shape[0] != l + u + 1:
+            raise ValueError(f"เมทริกซ์แถบต้องมี l+u+1 = {l + u + 1} แถว")
+
+    n = ab.shape[1]
+    if b.size != n:
+        raise ValueError("เวกเตอร์ b ต้องมีขนาดเท่ากับจำนวนแถวของเมทริกซ์ A")
+
+    if l == 1 and u == 1:
+        try:
+            return thomas(ab[2, :-1], ab[1], ab[0, 1:], b)
+        except ZeroDivisionError:
+            pass
+    return banded_solve(ab, l, u, b)
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบการแก้ระบบเมทริกซ์แถบ
+    """
+    try:
+        # สมการปัวซอง -u''(t) = π² sin(πt) บน [0, 1], u(0) = u(1) = 0 (คำตอบจริง u = sin(πt))
+        # ประมาณอนุพันธ์ด้วยผลต่างสืบเนื่องได้ระบบสามแนวทแยง (-1, 2, -1) / h²
+        n = 1_000_000
+        h = 1.0 / (n + 1)
+        t = np.linspace(h, 1 - h, n)
+
+        ab = np.empty((3, n))
+        ab[0] = -1.0
+        ab[1] = 2.0
+        ab[2] = -1.0
+        rhs = h**2 * np.pi**2 * np.sin(np.pi * t)
+
+        print(f"สมการปัวซอง 1 มิติ: ระบบสามแนวทแยง n = {n:,}")
+        start = time.perf_counter()
+        x = solve_linear_system(ab, rhs, l_and_u=(1, 1))
+        print(f"ขั้นตอนวิธีของโทมัส: {time.perf_counter() - start:.3f} s, "
+              f"ความคลาดเคลื่อนสูงสุดเทียบกับ sin(πt) = {np.max(np.abs(x - np.sin(np.pi * t))):.2e}")
+
+        # ระบบห้าแนวทแยง (l = u = 2) ทดสอบ LU แบบแถบ
+        n = 100_000
+        rng = np.random.default_rng(0)
+        ab = rng.uniform(-1, 1, size=(5, n))
+        ab[2] += 5.0
+        x_true = rng.uniform(-1, 1, size=n)
+        b = banded_matvec(ab, 2, 2, x_true)
+
+        print(f"\nระบบห้าแนวทแยง n = {n:,}")
+        start = time.perf_counter()
+        x = solve_linear_system(ab, b, l_and_u=(2, 2))
+        print(f"LU แบบแถบ: {time.perf_counter() - start:.3f} s, "
+              f"ความคลาดเคลื่อนสูงสุด = {np.max(np.abs(x - x_true)):.2e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,18 @@
 """
 
 import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from autodiff import value_and_derivative
+from evaluation import CountedFunction, counting, last_step, print_trace, solve_report
+
+# สถานะของแต่ละค่าเริ่มต้นใน newton_raphson_batch
+CONVERGED = 0
+ZERO_DERIVATIVE = 1
+MAX_ITER_REACHED = 2
 
 
 def f(x):
@@ -22,7 +34,52 @@ def df(x):
     return 3*x**2 - 2
 
 
-def newton_raphson(x0, tol=1e-6, max_iter=100):
+NewtonStep = namedtuple("NewtonStep", "i x x_new fx dfx err")
+
+
+def iter_newton_raphson(x0, tol=1e-6, max_iter=100, func=None, dfunc=None):
+    """
+    วิธีการของนิวตัน-ราฟสันแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+    
+    พารามิเตอร์: เหมือน newton_raphson
+    
+    คืนค่า: NewtonStep(i, x, x_new, fx, dfx, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    if func is None:
+        func = f
+        if dfunc is None:
+            dfunc = df
+
+    def steps(x, dfunc):
+        # วนรอบเพื่อหาราก
+        for i in range(1, max_iter + 1):
+            if dfunc is None:
+                # ได้ f(x) และ f'(x) จากการเรียก func ครั้งเดียวด้วยจำนวนคู่
+                fx, dfx = value_and_derivative(func, x)
+            else:
+                fx = func(x)
+                dfx = dfunc(x)
+            
+            # ตรวจสอบว่าอนุพันธ์เป็นศูนย์หรือไม่
+            if dfx == 0:
+                raise ZeroDivisionError("วิธีนิวตัน-ราฟสันล้มเหลว: f'(x) = 0")
+            
+            # คำนวณค่าใหม่
+            x_new = x - fx / dfx
+            err = abs(x_new - x)
+            
+            yield NewtonStep(i, x, x_new, fx, dfx, err)
+            
+            # ตรวจสอบว่าเจอรากแล้วหรือไม่
+            if err < tol:
+                return
+            
+            x = x_new
+
+    return steps(x0, dfunc)
+
+
+def newton_raphson(x0, tol=1e-6, max_iter=100, func=None, dfunc=None, verbose=False, report=False):
     """
     วิธีการของนิวตัน-ราฟสันสำหรับหารากของสมการ
     
@@ -30,45 +87,104 @@ def newton_raphson(x0, tol=1e-6, max_iter=100):
     x0: ค่าเริ่มต้นเดาของราก
     tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
     max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    dfunc: ฟังก์ชันที่ใช้แทน f'(x) (default: df ถ้าไม่ระบุ func, มิฉะนั้นหาอนุพันธ์อัตโนมัติ)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+    report: คืนค่าเป็น SolveReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
     
     คืนค่า: ค่ารากโดยประมาณ
+    ถ้า report=True คืน SolveReport(root, iterations, evaluations, per_iteration, elapsed)
+    (evaluations คือจำนวนครั้งที่เรียก f(x) ในการหารากครั้งนี้, per_iteration คือจำนวนต่อรอบ)
     
     หมายเหตุ:
-    - ต้องการอนุพันธ์ของฟังก์ชัน f'(x)
+    - ต้องการอนุพันธ์ของฟังก์ชัน f'(x) ถ้าระบุ func โดยไม่ระบุ dfunc จะได้ f'(x) จากจำนวนคู่ (autodiff)
+      ในการเรียก func ครั้งเดียวต่อรอบ (func ต้องใช้ฟังก์ชันของ numpy เช่น np.sin ไม่ใช่ math.sin)
     - มักจะลู่เข้าเร็วมากถ้าค่าเริ่มต้นใกล้กับรากจริง
     - อาจลู่เข้าไม่ได้ถ้าค่าเริ่มต้นไกลจากรากหรือ f'(x) = 0
     """
-    x = x0
-    
-    print("วิธีการของนิวตัน-ราฟสัน")
-    print("รอบ\t      x\t\t    x_new\t\t    f(x)\t\t    ความคลาดเคลื่อน")
-    print("-" * 85)
-    
-    # วนรอบเพื่อหาราก
+    if func is None:
+        func, dfunc = f, (df if dfunc is None else dfunc)
+    counted, calls_before = counting(func, report)
+    start = time.perf_counter()
+    steps = iter_newton_raphson(x0, tol, max_iter, counted, dfunc)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีการของนิวตัน-ราฟสัน",
+            "รอบ\t      x\t\t    x_new\t\t    f(x)\t\t    ความคลาดเคลื่อน",
+            lambda s: f"{s.i:3d}\t{s.x:.10f}\t{s.x_new:.10f}\t{s.fx:.6e}\t{s.err:.6e}", 85, counted)
+    else:
+        step = last_step(steps)
+    root = step.x_new if step is not None else x0
+    if report:
+        return solve_report(root, step.i if step is not None else 0, counted, calls_before, start)
+    return root
+
+
+def newton_raphson_batch(x0, tol=1e-6, max_iter=100, func=None, dfunc=None):
+    """
+    วิธีการของนิวตัน-ราฟสันสำหรับค่าเริ่มต้นหลายค่าพร้อมกัน (vectorized)
+
+    พารามิเตอร์:
+    x0: อาร์เรย์ของค่าเริ่มต้นเดา
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) (default: f)
+    dfunc: ฟังก์ชันที่ใช้แทน f'(x) (default: df ถ้าไม่ระบุ func, มิฉะนั้นหาอนุพันธ์อัตโนมัติ)
+
+    คืนค่า: (roots, iterations, status) โดยที่
+    - roots: อาร์เรย์ค่ารากโดยประมาณของแต่ละค่าเริ่มต้น
+    - iterations: อาร์เรย์จำนวนรอบที่ใช้
+    - status: อาร์เรย์สถานะ CONVERGED, ZERO_DERIVATIVE หรือ MAX_ITER_REACHED
+
+    หมายเหตุ:
+    - func และ dfunc ต้องรับอาร์เรย์ได้
+    - ค่าเริ่มต้นที่เจอ f'(x) = 0 จะหยุดเฉพาะตัวเอง (ไม่โยน ZeroDivisionError ทั้งชุด)
+      และ roots ของค่านั้นคือค่า x สุดท้ายก่อนหยุด
+    - ค่าที่ลู่เข้าแล้วถูกตัดออก รอบถัดไปคำนวณเฉพาะค่าที่ยังไม่จบ
+    """
+    if func is None:
+        func = f
+        if dfunc is None:
+            dfunc = df
+
+    x = np.array(x0, dtype=float).ravel()
+    roots = x.copy()
+    iterations = np.zeros(x.size, dtype=int)
+    status = np.full(x.size, MAX_ITER_REACHED, dtype=int)
+
+    # ดัชนีของค่าเริ่มต้นที่ยังต้องคำนวณต่อ
+    active = np.arange(x.size)
+
     for i in range(1, max_iter + 1):
-        fx = f(x)
-        dfx = df(x)
-        
-        # ตรวจสอบว่าอนุพันธ์เป็นศูนย์หรือไม่
-        if dfx == 0:
-            raise ZeroDivisionError("วิธีนิวตัน-ราฟสันล้มเหลว: f'(x) = 0")
-        
-        # คำนวณค่าใหม่
+        if active.size == 0:
+            break
+
+        if dfunc is None:
+            fx, dfx = value_and_derivative(func, x)
+            fx, dfx = np.broadcast_to(fx, x.shape), np.broadcast_to(dfx, x.shape)
+        else:
+            fx = np.asarray(func(x), dtype=float)
+            dfx = np.asarray(dfunc(x), dtype=float)
+
+        # ค่าที่อนุพันธ์เป็นศูนย์หยุดเฉพาะตัว
+        zero = dfx == 0
+        status[active[zero]] = ZERO_DERIVATIVE
+
+        ok = ~zero
+        active, x, fx, dfx = active[ok], x[ok], fx[ok], dfx[ok]
+
         x_new = x - fx / dfx
-        err = abs(x_new - x)
-        
-        # แสดงผลลัพธ์แต่ละรอบ
-        print(f"{i:3d}\t{x:.10f}\t{x_new:.10f}\t{fx:.6e}\t{err:.6e}")
-        
-        # ตรวจสอบว่าเจอรากแล้วหรือไม่
-        if err < tol:
-            print("-" * 85)
-            return x_new
-        
-        x = x_new
-    
-    print("-" * 85)
-    return x
+        err = np.abs(x_new - x)
+        roots[active] = x_new
+        iterations[active] = i
+
+        done = err < tol
+        status[active[done]] = CONVERGED
+
+        keep = ~done
+        active, x = active[keep], x_new[keep]
+
+    return roots, iterations, status
 
 
 def main():
@@ -86,11 +202,21 @@ def main():
         print()
         
         # เรียกใช้วิธีการของนิวตัน-ราฟสัน
-        root = newton_raphson(x0, tol=tolerance)
+        root = newton_raphson(x0, tol=tolerance, func=CountedFunction(f), verbose=True)
         
         print(f"\nรากของสมการคือ x ≈ {root:.10f}")
         print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
         
+        # เทียบกับสูตร f'(x) ที่เขียนเอง: autodiff เรียก f ครั้งเดียวต่อรอบ ส่วนสูตรเรียก f และ f' อย่างละครั้ง
+        auto = newton_raphson(x0, tol=tolerance, func=f, report=True)
+        counted_df = CountedFunction(df)
+        manual = newton_raphson(x0, tol=tolerance, func=f, dfunc=counted_df, report=True)
+        print("\nเทียบวิธีหา f'(x):")
+        print(f"autodiff (ไม่ระบุ dfunc): x ≈ {auto.root:.10f}, {auto.iterations} รอบ, "
+              f"เรียก f {auto.evaluations} ครั้ง")
+        print(f"สูตร f'(x) ที่เขียนเอง:   x ≈ {manual.root:.10f}, {manual.iterations} รอบ, "
+              f"เรียก f {manual.evaluations} ครั้ง และ f' {counted_df.calls} ครั้ง")
+        
     except ValueError as e:
         print(f"เกิดข้อผิดพลาด: {e}")
     except ZeroDivisionError as e:
@@ -0,0 +1,500 @@
+"""
+วิธีของนิวตันสำหรับระบบสมการไม่เชิงเส้น F(x) = 0 (Newton's Method for Nonlinear Systems)
+พร้อมการใช้ตัวประกอบ LU ของเมทริกซ์จาโคเบียนซ้ำ (chord / Shamanskii) และการค้นหาตามแนว (line search)
+และแบบไม่สร้างเมทริกซ์จาโคเบียน (Jacobian-Free Newton-Krylov) สำหรับระบบขนาดใหญ่
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from autodiff import Dual, primal
+from cramers_rule import lu_factor, lu_solve
+from evaluation import last_step, print_trace
+from iterative_solvers import iter_gmres
+
+
+def F(x):
+    """
+    ระบบสมการตัวอย่าง (2 ตัวแปร)
+    x² + y² - 4 = 0
+    eˣ + y - 1 = 0
+    """
+    return [x[0]**2 + x[1]**2 - 4, np.exp(x[0]) + x[1] - 1]
+
+
+SystemStep = namedtuple("SystemStep", "i x residual err damping jacobians evaluations")
+
+KrylovStep = namedtuple("KrylovStep", "i x residual err damping eta krylov evaluations")
+
+StrategyReport = namedtuple("StrategyReport", "name iterations jacobians evaluations residual elapsed")
+
+
+def as_vector(y):
+    """
+    แปลงผลของ F(x) (อาร์เรย์ หรือ list ของแต่ละสมการ) เป็นเวกเตอร์ numpy
+    """
+    return np.asarray(y, dtype=float).reshape(-1)
+
+
+def jacobian_ad(func, x):
+    """
+    คำนวณ F(x) และเมทริกซ์จาโคเบียน J(x) ด้วยการหาอนุพันธ์อัตโนมัติ (เรียก func ครั้งเดียว)
+
+    พารามิเตอร์:
+    func: ฟังก์ชัน F(x) ที่เขียนด้วย + - * / ** @ และฟังก์ชันของ numpy
+          คืนค่าเป็นเวกเตอร์ (เช่น A @ x + np.exp(x)) หรือ list ของแต่ละสมการ
+    x: จุดที่ต้องการ (n ค่า)
+
+    คืนค่า: (Fx, J) โดย J[i, j] = ∂Fᵢ/∂xⱼ
+
+    หมายเหตุ:
+    - x ถูกแทนด้วย Dual(x, I) คือ n ทิศทางพร้อมกัน แต่ละการคำนวณจึงมีค่าใช้จ่ายประมาณ n เท่าของปกติ
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    y = func(Dual(x, np.eye(n)))
+    if isinstance(y, Dual):
+        return as_vector(y.val), np.asarray(y.der, dtype=float).reshape(n, -1).T
+    # list ของแต่ละสมการ สมการที่ไม่ขึ้นกับ x เป็นค่าคงที่ (แถวศูนย์)
+    rows = [np.asarray(c.der if isinstance(c, Dual) else np.zeros(n), dtype=float) for c in y]
+    return as_vector([primal(c) for c in y]), np.array(rows)
+
+
+def jacobian_fd(func, x, fx=None, vectorized=False):
+    """
+    ประมาณเมทริกซ์จาโคเบียนด้วยผลต่างไปข้างหน้า J[:, j] ≈ (F(x + hⱼeⱼ) - F(x)) / hⱼ
+
+    พารามิเตอร์:
+    func: ฟังก์ชัน F(x)
+    x: จุดที่ต้องการ (n ค่า)
+    fx: F(x) ถ้าคำนวณไว้แล้ว (default: คำนวณใหม่)
+    vectorized: func รับเมทริกซ์ (n x k) ที่แต่ละคอลัมน์คือหนึ่งจุด แล้วคืนค่า (n x k) ได้หรือไม่
+                ถ้าได้ จะคำนวณทั้ง n คอลัมน์ด้วยการเรียก func ครั้งเดียว (default: False)
+
+    คืนค่า: (J, calls) โดย calls คือจำนวนครั้งที่เรียก func
+
+    หมายเหตุ:
+    - hⱼ = √ε·max(1, |xⱼ|) ความแม่นยำประมาณครึ่งหนึ่งของทศนิยม (ใช้ jacobian_ad ถ้าต้องการแม่นกว่า)
+    """
+    x = np.asarray(x, dtype=float)
+    calls = 0
+    if fx is None:
+        fx = as_vector(func(x))
+        calls += 1
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+    if vectorized:
+        X = x[:, None] + np.diag(h)
+        J = (np.asarray(func(X), dtype=float).reshape(fx.size, x.size) - fx[:, None]) / h
+        return J, calls + 1
+    J = np.empty((fx.size, x.size))
+    for j in range(x.size):
+        xj = x.copy()
+        xj[j] += h[j]
+        J[:, j] = (as_vector(func(xj)) - fx) / h[j]
+    return J, calls + x.size
+
+
+def armijo_step(residual_of, x, dx, norm_f):
+    """
+    ค้นหาตามแนว x + t·Δx โดยลด t ครึ่งหนึ่งจนกว่า ||F|| จะลดลงพอ (เงื่อนไข Armijo ของ ½||F||²)
+
+    คืนค่า: (t, x_new, F(x_new), ||F(x_new)||, ok) โดย ok เป็น False ถ้าลด t ถึง 1e-4 แล้วยังไม่ผ่าน
+    """
+    t = 1.0
+    x_new = x + dx
+    f_new = residual_of(x_new)
+    norm_new = np.linalg.norm(f_new)
+    while not norm_new <= np.sqrt(1 - 2e-4 * t) * norm_f and t > 1e-4:
+        t /= 2
+        x_new = x + t * dx
+        f_new = residual_of(x_new)
+        norm_new = np.linalg.norm(f_new)
+    return t, x_new, f_new, norm_new, norm_new <= np.sqrt(1 - 2e-4 * t) * norm_f
+
+
+def iter_newton_system(x0, tol=1e-8, max_iter=50, func=None, jac="ad", refresh=1, line_search=True):
+    """
+    วิธีของนิวตันสำหรับระบบสมการแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน newton_system
+
+    คืนค่า: SystemStep(i, x, residual, err, damping, jacobians, evaluations) ของแต่ละรอบ
+    - residual: ||F(x)||₂ หลังจบรอบ, err: ||Δx||∞ ที่ก้าวจริง, damping: ขนาดก้าว t (1 = ก้าวเต็ม)
+    - jacobians: จำนวนครั้งที่สร้าง J สะสมจนถึงรอบนี้
+    - evaluations: จำนวนการคำนวณ F สะสม นับเป็นจำนวนจุด (เทียบค่าใช้จ่ายระหว่างวิธีได้)
+      J จาก "ad" นับ n + 1 (ค่าและ n ทิศทางพร้อมกัน), "fd" และ "fd_vectorized" นับ n
+    """
+    if func is None:
+        func = F
+    if jac not in ("ad", "fd", "fd_vectorized") and not callable(jac):
+        raise ValueError('jac ต้องเป็น "ad", "fd", "fd_vectorized" หรือฟังก์ชัน J(x)')
+    if refresh is not None and refresh < 1:
+        raise ValueError("refresh ต้องมีค่าอย่างน้อย 1 (หรือ None สำหรับ chord)")
+
+    x = np.array(x0, dtype=float).reshape(-1)
+    evaluations = 0
+    jacobians = 0
+
+    def residual_of(v):
+        nonlocal evaluations
+        evaluations += 1
+        fv = as_vector(func(v))
+        if fv.size != x.size:
+            raise ValueError("F(x) ต้องมีจำนวนสมการเท่ากับจำนวนตัวแปร")
+        return fv
+
+    def factor(v, fv):
+        # สร้าง J(v) แล้วแยกตัวประกอบ LU ครั้งเดียว ใช้แก้ได้หลายรอบ
+        nonlocal evaluations, jacobians
+        jacobians += 1
+        if jac == "ad":
+            # เรียก func ครั้งเดียว แต่ Dual(x, I) พา n ทิศทางไปด้วย ค่าใช้จ่ายเท่ากับประมาณ n + 1 จุด
+            evaluations += v.size + 1
+            fv, J = jacobian_ad(func, v)
+        elif jac in ("fd", "fd_vectorized"):
+            J, _ = jacobian_fd(func, v, fv, vectorized=jac == "fd_vectorized")
+            evaluations += v.size
+        else:
+            J = np.asarray(jac(v), dtype=float)
+        LU, piv, _ = lu_factor(J)
+        if np.any(np.diag(LU) == 0):
+            raise ValueError("วิธีของนิวตันล้มเหลว: เมทริกซ์จาโคเบียนเป็นเมทริกซ์เอกฐาน")
+        return fv, LU, piv
+
+    fx = residual_of(x)
+    norm_f = np.linalg.norm(fx)
+    if norm_f <= tol:
+        return
+
+    LU = piv = None
+    age = 0
+
+    for i in range(1, max_iter + 1):
+        fresh = LU is None or (refresh is not None and age >= refresh)
+
+        while True:
+            if fresh:
+                fx, LU, piv = factor(x, fx)
+                age = 0
+
+            dx = lu_solve(LU, piv, -fx)
+            if not np.all(np.isfinite(dx)):
+                raise ValueError("วิธีของนิวตันล้มเหลว: ก้าว Δx ไม่เป็นจำนวนจำกัด")
+
+            if not line_search:
+                t, x_new = 1.0, x + dx
+                f_new = residual_of(x_new)
+                norm_new = np.linalg.norm(f_new)
+                break
+            t, x_new, f_new, norm_new, ok = armijo_step(residual_of, x, dx, norm_f)
+            if ok:
+                break
+            if fresh:
+                raise ValueError("วิธีของนิวตันล้มเหลว: ค้นหาตามแนวไม่พบก้าวที่ลด ||F(x)|| ได้")
+            # J เก่าเกินไปจนก้าวไม่ช่วย: สร้าง J ใหม่แล้วลองรอบนี้อีกครั้ง
+            fresh = True
+
+        age += 1
+        err = np.max(np.abs(x_new - x))
+        x, fx, norm_f = x_new, f_new, norm_new
+
+        yield SystemStep(i, x, norm_f, err, t, jacobians, evaluations)
+
+        if norm_f <= tol or (t == 1.0 and err <= tol * max(1.0, np.max(np.abs(x)))):
+            return
+
+
+def newton_system(x0, tol=1e-8, max_iter=50, func=None, jac="ad", refresh=1, line_search=True, verbose=False):
+    """
+    วิธีของนิวตันสำหรับแก้ระบบสมการไม่เชิงเส้น F(x) = 0
+
+    พารามิเตอร์:
+    x0: ค่าเริ่มต้น (n ค่า)
+    tol: หยุดเมื่อ ||F(x)||₂ <= tol หรือก้าวเต็ม ||Δx||∞ <= tol·max(1, ||x||∞) (default: 1e-8)
+    max_iter: จำนวนรอบสูงสุด (default: 50)
+    func: ฟังก์ชัน F(x) ที่คืนค่า n สมการ (default: F)
+    jac: วิธีหาเมทริกซ์จาโคเบียน (default: "ad")
+         "ad" = หาอนุพันธ์อัตโนมัติ (func ต้องใช้ฟังก์ชันของ numpy), "fd" = ผลต่างสืบเนื่อง
+         "fd_vectorized" = ผลต่างสืบเนื่องที่เรียก func ครั้งเดียวกับเมทริกซ์ (n x n) ที่แต่ละคอลัมน์คือหนึ่งจุด
+         หรือฟังก์ชัน J(x) ที่คืนค่าเมทริกซ์ (n x n)
+    refresh: สร้าง J และแยกตัวประกอบ LU ใหม่ทุก refresh รอบ (default: 1)
+             1 = นิวตันปกติ, m > 1 = วิธีของ Shamanskii, None = วิธี chord (ใช้ J แรกตลอด)
+    line_search: ลดขนาดก้าวเมื่อก้าวเต็มไม่ทำให้ ||F(x)|| ลดลง (default: True)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+
+    คืนค่า: (x, iterations, residual) โดยที่ residual คือ ||F(x)||₂ ของคำตอบสุดท้าย
+
+    หมายเหตุ:
+    - แต่ละรอบแก้ J·Δx = -F(x) ด้วย lu_solve (O(n²)) แทนการหาเมทริกซ์ผกผัน
+      การสร้าง J และ lu_factor (O(n³)) เกิดเฉพาะรอบที่ต้องสร้าง J ใหม่
+    - J ที่ใช้ซ้ำทำให้ลู่เข้าช้าลง (chord เป็นเชิงเส้น, Shamanskii อันดับ m + 1 ต่อการสร้าง J หนึ่งครั้ง)
+      แต่แต่ละรอบถูกกว่ามาก ถ้าก้าวจาก J เก่าไม่ลด ||F(x)|| จะสร้าง J ใหม่ให้อัตโนมัติ
+    - ถ้าครบ max_iter แล้วยังไม่ลู่เข้า จะคืนค่ารอบสุดท้าย ตรวจได้จาก residual
+    """
+    steps = iter_newton_system(x0, tol, max_iter, func, jac, refresh, line_search)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีของนิวตันสำหรับระบบสมการ",
+            "รอบ\t  ||F(x)||\t  ||Δx||∞\t   t\tJ\tคำนวณ F",
+            lambda s: f"{s.i:4d}\t{s.residual:.6e}\t{s.err:.6e}\t{s.damping:6.4f}\t{s.jacobians}\t{s.evaluations}",
+            65)
+    else:
+        step = last_step(steps)
+    if step is not None:
+        return step.x, step.i, step.residual
+    x = np.array(x0, dtype=float).reshape(-1)
+    return x, 0, np.linalg.norm(as_vector((func or F)(x)))
+
+
+def forcing_term(eta, norm_f, norm_prev, tol, eta_max=0.9, gamma=0.9):
+    """
+    ค่า η ของรอบถัดไปตามแบบที่ 2 ของ Eisenstat-Walker: η = γ·(||F_k|| / ||F_{k-1}||)²
+
+    หมายเหตุ:
+    - ห่างจากคำตอบ (||F|| ลดช้า) ใช้ η ใหญ่ แก้ระบบเชิงเส้นแบบหยาบ ใกล้คำตอบ η เล็กลง ได้การลู่เข้าเร็วแบบนิวตัน
+    - ไม่ให้ η ลดเร็วเกินไป (γ·η_{k-1}² > 0.1) และไม่แก้ละเอียดเกินกว่าที่ tol ต้องการ (η >= tol / (2||F||))
+    """
+    eta_new = gamma * (norm_f / norm_prev) ** 2
+    if gamma * eta**2 > 0.1:
+        eta_new = max(eta_new, gamma * eta**2)
+    return min(eta_max, max(eta_new, 0.5 * tol / norm_f))
+
+
+def iter_newton_krylov(x0, tol=1e-8, max_iter=50, func=None, restart=30, max_krylov=200, jv="fd", eta_max=0.9):
+    """
+    วิธีนิวตัน-ครีลอฟแบบไม่สร้างเมทริกซ์จาโคเบียน แบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+
+    พารามิเตอร์: เหมือน newton_krylov
+
+    คืนค่า: KrylovStep(i, x, residual, err, damping, eta, krylov, evaluations) ของแต่ละรอบ
+    - eta: ค่า η ที่ใช้ในรอบนี้, krylov: จำนวนรอบของ GMRES (ผลคูณ Jv) ในรอบนี้
+    - evaluations: จำนวนครั้งที่เรียก F สะสมจนถึงรอบนี้
+    """
+    if func is None:
+        func = F
+    if jv not in ("fd", "ad"):
+        raise ValueError('jv ต้องเป็น "fd" หรือ "ad"')
+
+    x = np.array(x0, dtype=float).reshape(-1)
+    evaluations = 0
+
+    def residual_of(v):
+        nonlocal evaluations
+        evaluations += 1
+        fv = as_vector(func(v))
+        if fv.size != x.size:
+            raise ValueError("F(x) ต้องมีจำนวนสมการเท่ากับจำนวนตัวแปร")
+        return fv
+
+    fx = residual_of(x)
+    norm_f = np.linalg.norm(fx)
+    if norm_f <= tol:
+        return
+
+    eta = eta_max
+    sqrt_eps = np.sqrt(np.finfo(float).eps)
+
+    for i in range(1, max_iter + 1):
+        # J(x)·v โดยไม่สร้าง J: ผลต่างตามทิศทาง v หรือจำนวนคู่ Dual(x, v) (เรียก F หนึ่งครั้งต่อผลคูณ)
+        def jacobian_vector(v, x=x, fx=fx):
+            nonlocal evaluations
+            norm_v = np.linalg.norm(v)
+            if norm_v == 0:
+                return np.zeros_like(v)
+            if jv == "ad":
+                evaluations += 1
+                y = func(Dual(x, v))
+                if isinstance(y, Dual):
+                    return as_vector(y.der)
+                return as_vector([c.der if isinstance(c, Dual) else 0.0 for c in y])
+            h = sqrt_eps * max(1.0, np.linalg.norm(x)) / norm_v
+            return (residual_of(x + h * v) - fx) / h
+
+        # แก้ J·Δx = -F แบบไม่ละเอียด: พอเมื่อ ||F + J·Δx|| <= η·||F|| (เงื่อนไขของ GMRES ตรงกันพอดี)
+        step = last_step(iter_gmres(jacobian_vector, -fx, tol=eta, max_iter=max_krylov, restart=restart))
+        if step is None:
+            raise ValueError("วิธีนิวตัน-ครีลอฟล้มเหลว: GMRES ไม่ได้ทำรอบใดเลย")
+        dx, krylov = step.x, step.i
+
+        t, x_new, f_new, norm_new, ok = armijo_step(residual_of, x, dx, norm_f)
+        if not ok:
+            raise ValueError("วิธีนิวตัน-ครีลอฟล้มเหลว: ค้นหาตามแนวไม่พบก้าวที่ลด ||F(x)|| ได้ (ลองเพิ่ม max_krylov)")
+
+        err = np.max(np.abs(x_new - x))
+        yield KrylovStep(i, x_new, norm_new, err, t, eta, krylov, evaluations)
+
+        if norm_new <= tol or (t == 1.0 and err <= tol * max(1.0, np.max(np.abs(x_new)))):
+            return
+
+        eta = forcing_term(eta, norm_new, norm_f, tol, eta_max)
+        x, fx, norm_f = x_new, f_new, norm_new
+
+
+def newton_krylov(x0, tol=1e-8, max_iter=50, func=None, restart=30, max_krylov=200, jv="fd", eta_max=0.9,
+                  verbose=False):
+    """
+    วิธีนิวตัน-ครีลอฟแบบไม่สร้างเมทริกซ์จาโคเบียน (JFNK) สำหรับระบบสมการไม่เชิงเส้นขนาดใหญ่ F(x) = 0
+
+    พารามิเตอร์:
+    x0: ค่าเริ่มต้น (n ค่า)
+    tol: หยุดเมื่อ ||F(x)||₂ <= tol หรือก้าวเต็ม ||Δx||∞ <= tol·max(1, ||x||∞) (default: 1e-8)
+    max_iter: จำนวนรอบนิวตันสูงสุด (default: 50)
+    func: ฟังก์ชัน F(x) ที่คืนค่า n สมการ (default: F)
+    restart: จำนวนรอบของ GMRES ก่อนเริ่มใหม่ (default: 30)
+    max_krylov: จำนวนผลคูณ Jv สูงสุดต่อรอบนิวตัน (default: 200)
+    jv: วิธีคำนวณ J·v (default: "fd")
+        "fd" = (F(x + hv) - F(x)) / h, "ad" = จำนวนคู่ Dual(x, v) (แม่นยำกว่า แต่ func ต้องใช้ฟังก์ชันของ numpy)
+    eta_max: ค่า η สูงสุด (ความหยาบที่ยอมให้ในการแก้ระบบเชิงเส้น) (default: 0.9)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+
+    คืนค่า: (x, iterations, residual) โดยที่ residual คือ ||F(x)||₂ ของคำตอบสุดท้าย
+
+    หมายเหตุ:
+    - ไม่สร้าง J (n x n) เลย ใช้หน่วยความจำ O(n·restart) สำหรับฐานของ GMRES จึงใช้กับ n หลักแสนได้
+    - แต่ละรอบนิวตันเรียก F ประมาณ (จำนวนผลคูณ Jv ของ GMRES + จำนวนครั้งที่ค้นหาตามแนว) ครั้ง
+      max_krylov จำกัดจำนวนผลคูณ Jv ทั้งหมด รวมผลคูณที่ใช้ตรวจเศษเหลือจริงท้ายแต่ละช่วง restart
+    - η ของแต่ละรอบเลือกตาม Eisenstat-Walker (forcing_term) ห่างจากคำตอบแก้หยาบ ใกล้คำตอบแก้ละเอียดขึ้น
+    - ไม่มี preconditioner: ระบบที่ J มี condition number สูงมากอาจใช้ GMRES หลายรอบ
+    """
+    steps = iter_newton_krylov(x0, tol, max_iter, func, restart, max_krylov, jv, eta_max)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีนิวตัน-ครีลอฟ (ไม่สร้างเมทริกซ์จาโคเบียน)",
+            "รอบ\t  ||F(x)||\t  ||Δx||∞\t   t\t   η\tGMRES\tคำนวณ F",
+            lambda s: (f"{s.i:4d}\t{s.residual:.6e}\t{s.err:.6e}\t{s.damping:6.4f}\t{s.eta:.2e}"
+                       f"\t{s.krylov:5d}\t{s.evaluations}"),
+            80)
+    else:
+        step = last_step(steps)
+    if step is not None:
+        return step.x, step.i, step.residual
+    x = np.array(x0, dtype=float).reshape(-1)
+    return x, 0, np.linalg.norm(as_vector((func or F)(x)))
+
+
+def compare_strategies(x0, func, strategies, tol=1e-8, max_iter=100):
+    """
+    เปรียบเทียบการใช้เมทริกซ์จาโคเบียนซ้ำแบบต่าง ๆ กับระบบเดียวกัน
+
+    พารามิเตอร์:
+    x0: ค่าเริ่มต้น
+    func: ฟังก์ชัน F(x)
+    strategies: dict ของ ชื่อ -> dict ของพารามิเตอร์ newton_system เช่น {"chord": {"refresh": None}}
+    tol, max_iter: เหมือน newton_system
+
+    คืนค่า: list ของ StrategyReport(name, iterations, jacobians, evaluations, residual, elapsed)
+    """
+    reports = []
+    for name, options in strategies.items():
+        step = None
+        start = time.perf_counter()
+        for step in iter_newton_system(x0, tol, max_iter, func, **options):
+            pass
+        elapsed = time.perf_counter() - start
+        if step is None:
+            reports.append(StrategyReport(name, 0, 0, 1, np.linalg.norm(as_vector(func(x0))), elapsed))
+        else:
+            reports.append(StrategyReport(name, step.i, step.jacobians, step.evaluations, step.residual, elapsed))
+    return reports
+
+
+def print_strategy_reports(reports):
+    """
+    แสดงตารางผลของ compare_strategies
+    """
+    print("วิธี\t\t\tรอบ\tสร้าง J\tคำนวณ F\t  ||F(x)||\tเวลา (ms)")
+    print("-" * 75)
+    for r in reports:
+        print(f"{r.name:20s}\t{r.iterations:3d}\t{r.jacobians:5d}\t{r.evaluations:5d}\t"
+              f"{r.residual:.2e}\t{r.elapsed * 1e3:9.1f}")
+    print("(คำนวณ F นับเป็นจำนวนจุด: J จาก AD นับ n + 1, จากผลต่างนับ n แม้ fd_vectorized จะเรียก F ครั้งเดียว)")
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบวิธีของนิวตันสำหรับระบบสมการ
+    """
+    try:
+        x0 = [1.0, -1.5]
+        tolerance = 1e-10
+
+        print("ระบบสมการ x² + y² = 4, eˣ + y = 1")
+        print(f"ค่าเริ่มต้น x0 = {x0}")
+        print()
+
+        x, iterations, residual = newton_system(x0, tol=tolerance, verbose=True)
+        print(f"\nคำตอบ x ≈ {x} ({iterations} รอบ, ||F(x)|| = {residual:.2e})")
+
+        # ตรวจ jacobian_ad กับ jacobian_fd เมื่อนิพจน์ผสมค่าเดียว (x[0], np.sum) กับเวกเตอร์ x
+        mixed = {
+            "x + x[1]": lambda v: v + v[1],
+            "x[0]·x": lambda v: v[0] * v,
+            "x / x[0]": lambda v: v / v[0],
+            "sum(x²)·x": lambda v: np.sum(v**2) * v,
+            "x[2]^x": lambda v: v[2] ** v,
+        }
+        point = np.array([0.7, 1.3, 2.1])
+        print("\nตรวจเมทริกซ์จาโคเบียน: max|J_ad - J_fd|")
+        for name, g in mixed.items():
+            _, J_ad = jacobian_ad(g, point)
+            J_fd, _ = jacobian_fd(g, point)
+            print(f"{name:12s} {np.max(np.abs(J_ad - J_fd)):.2e}")
+
+        # ปัญหาของ Bratu: u'' + λeᵘ = 0 บน (0, 1), u(0) = u(1) = 0 แบ่ง n จุดภายใน
+        n = 200
+        lam = 3.0
+        h = 1.0 / (n + 1)
+        A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+        def bratu(u):
+            return A @ u - h**2 * lam * np.exp(u)
+
+        print(f"\nปัญหาของ Bratu (λ = {lam}) n = {n} ตัวแปร เริ่มจาก u = 0:")
+        u0 = np.zeros(n)
+        print_strategy_reports(compare_strategies(u0, bratu, {
+            "นิวตัน (AD)": {"jac": "ad"},
+            "นิวตัน (ผลต่าง)": {"jac": "fd"},
+            "นิวตัน (ผลต่าง vec.)": {"jac": "fd_vectorized"},
+            "Shamanskii m=3": {"jac": "ad", "refresh": 3},
+            "chord": {"jac": "ad", "refresh": None},
+        }, tol=tolerance))
+
+        # ระบบใหญ่: ปฏิกิริยา-การแพร่ 2 มิติ ย้อนหลังหนึ่งก้าวเวลา (implicit Euler) บนกริด m x m
+        # u - u_old + k·(-Δ)u - dt·u(1 - u) = 0 โดย (-Δ)u คำนวณจาก stencil 5 จุด ไม่สร้างเมทริกซ์
+        m = 400
+        dt = 0.5
+        k = 1.0
+
+        def neg_laplacian(v):
+            u = v.reshape(m, m)
+            Au = 4 * u
+            Au[1:, :] -= u[:-1, :]
+            Au[:-1, :] -= u[1:, :]
+            Au[:, 1:] -= u[:, :-1]
+            Au[:, :-1] -= u[:, 1:]
+            return Au.ravel()
+
+        t = np.linspace(0, 1, m)
+        X, Y = np.meshgrid(t, t)
+        u_old = np.exp(-50 * ((X - 0.5)**2 + (Y - 0.5)**2)).ravel()
+
+        def implicit_step(u):
+            return u - u_old + k * neg_laplacian(u) - dt * u * (1 - u)
+
+        print(f"\nปฏิกิริยา-การแพร่ n = {m * m:,} ตัวแปร (เมทริกซ์จาโคเบียนเต็มต้องใช้ {(m * m)**2 * 8 / 1e9:,.0f} GB):")
+        start = time.perf_counter()
+        u, iterations, residual = newton_krylov(u_old, tol=tolerance, func=implicit_step, verbose=True)
+        print(f"ลู่เข้าใน {iterations} รอบ, {time.perf_counter() - start:.3f} s, ||F(u)|| = {residual:.2e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except ZeroDivisionError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+การหารากของสมการที่มีพารามิเตอร์ (Parameter Sweep)
+แก้สมการ f(x; p) = 0 สำหรับค่า p จำนวนมาก โดยแบ่งงานไปหลาย process
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from bisection import bisection
+from false_position import false_position
+from newton_raphson import newton_raphson
+from secant import secant
+
+METHODS = ("bisection", "false_position", "newton_raphson", "secant")
+
+
+def f(x, p):
+    """
+    ฟังก์ชันที่ต้องการหาราก
+    ตัวอย่าง: f(x; p) = x³ - p (รากคือ p^(1/3))
+    """
+    return x**3 - p
+
+
+def df(x, p):
+    """
+    อนุพันธ์ของ f(x; p) เทียบกับ x
+    ตัวอย่าง: f'(x; p) = 3x²
+    """
+    return 3*x**2
+
+
+def create_shared(array):
+    """
+    คัดลอกอาร์เรย์ไปไว้ใน shared memory แล้วคืนค่า (shm, view)
+    """
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, view
+
+
+def solve_one(method, func, dfunc, p, s1, s2, tol, max_iter, mode):
+    """
+    แก้สมการสำหรับพารามิเตอร์ p หนึ่งค่า
+    s1, s2 คือ (a, b) สำหรับวิธีแบบ Bracketing, (x0, x1) สำหรับวิธีคอร์ด และ x0 สำหรับนิวตัน
+    """
+    g = lambda x: func(x, p)
+    if method == "bisection":
+        return bisection(s1, s2, tol=tol, max_iter=max_iter, func=g)
+    if method == "false_position":
+        return false_position(s1, s2, tol=tol, max_iter=max_iter, func=g, mode=mode)
+    if method == "secant":
+        return secant(s1, s2, tol=tol, max_iter=max_iter, func=g)
+    dg = (lambda x: dfunc(x, p)) if dfunc is not None else None
+    return newton_raphson(s1, tol=tol, max_iter=max_iter, func=g, dfunc=dg)
+
+
+def solve_chunk(task):
+    """
+    งานของ worker: แก้สมการช่วง [start, stop) ของพารามิเตอร์ แล้วเขียนผลลงใน shared memory
+    """
+    method, func, dfunc, tol, max_iter, mode, in_name, out_name, n, start, stop = task
+    shm_in = SharedMemory(name=in_name)
+    shm_out = SharedMemory(name=out_name)
+    try:
+        inputs = np.ndarray((3, n), dtype=float, buffer=shm_in.buf)
+        roots = np.ndarray((n,), dtype=float, buffer=shm_out.buf)
+        for k in range(start, stop):
+            p, s1, s2 = inputs[:, k]
+            try:
+                roots[k] = solve_one(method, func, dfunc, p, s1, s2, tol, max_iter, mode)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                # พารามิเตอร์ที่หารากไม่ได้ ได้ nan โดยไม่กระทบค่าอื่น
+                roots[k] = np.nan
+        del inputs, roots
+    finally:
+        shm_in.close()
+        shm_out.close()
+    return stop - start
+
+
+def sweep(func, params, method="bisection", a=None, b=None, x0=None, x1=None, dfunc=None,
+          tol=1e-6, max_iter=100, mode="plain", workers=None, chunk_size=None):
+    """
+    หารากของ f(x; p) = 0 สำหรับทุกค่า p ใน params
+
+    พารามิเตอร์:
+    func: ฟังก์ชัน func(x, p)
+    params: อาร์เรย์ของพารามิเตอร์ p
+    method: "bisection", "false_position", "newton_raphson" หรือ "secant" (default: "bisection")
+    a, b: ช่วงเริ่มต้น สำหรับ bisection และ false_position (ค่าเดียวหรืออาร์เรย์ตาม params)
+    x0, x1: ค่าเริ่มต้น สำหรับ newton_raphson (x0) และ secant (x0, x1)
+    dfunc: อนุพันธ์ dfunc(x, p) สำหรับ newton_raphson (default: None = หาอนุพันธ์อัตโนมัติ)
+    tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
+    max_iter: จำนวนรอบสูงสุด (default: 100)
+    mode: รูปแบบของวิธีจุดเท็จ ใช้กับ false_position เท่านั้น (default: "plain")
+    workers: จำนวน process (default: None = จำนวน CPU)
+    chunk_size: จำนวนพารามิเตอร์ต่องานหนึ่งชิ้น (default: แบ่งให้ได้ประมาณ 4 ชิ้นต่อ process)
+
+    คืนค่า: อาร์เรย์รากของแต่ละ p (nan ถ้าหารากไม่ได้)
+
+    หมายเหตุ:
+    - func และ dfunc ต้องประกาศไว้ระดับโมดูล (pickle ได้) ไม่ใช่ lambda
+    - ข้อมูลนำเข้าและผลลัพธ์อยู่ใน shared memory ไม่ต้อง pickle อาร์เรย์ไปมาระหว่าง process
+    """
+    if method not in METHODS:
+        raise ValueError(f"ไม่รู้จักวิธี '{method}' (เลือกได้: {', '.join(METHODS)})")
+
+    params = np.asarray(params, dtype=float).ravel()
+    n = params.size
+
+    if method in ("bisection", "false_position"):
+        starts = (a, b)
+    elif method == "secant":
+        starts = (x0, x1)
+    else:
+        starts = (x0, 0.0)
+    if any(s is None for s in starts):
+        raise ValueError(f"วิธี {method} ต้องระบุค่าเริ่มต้นให้ครบ")
+
+    inputs = np.empty((3, n), dtype=float)
+    inputs[0] = params
+    inputs[1] = np.broadcast_to(np.asarray(starts[0], dtype=float), n)
+    inputs[2] = np.broadcast_to(np.asarray(starts[1], dtype=float), n)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(n / (4 * workers)))
+
+    shm_in, _ = create_shared(inputs)
+    shm_out, roots = create_shared(np.full(n, np.nan))
+    try:
+        tasks = [(method, func, dfunc, tol, max_iter, mode, shm_in.name, shm_out.name, n,
+                  start, min(start + chunk_size, n))
+                 for start in range(0, n, chunk_size)]
+        if workers <= 1:
+            for task in tasks:
+                solve_chunk(task)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(solve_chunk, tasks):
+                    pass
+        result = roots.copy()
+    finally:
+        del roots
+        shm_in.close()
+        shm_in.unlink()
+        shm_out.close()
+        shm_out.unlink()
+    return result
+
+
+def main():
+    """
+    ฟังก์ชันหลักสำหรับทดสอบการหารากหลายพารามิเตอร์
+    """
+    try:
+        params = np.linspace(1.0, 1000.0, 100000)
+        tolerance = 1e-6
+
+        print(f"หารากของสมการ f(x; p) = x³ - p สำหรับ p {params.size} ค่า ในช่วง [{params[0]}, {params[-1]}]")
+        print(f"ค่าความคลาดเคลื่อนที่ยอมรับ: {tolerance}")
+        print()
+
+        for method in METHODS:
+            roots = sweep(f, params, method=method, a=0.0, b=11.0, x0=10.0, x1=11.0,
+                          dfunc=df, tol=tolerance, mode="illinois")
+            err = np.nanmax(np.abs(roots - np.cbrt(params)))
+            print(f"{method:15s} หาได้ {np.count_nonzero(~np.isnan(roots))} ค่า, "
+                  f"ความคลาดเคลื่อนสูงสุด = {err:.2e}")
+
+    except ValueError as e:
+        print(f"เกิดข้อผิดพลาด: {e}")
+    except Exception as e:
+        print(f"เกิดข้อผิดพลาดที่ไม่คาดคิด: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@
 """
 
 import math
+import time
+from collections import namedtuple
+
+from evaluation import CountedFunction, counting, last_step, print_trace, solve_report
 
 
 def f(x):
@@ -14,7 +18,50 @@ def f(x):
     return math.cos(x) - x
 
 
-def secant(x0, x1, tol=1e-6, max_iter=100):
+SecantStep = namedtuple("SecantStep", "i x0 x1 x2 f1 err")
+
+
+def iter_secant(x0, x1, tol=1e-6, max_iter=100, func=None):
+    """
+    วิธีการคอร์ดแบบ generator: คืนข้อมูลทีละรอบ โดยไม่แสดงผลใด ๆ
+    
+    พารามิเตอร์: เหมือน secant
+    
+    คืนค่า: SecantStep(i, x0, x1, x2, f1, err) ของแต่ละรอบ รอบสุดท้ายคือคำตอบ
+    """
+    if func is None:
+        func = f
+
+    def steps(x0, x1):
+        # f(x0) ของรอบถัดไปคือ f(x1) ของรอบนี้ จึงเรียกจริงเพียงรอบละครั้ง
+        f0 = func(x0)
+        
+        # วนรอบเพื่อหาราก
+        for i in range(1, max_iter + 1):
+            f1 = func(x1)
+            
+            # ตรวจสอบว่าตัวหารเป็นศูนย์หรือไม่
+            if (f1 - f0) == 0:
+                raise ZeroDivisionError("วิธีคอร์ดล้มเหลว: f(x1) - f(x0) = 0")
+            
+            # คำนวณค่าใหม่โดยใช้สูตรคอร์ด
+            x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+            err = abs(x2 - x1)
+            
+            yield SecantStep(i, x0, x1, x2, f1, err)
+            
+            # ตรวจสอบว่าเจอรากแล้วหรือไม่
+            if err < tol:
+                return
+            
+            # อัพเดทค่าสำหรับรอบถัดไป
+            x0, x1 = x1, x2
+            f0 = f1
+
+    return steps(x0, x1)
+
+
+def secant(x0, x1, tol=1e-6, max_iter=100, func=None, verbose=False, report=False):
     """
     วิธีการคอร์ดสำหรับหารากของสมการ
     
@@ -22,44 +69,35 @@ def secant(x0, x1, tol=1e-6, max_iter=100):
     x0, x1: ค่าเริ่มต้นสองจุดแรก
     tol: ค่าความคลาดเคลื่อนที่ยอมรับได้ (default: 1e-6)
     max_iter: จำนวนรอบสูงสุด (default: 100)
+    func: ฟังก์ชันที่ใช้แทน f(x) เช่น CountedFunction(f) (default: f)
+    verbose: แสดงตารางผลลัพธ์แต่ละรอบหรือไม่ (default: False)
+    report: คืนค่าเป็น SolveReport แทนค่ารากอย่างเดียวหรือไม่ (default: False)
     
     คืนค่า: ค่ารากโดยประมาณ
+    ถ้า report=True คืน SolveReport(root, iterations, evaluations, per_iteration, elapsed)
+    (evaluations คือจำนวนครั้งที่เรียก f(x) ในการหารากครั้งนี้, per_iteration คือจำนวนต่อรอบ)
     
     หมายเหตุ:
     - ไม่ต้องการการครอบราก (bracketing) เหมือนวิธีการแบ่งครึ่ง
     - ใช้จุดสองจุดก่อนหน้าเพื่อประมาณอนุพันธ์ (ไม่ต้องการ f'(x))
     - มักจะเร็วกว่าวิธีการแบ่งครึ่งแต่ช้ากว่าวิธีนิวตัน-ราฟสัน
     """
-    print("วิธีการคอร์ด (Secant Method)")
-    print("รอบ\t      x0\t\t      x1\t\t      x2\t\t    ความคลาดเคลื่อน")
-    print("-" * 85)
-    
-    # วนรอบเพื่อหาราก
-    for i in range(1, max_iter + 1):
-        f0 = f(x0)
-        f1 = f(x1)
-        
-        # ตรวจสอบว่าตัวหารเป็นศูนย์หรือไม่
-        if (f1 - f0) == 0:
-            raise ZeroDivisionError("วิธีคอร์ดล้มเหลว: f(x1) - f(x0) = 0")
-        
-        # คำนวณค่าใหม่โดยใช้สูตรคอร์ด
-        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
-        err = abs(x2 - x1)
-        
-        # แสดงผลลัพธ์แต่ละรอบ
-        print(f"{i:3d}\t{x0:.10f}\t{x1:.10f}\t{x2:.10f}\t{err:.6e}")
-        
-        # ตรวจสอบว่าเจอรากแล้วหรือไม่
-        if err < tol:
-            print("-" * 85)
-            return x2
-        
-        # อัพเดทค่าสำหรับรอบถัดไป
-        x0, x1 = x1, x2
-    
-    print("-" * 85)
-    return x1
+    if func is None:
+        func = f
+    counted, calls_before = counting(func, report)
+    start = time.perf_counter()
+    steps = iter_secant(x0, x1, tol, max_iter, counted)
+    if verbose:
+        step = print_trace(
+            steps, "วิธีการคอร์ด (Secant Method)",
+            "รอบ\t      x0\t\t      x1\t\t      x2\t\t    ความคลาดเคลื่อน",
+            lambda s: f"{s.i:3d}\t{s.x0:.10f}\t{s.x1:.10f}\t{s.x2:.10f}\t{s.err:.6e}", 85, counted)
+    else:
+        step = last_step(steps)
+    root = step.x2 if step is not None else x1
+    if report:
+        return solve_report(root, step.i if step is not None else 0, counted, calls_before, start)
+    return root
 
 
 def main():
@@ -78,7 +116,7 @@ def main():
         print()
         
         # เรียกใช้วิธีการคอร์ด
-        root = secant(x0, x1, tol=tolerance)
+        root = secant(x0, x1, tol=tolerance, func=CountedFunction(f), verbose=True)
         
         print(f"\nรากของสมการคือ x ≈ {root:.10f}")
         print(f"ตรวจสอบ: f({root:.10f}) = {f(root):.6e}")
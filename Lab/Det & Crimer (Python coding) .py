@@ -37,21 +37,20 @@ print(f"|AB| = {np.linalg.det(AB)}")
 """# 2"""
 
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 def cr(A, B):
-    det_a = np.linalg.det(A)
+    # แยกตัวประกอบ PA = LU ครั้งเดียว ได้ทั้ง det(A) และคำตอบ
+    lu, piv = lu_factor(A)
+    # det(A) = (±1 ตามจำนวนการสลับแถว) × ผลคูณเส้นทแยงของ U
+    swaps = np.count_nonzero(piv != np.arange(len(piv)))
+    det_a = (-1) ** swaps * np.prod(np.diag(lu))
     if det_a == 0:
         raise ValueError("A is singular")
-    num_variable = A.shape[1]
-    solutions = np.zeros(num_variable)
-    for i in range(num_variable):
-        X_i = A.copy()
-        X_i[:, i] = B
-        det_X_i = np.linalg.det(X_i)
-        solutions[i] = det_X_i / det_a
+    # det(X_i) / det(A) คือคำตอบตัวที่ i ของ AX = B จึงแทนค่าด้วย LU เดิมได้เลย
+    solutions = lu_solve((lu, piv), B)
     return solutions
 
-
 A = np.array([[0.3, 0.52, 1], [0.5, 1, 1], [0.1, 0.3, 0.5]])
 B = np.array([-0.01, 0.67, -0.44])
 
@@ -9,23 +9,27 @@ Original file is located at
 
 def Bisection(a , b ,f , esp):
   i , checkEror , aOld  , bOld , mOld , epsErr = 0 ,1 , 0 ,0 ,0 , esp
+  # จำ f(a), f(b) จากรอบก่อน แต่ละรอบจึงเรียก f เพียงครั้งเดียว (ที่ m)
+  fa , fb = f(a) , f(b)
+  aOld , faOld , bOld , fbOld = a , fa , b , fb
   while checkEror > epsErr:
     mNew = (a+b)/2
+    fm = f(mNew)
     checkEror = abs(mNew - mOld)
-    if f(mNew)*f(a) < 0:
-      aOld = a
-      bOld = b
-      b = mNew
+    if fm*fa < 0:
+      aOld , faOld = a , fa
+      bOld , fbOld = b , fb
+      b , fb = mNew , fm
       StrCondition = "f(m)*f(a) < 0"
-    elif f(mNew)*f(a) > 0:
-      bOld = b
-      aOld = a
-      a = mNew
+    elif fm*fa > 0:
+      bOld , fbOld = b , fb
+      aOld , faOld = a , fa
+      a , fa = mNew , fm
       StrCondition = "f(m)*f(a) > 0"
     i += 1
     print("i = ", i)
-    print("a =" , aOld , "f(a) = ", f(aOld) , '"b = ', bOld , "f(b)", f(bOld))
-    print("m = ", mNew , "f(m)" , f(mNew))
+    print("a =" , aOld , "f(a) = ", faOld , '"b = ', bOld , "f(b)", fbOld)
+    print("m = ", mNew , "f(m)" , fm)
     print(StrCondition, " new interval is (", a,",", b, ") old interval is (", aOld ,",", bOld, ")")
     print("Eror = ", checkEror)
     print("-"*50)
@@ -9,25 +9,26 @@ Original file is located at
 
 def fps(a, b, f, esp):
   i, aOld, bOld, xOld, xNew, checkError = 0, 0, 0, 0, 0, 1000
+  # จำ f(a), f(b) จากรอบก่อน แต่ละรอบจึงเรียก f เพียงครั้งเดียว (ที่ x)
+  fa, fb = f(a), f(b)
   while checkError > esp:
-    xNew = ((a*f(b))-(b*f(a)))/(f(b)-f(a))
+    xNew = ((a*fb)-(b*fa))/(fb-fa)
+    fx = f(xNew)
     checkError = abs(xNew - xOld)/abs(xNew) * 100
 
-    if f(a)*f(xNew) < 0:
-      aOld = a
-      bOld = b
-      b = xNew
+    aOld, faOld = a, fa
+    bOld, fbOld = b, fb
+    if fa*fx < 0:
+      b, fb = xNew, fx
       xOld = b
     else:
-      aOld = a
-      bOld = b
-      a = xNew
+      a, fa = xNew, fx
       xOld = a
     i += 1
     print(f"i ={i}")
-    print(f"a ={aOld}, f(a) ={f(aOld)}")
-    print(f"b ={bOld}, f(b) ={f(bOld)}")
-    print(f"x ={xNew}, f(x) ={f(xNew)}, error ={checkError}")
+    print(f"a ={aOld}, f(a) ={faOld}")
+    print(f"b ={bOld}, f(b) ={fbOld}")
+    print(f"x ={xNew}, f(x) ={fx}, error ={checkError}")
     print("-"*50)
     if i == 10000:
       print("Cannot find root of equation!!!")